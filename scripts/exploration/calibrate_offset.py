@@ -16,49 +16,26 @@ import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from poverty_point.core_simulation import run_single_simulation
-from poverty_point.parameters import (
-    default_parameters, critical_threshold, W_aggregator, W_independent,
-    cooperation_benefit
-)
+from poverty_point.emergent_threshold import EmergentThresholdSolver
+from poverty_point.parameters import default_parameters, critical_threshold_array
 
 
-def measure_emergent_n_at_sigma(sigma: float, epsilon: float,
-                                n_runs: int = 10, duration: int = 400) -> dict:
-    """Measure what n actually emerges at a given sigma."""
-    all_n = []
-
-    for seed in range(n_runs):
-        results = run_single_simulation(
-            sigma=sigma, epsilon=epsilon, seed=seed,
-            duration=duration, verbose=False
-        )
-
-        # Post-burn-in aggregation sizes
-        for state in results.yearly_states[100:]:
-            all_n.append(state.aggregation_size)
-
-    return {
-        'sigma': sigma,
-        'mean_n': np.mean(all_n),
-        'std_n': np.std(all_n)
-    }
-
-
-def fit_emergent_n_model(epsilon: float = 0.35) -> dict:
+def fit_emergent_n_model(epsilon: float = 0.35,
+                         solver: EmergentThresholdSolver = None) -> dict:
     """
     Fit a model for how n depends on sigma.
 
-    n(σ) ≈ n_base + k * σ
+    n(σ) ≈ n_base + k * σ, fitted over σ in [0.3, 0.8] to the solver's
+    emergent n (measured once per lattice row and cached on the solver)
     """
-    sigma_values = [0.30, 0.40, 0.50, 0.60, 0.70, 0.80]
-    n_values = []
+    solver = solver or EmergentThresholdSolver()
 
-    print(f"Measuring emergent n at ε={epsilon}...")
-    for sigma in sigma_values:
-        result = measure_emergent_n_at_sigma(sigma, epsilon, n_runs=5, duration=300)
-        n_values.append(result['mean_n'])
-        print(f"  σ={sigma:.2f}: n={result['mean_n']:.1f}")
+    print(f"Measuring emergent n at ε={epsilon} ({solver.estimator})...")
+    in_range = (solver.sigma_grid >= 0.3 - 1e-9) & (solver.sigma_grid <= 0.8 + 1e-9)
+    sigma_values = solver.sigma_grid[in_range]
+    n_values = solver.emergent_n([epsilon])[0][in_range]
+    for sigma, n in zip(sigma_values, n_values):
+        print(f"  σ={sigma:.2f}: n={n:.1f}")
 
     # Linear fit
     coeffs = np.polyfit(sigma_values, n_values, 1)
@@ -73,40 +50,22 @@ def fit_emergent_n_model(epsilon: float = 0.35) -> dict:
     }
 
 
-def critical_threshold_with_emergent_n(epsilon: float, sigma_guess: float,
-                                       params, n_model) -> float:
+def create_calibration_figure(output_dir: str = "figures/diagnostics",
+                              estimator: str = "mean_field"):
     """
-    Calculate σ* accounting for emergent n.
-
-    This requires iterative solution since:
-    - σ* depends on n
-    - n depends on σ
+    Create figure showing calibrated vs uncalibrated predictions.
 
-    We find σ where W_agg(σ, n(σ)) = W_ind(σ)
+    Args:
+        output_dir: Directory for the figure files
+        estimator: Emergent-n estimator of EmergentThresholdSolver
+            ("mean_field" or "batched")
     """
-    # Iterative solution
-    sigma = sigma_guess
-
-    for _ in range(20):  # Iterate to convergence
-        n_at_sigma = max(5, n_model(sigma))  # Ensure n >= 5
-
-        # Calculate threshold for this n
-        new_sigma = critical_threshold(epsilon, n_at_sigma, params)
-
-        if abs(new_sigma - sigma) < 0.001:
-            break
-
-        sigma = 0.5 * sigma + 0.5 * new_sigma  # Damped update
-
-    return sigma
-
-
-def create_calibration_figure(output_dir: str = "figures/diagnostics"):
-    """Create figure showing calibrated vs uncalibrated predictions."""
     os.makedirs(output_dir, exist_ok=True)
 
+    solver = EmergentThresholdSolver(estimator=estimator)
+
     # Fit emergent n model
-    n_fit = fit_emergent_n_model(epsilon=0.35)
+    n_fit = fit_emergent_n_model(epsilon=0.35, solver=solver)
 
     print(f"\nEmergent n model: n(σ) = {n_fit['n_base']:.2f} + {n_fit['k']:.2f} * σ")
 
@@ -134,17 +93,13 @@ def create_calibration_figure(output_dir: str = "figures/diagnostics"):
     epsilon_values = np.linspace(0.0, 0.5, 20)
     params = default_parameters()
 
-    sigma_star_original = []
-    sigma_star_calibrated = []
-
-    for eps in epsilon_values:
-        # Original (n=25)
-        orig = critical_threshold(eps, 25, params)
-        sigma_star_original.append(orig)
-
-        # Calibrated (emergent n)
-        calib = critical_threshold_with_emergent_n(eps, 0.5, params, n_fit['model'])
-        sigma_star_calibrated.append(calib)
+    # Original (n=25) and calibrated (self-consistent emergent n)
+    sigma_star_original = critical_threshold_array(epsilon_values, 25, params)
+    sigma_star_calibrated = solver.solve(epsilon_values)
+    if np.isnan(sigma_star_calibrated).any():
+        print(f"No calibrated σ* on the solver's σ grid for "
+              f"{np.isnan(sigma_star_calibrated).sum()} of {len(epsilon_values)} ε values "
+              f"(gaps in panel B)")
 
     ax2.plot(epsilon_values, sigma_star_original, 'b-', linewidth=2,
              label='Original (n=25)')
@@ -152,8 +107,8 @@ def create_calibration_figure(output_dir: str = "figures/diagnostics"):
              label='Calibrated (emergent n)')
 
     # Add empirical data points (from offset analysis)
-    eps_empirical = [0.15, 0.25, 0.35, 0.45]
-    sigma_empirical = [0.704, 0.679, 0.648, 0.625]
+    eps_empirical = np.array([0.15, 0.25, 0.35, 0.45])
+    sigma_empirical = np.array([0.704, 0.679, 0.648, 0.625])
     ax2.scatter(eps_empirical, sigma_empirical, s=100, c='purple', marker='s',
                 label='ABM empirical', zorder=5)
 
@@ -167,14 +122,8 @@ def create_calibration_figure(output_dir: str = "figures/diagnostics"):
     ax3 = axes[2]
 
     # Calculate residuals for empirical points
-    residuals_original = []
-    residuals_calibrated = []
-
-    for eps, sigma_emp in zip(eps_empirical, sigma_empirical):
-        orig = critical_threshold(eps, 25, params)
-        calib = critical_threshold_with_emergent_n(eps, 0.5, params, n_fit['model'])
-        residuals_original.append(sigma_emp - orig)
-        residuals_calibrated.append(sigma_emp - calib)
+    residuals_original = sigma_empirical - critical_threshold_array(eps_empirical, 25, params)
+    residuals_calibrated = sigma_empirical - solver.solve(eps_empirical)
 
     x = np.arange(len(eps_empirical))
     width = 0.35
@@ -191,9 +140,14 @@ def create_calibration_figure(output_dir: str = "figures/diagnostics"):
     ax3.axhline(0, color='black', linestyle='-', linewidth=0.5)
     ax3.grid(True, alpha=0.3, axis='y')
 
-    # Add text with statistics
+    # Add text with statistics (the solver gives NaN where aggregation
+    # never wins on its σ grid)
+    missing = np.isnan(residuals_calibrated)
+    if missing.any():
+        print(f"No calibrated σ* at ε = {', '.join(f'{e:.2f}' for e in eps_empirical[missing])}; "
+              f"left out of the calibrated mean residual")
     mean_orig = np.mean(residuals_original)
-    mean_calib = np.mean(residuals_calibrated)
+    mean_calib = np.nanmean(residuals_calibrated) if not missing.all() else np.nan
     ax3.text(0.95, 0.95, f'Mean residual:\nOriginal: {mean_orig:+.3f}\nCalibrated: {mean_calib:+.3f}',
              transform=ax3.transAxes, ha='right', va='top', fontsize=10,
              bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
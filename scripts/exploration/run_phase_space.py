@@ -18,6 +18,7 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from poverty_point.core_simulation import run_single_simulation, SimulationResults
+from poverty_point.batched_simulation import run_grid_block
 from poverty_point.parameters import default_parameters, critical_threshold
 
 
@@ -65,7 +66,8 @@ def run_single_point(sigma: float, epsilon: float, seed: int,
         epsilon=epsilon,
         seed=seed,
         duration=duration,
-        verbose=False
+        verbose=False,
+        summary_only=True
     )
 
     elapsed = time.time() - start_time
@@ -85,6 +87,52 @@ def run_single_point(sigma: float, epsilon: float, seed: int,
     )
 
 
+def run_agent_block(jobs: List[Tuple[float, float, int, int]]) -> List[PhaseSpacePoint]:
+    """Run (σ, ε, seed, duration) jobs one simulation at a time."""
+    return [run_single_point(*job) for job in jobs]
+
+
+def run_block(jobs: List[Tuple[float, float, int, int]]) -> List[PhaseSpacePoint]:
+    """
+    Run a block of (σ, ε, seed, duration) jobs as one tensor simulation.
+
+    All jobs in a block must share the same duration.
+
+    Args:
+        jobs: List of (sigma, epsilon, seed, duration) tuples
+
+    Returns:
+        PhaseSpacePoint for each job, in input order
+    """
+    import time
+    start_time = time.time()
+
+    sigmas, epsilons, seeds, durations = zip(*jobs)
+    block_results = run_grid_block(sigmas, epsilons, seeds,
+                                   duration=durations[0], verbose=False,
+                                   summary_only=True)
+
+    # Wall time is shared by the block; report the per-run share
+    elapsed = (time.time() - start_time) / len(jobs)
+
+    return [
+        PhaseSpacePoint(
+            sigma=float(sigma),
+            epsilon=float(epsilon),
+            seed=int(seed),
+            strategy_dominance=float(results.final_strategy_dominance),
+            mean_aggregation_size=float(results.mean_aggregation_size),
+            final_monument_level=float(results.final_monument_level),
+            total_exotics=int(results.total_exotics),
+            mean_population=float(results.mean_population),
+            sigma_star_theoretical=float(results.sigma_star_theoretical),
+            above_threshold=bool(sigma > results.sigma_star_theoretical),
+            run_time_seconds=float(elapsed)
+        )
+        for (sigma, epsilon, seed, _), results in zip(jobs, block_results)
+    ]
+
+
 def run_phase_space_exploration(
     sigma_range: Tuple[float, float, int] = (0.2, 0.8, 13),
     epsilon_range: Tuple[float, float, int] = (0.0, 0.5, 11),
@@ -92,7 +140,9 @@ def run_phase_space_exploration(
     duration: int = 600,
     n_workers: int = 4,
     output_dir: str = "results/phase_space",
-    verbose: bool = True
+    verbose: bool = True,
+    engine: str = "agent",
+    block_size: int = 256
 ) -> List[PhaseSpacePoint]:
     """
     Run full phase space exploration.
@@ -105,6 +155,9 @@ def run_phase_space_exploration(
         n_workers: Number of parallel workers
         output_dir: Directory for output files
         verbose: Print progress
+        engine: "agent" runs one simulation per job; "tensor" simulates
+            blocks of jobs as one array computation (batched_simulation)
+        block_size: Jobs per block in tensor mode
 
     Returns:
         List of PhaseSpacePoint results
@@ -134,39 +187,52 @@ def run_phase_space_exploration(
         print(f"  Replicates: {n_replicates}")
         print(f"  Total runs: {total_jobs}")
         print(f"  Workers: {n_workers}")
+        print(f"  Engine: {engine}")
         print()
 
+    # Units of work handed to workers: single runs or tensor blocks
+    if engine == "tensor":
+        units = [jobs[i:i + block_size] for i in range(0, total_jobs, block_size)]
+        worker = run_block
+    elif engine == "agent":
+        units = [[job] for job in jobs]
+        worker = run_agent_block
+    else:
+        raise ValueError(f"Unknown engine '{engine}'. Available: agent, tensor")
+
     # Run simulations
     results = []
     completed = 0
+    report_every = 10 if n_workers == 1 else 50
+
+    def report(n_done: int) -> None:
+        if verbose and completed // report_every > (completed - n_done) // report_every:
+            print(f"  Completed {completed}/{total_jobs} ({100*completed/total_jobs:.1f}%)")
 
     if n_workers == 1:
         # Serial execution
-        for sigma, epsilon, seed, dur in jobs:
-            result = run_single_point(sigma, epsilon, seed, dur)
-            results.append(result)
-            completed += 1
-            if verbose and completed % 10 == 0:
-                print(f"  Completed {completed}/{total_jobs} ({100*completed/total_jobs:.1f}%)")
+        for unit in units:
+            results.extend(worker(unit))
+            completed += len(unit)
+            report(len(unit))
     else:
         # Parallel execution
         with ProcessPoolExecutor(max_workers=n_workers) as executor:
-            futures = {
-                executor.submit(run_single_point, sigma, epsilon, seed, dur): (sigma, epsilon, seed)
-                for sigma, epsilon, seed, dur in jobs
-            }
+            futures = {executor.submit(worker, unit): unit for unit in units}
 
             for future in as_completed(futures):
+                unit = futures[future]
                 try:
-                    result = future.result()
-                    results.append(result)
+                    results.extend(future.result())
                 except Exception as e:
-                    sigma, epsilon, seed = futures[future]
-                    print(f"  Error at σ={sigma:.2f}, ε={epsilon:.2f}, seed={seed}: {e}")
+                    sigma, epsilon, seed, _ = unit[0]
+                    where = f"σ={sigma:.2f}, ε={epsilon:.2f}, seed={seed}"
+                    if len(unit) > 1:
+                        where = f"block of {len(unit)} runs starting at {where}"
+                    print(f"  Error at {where}: {e}")
 
-                completed += 1
-                if verbose and completed % 50 == 0:
-                    print(f"  Completed {completed}/{total_jobs} ({100*completed/total_jobs:.1f}%)")
+                completed += len(unit)
+                report(len(unit))
 
     if verbose:
         print(f"\nCompleted all {len(results)} simulations")
@@ -326,6 +392,10 @@ if __name__ == "__main__":
                         help="Number of replicates per point")
     parser.add_argument("--duration", type=int, default=600,
                         help="Simulation duration in years")
+    parser.add_argument("--engine", choices=["agent", "tensor"], default="agent",
+                        help="Simulate runs one at a time or as tensor blocks")
+    parser.add_argument("--block-size", type=int, default=256,
+                        help="Runs per tensor block (tensor engine only)")
 
     args = parser.parse_args()
 
@@ -336,6 +406,8 @@ if __name__ == "__main__":
             n_replicates=args.replicates,
             duration=args.duration,
             n_workers=args.workers,
-            verbose=True
+            verbose=True,
+            engine=args.engine,
+            block_size=args.block_size
         )
         analyze_phase_space(results)
@@ -18,10 +18,11 @@ from typing import Dict, List, Optional
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from poverty_point.parameters import (
-    default_parameters, critical_threshold, W_aggregator, W_independent,
-    cooperation_benefit
-)
+from poverty_point.parameters import default_parameters
+from poverty_point.theory_cache import TheoryCache
+
+# σ* curves and fitness grids are reused across figure regenerations
+THEORY_CACHE = TheoryCache()
 
 
 def load_analysis_results(analysis_file: str) -> Dict:
@@ -62,16 +63,11 @@ def create_phase_space_comparison(analysis: Dict,
     params = default_parameters()
     n_fixed = 25
 
-    theory_dominance = np.zeros((len(epsilon_grid), len(sigma_grid)))
-    for i, eps in enumerate(epsilon_grid):
-        for j, sig in enumerate(sigma_grid):
-            W_agg = W_aggregator(sig, eps, n_fixed, params)
-            W_ind = W_independent(sig, params)
-            W_total = W_agg + W_ind
-            if W_total > 0.001:
-                theory_dominance[i, j] = (W_agg - W_ind) / W_total
-            else:
-                theory_dominance[i, j] = 0.0
+    W_agg, W_ind = THEORY_CACHE.fitness_grids(sigma_grid[None, :], epsilon_grid[:, None],
+                                              n_fixed, params)
+    W_total = W_agg + W_ind
+    valid = W_total > 0.001
+    theory_dominance = np.where(valid, (W_agg - W_ind) / np.where(valid, W_total, 1.0), 0.0)
 
     # Plot theoretical
     colors = ['#7b3294', '#c2a5cf', '#f7f7f7', '#fdae61', '#e66101']
@@ -83,10 +79,7 @@ def create_phase_space_comparison(analysis: Dict,
                      origin='lower', aspect='auto', cmap=cmap, vmin=-1, vmax=1)
 
     # Add theoretical threshold line
-    theory_thresholds = []
-    for eps in epsilon_grid:
-        s_star = critical_threshold(eps, n_fixed, params)
-        theory_thresholds.append(s_star)
+    theory_thresholds = THEORY_CACHE.critical_threshold(epsilon_grid, n_fixed, params)
 
     ax1.plot(theory_thresholds, epsilon_grid, 'k-', linewidth=2.5,
              label='σ* (theory)')
@@ -172,7 +165,7 @@ def create_threshold_comparison(analysis: Dict,
     # Theoretical thresholds
     params = default_parameters()
     eps_range = np.linspace(0.0, 0.5, 50)
-    theory_thresholds = [critical_threshold(eps, 25, params) for eps in eps_range]
+    theory_thresholds = THEORY_CACHE.critical_threshold(eps_range, 25, params)
 
     ax1.plot(eps_range, theory_thresholds, 'b-', linewidth=2, label='Theory')
 
@@ -293,8 +286,7 @@ def create_dominance_heatmap(analysis: Dict,
 
     # Add theoretical threshold line
     params = default_parameters()
-    theory_thresholds = [critical_threshold(eps, 25, params)
-                         for eps in epsilon_values]
+    theory_thresholds = THEORY_CACHE.critical_threshold(np.array(epsilon_values), 25, params)
     ax.plot(theory_thresholds, epsilon_values, 'w--', linewidth=2,
             label='Theoretical σ*')
 
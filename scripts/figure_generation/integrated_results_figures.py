@@ -187,10 +187,11 @@ def create_phase_space_figure(phase_space: list) -> plt.Figure:
                      interpolation='bilinear')
 
     # Plot theoretical critical threshold line
-    from src.poverty_point.parameters import default_parameters, critical_threshold
+    from src.poverty_point.parameters import default_parameters
+    from src.poverty_point.theory_cache import TheoryCache
     params = default_parameters()
     eps_line = np.linspace(0.1, 0.5, 50)
-    sigma_stars = [critical_threshold(eps, 25, params) for eps in eps_line]
+    sigma_stars = TheoryCache().critical_threshold(eps_line, 25, params)
     ax1.plot(sigma_stars, eps_line, 'k-', linewidth=2.5, label='Theoretical σ*')
     ax1.plot(sigma_stars, eps_line, 'w--', linewidth=1.5)
 
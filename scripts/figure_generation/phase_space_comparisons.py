@@ -14,6 +14,7 @@ independent and aggregation strategies.
 import sys
 sys.path.insert(0, '/Users/clipo/PycharmProjects/poverty-point-signaling')
 
+import dataclasses
 import numpy as np
 import json
 import matplotlib.pyplot as plt
@@ -74,10 +75,11 @@ def create_fine_phase_space_figure(results):
                      interpolation='bilinear')
 
     # Plot theoretical critical threshold line
-    from src.poverty_point.parameters import default_parameters, critical_threshold
+    from src.poverty_point.parameters import default_parameters
+    from src.poverty_point.theory_cache import TheoryCache
     params = default_parameters()
     eps_line = np.linspace(0.05, 0.5, 100)
-    sigma_stars = [critical_threshold(eps, 25, params) for eps in eps_line]
+    sigma_stars = TheoryCache().critical_threshold(eps_line, 25, params)
     ax1.plot(sigma_stars, eps_line, 'k-', linewidth=2.5, label='Theoretical σ*')
     ax1.plot(sigma_stars, eps_line, 'w--', linewidth=1.5)
 
@@ -109,33 +111,21 @@ def create_sigma_vs_n_figure():
     """
     Create theoretical figure showing σ vs aggregation size (n).
     """
-    from src.poverty_point.parameters import default_parameters, critical_threshold
+    from src.poverty_point.parameters import default_parameters
+    from src.poverty_point.theory_cache import TheoryCache
 
     fig, axes = plt.subplots(1, 2, figsize=(14, 6))
     params = default_parameters()
+    cache = TheoryCache()
 
     # Grid for σ and n
     sigma_vals = np.linspace(0.2, 0.9, 100)
     n_vals = np.linspace(5, 40, 100)
 
-    # Calculate fitness difference grid
+    # Calculate fitness difference grid, shape (n, σ)
     epsilon = 0.35  # Fixed ecotone advantage (Poverty Point estimate)
-    fitness_diff = np.zeros((len(n_vals), len(sigma_vals)))
-
-    for i, n in enumerate(n_vals):
-        for j, sig in enumerate(sigma_vals):
-            # Aggregator fitness
-            C_total = params.costs.C_total
-            sigma_eff = sig * (1 - epsilon)
-            f_n = 1 + params.cooperation.b_coop * np.log(n)
-            if n > params.cooperation.n_optimal:
-                f_n -= params.cooperation.c_crowd * (n - params.cooperation.n_optimal)**2
-            W_agg = (1 - C_total) * (1 - params.vulnerability.alpha_agg * sigma_eff) * f_n * (1 + params.cooperation.B_recip)
-
-            # Independent fitness
-            W_ind = params.cooperation.R_ind * (1 - params.vulnerability.beta_ind * sig)
-
-            fitness_diff[i, j] = W_agg - W_ind
+    fitness_diff = cache.fitness_difference(sigma_vals[None, :], epsilon,
+                                            n_vals[:, None], params)
 
     # Custom colormap
     colors = ['#7b3294', '#c2a5cf', '#f7f7f7', '#fdae61', '#e66101']
@@ -150,13 +140,7 @@ def create_sigma_vs_n_figure():
 
     # Plot critical threshold line (where fitness_diff = 0)
     n_line = np.linspace(10, 35, 50)
-    sigma_stars = []
-    for n in n_line:
-        try:
-            sig_star = critical_threshold(epsilon, n, params)
-            sigma_stars.append(sig_star)
-        except:
-            sigma_stars.append(np.nan)
+    sigma_stars = cache.critical_threshold(epsilon, n_line, params)
     ax1.plot(sigma_stars, n_line, 'k-', linewidth=2.5, label='Critical threshold σ*')
     ax1.plot(sigma_stars, n_line, 'w--', linewidth=1.5)
 
@@ -182,10 +166,12 @@ def create_sigma_vs_n_figure():
     # Panel B: How critical threshold varies with n
     ax2 = axes[1]
     n_range = np.linspace(10, 40, 100)
-    for eps, color, label in [(0.15, '#d7191c', 'ε = 0.15 (low)'),
-                               (0.35, '#1a9641', 'ε = 0.35 (Poverty Point)'),
-                               (0.50, '#2b83ba', 'ε = 0.50 (high)')]:
-        sigma_stars_eps = [critical_threshold(eps, n, params) for n in n_range]
+    curves = [(0.15, '#d7191c', 'ε = 0.15 (low)'),
+              (0.35, '#1a9641', 'ε = 0.35 (Poverty Point)'),
+              (0.50, '#2b83ba', 'ε = 0.50 (high)')]
+    sigma_star_curves = cache.critical_threshold(
+        np.array([eps for eps, _, _ in curves])[:, None], n_range[None, :], params)
+    for (eps, color, label), sigma_stars_eps in zip(curves, sigma_star_curves):
         ax2.plot(n_range, sigma_stars_eps, '-', linewidth=2.5, color=color, label=label)
 
     ax2.axvline(params.cooperation.n_optimal, color='gray', linestyle=':', linewidth=1, alpha=0.7)
@@ -213,32 +199,27 @@ def create_sigma_vs_cost_figure():
     """
     Create theoretical figure showing σ vs signaling cost.
     """
-    from src.poverty_point.parameters import default_parameters, critical_threshold
+    from src.poverty_point.parameters import default_parameters
+    from src.poverty_point.theory_cache import TheoryCache
 
     fig, axes = plt.subplots(1, 2, figsize=(14, 6))
     params = default_parameters()
+    cache = TheoryCache()
+
+    def with_signal_cost(C_signal):
+        """Parameters with C_signal replaced by an array of sweep values."""
+        return dataclasses.replace(
+            params, costs=dataclasses.replace(params.costs, C_signal=C_signal))
 
     # Grid for σ and cost
     sigma_vals = np.linspace(0.2, 0.9, 100)
     cost_vals = np.linspace(0.05, 0.40, 100)  # C_signal ranges from 5% to 40%
 
-    # Calculate fitness difference grid
+    # Calculate fitness difference grid, shape (cost, σ)
     epsilon = 0.35  # Fixed ecotone advantage
     n = 25  # Fixed aggregation size
-    fitness_diff = np.zeros((len(cost_vals), len(sigma_vals)))
-
-    for i, C_signal in enumerate(cost_vals):
-        for j, sig in enumerate(sigma_vals):
-            # Aggregator fitness with varying signal cost
-            C_total = params.costs.C_travel + C_signal + params.costs.C_opportunity
-            sigma_eff = sig * (1 - epsilon)
-            f_n = 1 + params.cooperation.b_coop * np.log(n)
-            W_agg = (1 - C_total) * (1 - params.vulnerability.alpha_agg * sigma_eff) * f_n * (1 + params.cooperation.B_recip)
-
-            # Independent fitness
-            W_ind = params.cooperation.R_ind * (1 - params.vulnerability.beta_ind * sig)
-
-            fitness_diff[i, j] = W_agg - W_ind
+    fitness_diff = cache.fitness_difference(sigma_vals[None, :], epsilon, n,
+                                            with_signal_cost(cost_vals[:, None]))
 
     # Custom colormap
     colors = ['#7b3294', '#c2a5cf', '#f7f7f7', '#fdae61', '#e66101']
@@ -253,17 +234,7 @@ def create_sigma_vs_cost_figure():
 
     # Calculate and plot critical threshold line
     cost_line = np.linspace(0.05, 0.35, 50)
-    sigma_stars = []
-    for C_sig in cost_line:
-        # Recalculate critical threshold with modified C_signal
-        C_total = params.costs.C_travel + C_sig + params.costs.C_opportunity
-        agg_base = (1 - C_total) * (1 + params.cooperation.b_coop * np.log(n)) * (1 + params.cooperation.B_recip)
-        numerator = params.cooperation.R_ind - agg_base
-        denominator = params.cooperation.R_ind * params.vulnerability.beta_ind - agg_base * params.vulnerability.alpha_agg * (1 - epsilon)
-        if denominator > 0:
-            sigma_stars.append(numerator / denominator)
-        else:
-            sigma_stars.append(np.nan)
+    sigma_stars = cache.critical_threshold(epsilon, n, with_signal_cost(cost_line))
 
     ax1.plot(sigma_stars, cost_line, 'k-', linewidth=2.5, label='Critical threshold σ*')
     ax1.plot(sigma_stars, cost_line, 'w--', linewidth=1.5)
@@ -291,19 +262,13 @@ def create_sigma_vs_cost_figure():
     ax2 = axes[1]
     cost_range = np.linspace(0.05, 0.35, 100)
 
-    for eps, color, label in [(0.15, '#d7191c', 'ε = 0.15 (low)'),
-                               (0.35, '#1a9641', 'ε = 0.35 (Poverty Point)'),
-                               (0.50, '#2b83ba', 'ε = 0.50 (high)')]:
-        sigma_stars_eps = []
-        for C_sig in cost_range:
-            C_total = params.costs.C_travel + C_sig + params.costs.C_opportunity
-            agg_base = (1 - C_total) * (1 + params.cooperation.b_coop * np.log(n)) * (1 + params.cooperation.B_recip)
-            numerator = params.cooperation.R_ind - agg_base
-            denominator = params.cooperation.R_ind * params.vulnerability.beta_ind - agg_base * params.vulnerability.alpha_agg * (1 - eps)
-            if denominator > 0:
-                sigma_stars_eps.append(max(0, min(1, numerator / denominator)))
-            else:
-                sigma_stars_eps.append(1.0)
+    curves = [(0.15, '#d7191c', 'ε = 0.15 (low)'),
+              (0.35, '#1a9641', 'ε = 0.35 (Poverty Point)'),
+              (0.50, '#2b83ba', 'ε = 0.50 (high)')]
+    sigma_star_curves = cache.critical_threshold(
+        np.array([eps for eps, _, _ in curves])[:, None], n,
+        with_signal_cost(cost_range[None, :]))
+    for (eps, color, label), sigma_stars_eps in zip(curves, sigma_star_curves):
         ax2.plot(cost_range, sigma_stars_eps, '-', linewidth=2.5, color=color, label=label)
 
     ax2.axvline(params.costs.C_signal, color='gray', linestyle=':', linewidth=1, alpha=0.7)
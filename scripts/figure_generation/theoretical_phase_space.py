@@ -12,50 +12,28 @@ The figure shows:
 3. How the fitness functions create the phase transition
 """
 
+import os
 import sys
-sys.path.insert(0, '/Users/clipo/PycharmProjects/poverty-point-signaling')
 
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
 from pathlib import Path
 
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from poverty_point.parameters import (
+    SimulationParameters, CostParameters, VulnerabilityParameters,
+    CooperationParameters, W_aggregator_array, W_independent_array,
+    critical_threshold_array
+)
+
 # Output directory
 OUTPUT_DIR = Path('/Users/clipo/PycharmProjects/poverty-point-signaling/figures/integrated')
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def W_aggregator(sigma, epsilon, n, params):
-    """Calculate aggregator fitness."""
-    C_total = params['C_travel'] + params['C_signal'] + params['C_opportunity']
-    alpha = params['alpha_agg']
-    b = params['b_coop']
-    c = params['c_crowd']
-    n_star = params['n_star']
-    B_recip = params['B_recip']
-
-    # Effective sigma reduced by ecotone
-    sigma_eff = sigma * (1 - epsilon)
-
-    # Cooperation benefits
-    f_n = 1 + b * np.log(n)
-    if n > n_star:
-        f_n -= c * (n - n_star)**2
-
-    # Fitness
-    W = (1 - C_total) * (1 - alpha * sigma_eff) * f_n * (1 + B_recip)
-    return W
-
-
-def W_independent(sigma, params):
-    """Calculate independent fitness."""
-    R_ind = params['R_ind']
-    beta = params['beta_ind']
-
-    W = R_ind * (1 - beta * sigma)
-    return W
-
-
 def critical_threshold(epsilon, n, params):
     """Calculate critical σ* where strategies have equal fitness."""
     C_total = params['C_travel'] + params['C_signal'] + params['C_opportunity']
@@ -103,6 +81,22 @@ def default_parameters():
     }
 
 
+def simulation_parameters(params):
+    """Express a parameter dict as a SimulationParameters for the array functions."""
+    return SimulationParameters(
+        costs=CostParameters(C_travel=params['C_travel'],
+                             C_signal=params['C_signal'],
+                             C_opportunity=params['C_opportunity']),
+        vulnerability=VulnerabilityParameters(alpha_agg=params['alpha_agg'],
+                                              beta_ind=params['beta_ind']),
+        cooperation=CooperationParameters(b_coop=params['b_coop'],
+                                          n_optimal=params['n_star'],
+                                          c_crowd=params['c_crowd'],
+                                          B_recip=params['B_recip'],
+                                          R_ind=params['R_ind']),
+    )
+
+
 def create_theoretical_phase_space_figure():
     """
     Create the theoretical phase space prediction figure.
@@ -110,6 +104,7 @@ def create_theoretical_phase_space_figure():
     fig, axes = plt.subplots(1, 2, figsize=(14, 6))
 
     params = default_parameters()
+    sim_params = simulation_parameters(params)
     n = 25  # Optimal aggregation size
 
     # Create fine grid for smooth visualization
@@ -117,13 +112,9 @@ def create_theoretical_phase_space_figure():
     epsilon_vals = np.linspace(0.0, 0.5, 100)
 
     # Calculate fitness difference grid (W_agg - W_ind)
-    fitness_diff = np.zeros((len(epsilon_vals), len(sigma_vals)))
-
-    for i, eps in enumerate(epsilon_vals):
-        for j, sig in enumerate(sigma_vals):
-            W_agg = W_aggregator(sig, eps, n, params)
-            W_ind = W_independent(sig, params)
-            fitness_diff[i, j] = W_agg - W_ind
+    # (one broadcast call over the (ε, σ) grid)
+    fitness_diff = (W_aggregator_array(sigma_vals[None, :], epsilon_vals[:, None], n, sim_params)
+                    - W_independent_array(sigma_vals[None, :], sim_params))
 
     # Custom colormap: purple (independent favored) to orange (aggregation favored)
     colors = ['#7b3294', '#c2a5cf', '#f7f7f7', '#fdae61', '#e66101']
@@ -141,7 +132,7 @@ def create_theoretical_phase_space_figure():
 
     # Plot critical threshold line
     eps_line = np.linspace(0.0, 0.5, 100)
-    sigma_stars = [critical_threshold(eps, n, params) for eps in eps_line]
+    sigma_stars = critical_threshold_array(eps_line, n, sim_params)
     ax1.plot(sigma_stars, eps_line, 'k-', linewidth=3, label='Critical threshold σ*')
     ax1.plot(sigma_stars, eps_line, 'w--', linewidth=1.5)
 
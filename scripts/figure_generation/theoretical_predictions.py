@@ -13,6 +13,9 @@ Key theoretical components:
 5. Critical threshold σ* for aggregation emergence
 """
 
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
@@ -21,6 +24,18 @@ import matplotlib.patches as mpatches
 from typing import Tuple, Dict
 from dataclasses import dataclass
 
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from poverty_point.parameters import (
+    CostParameters, VulnerabilityParameters, CooperationParameters,
+    SimulationParameters
+)
+from poverty_point.theory_cache import TheoryCache
+
+# σ* curves and fitness grids are reused across figure regenerations
+THEORY_CACHE = TheoryCache()
+
 
 # =============================================================================
 # THEORETICAL PARAMETERS
@@ -65,6 +80,24 @@ class TheoreticalParameters:
     # Ecotone parameters
     epsilon_max: float = 0.50        # Maximum ecotone buffering
 
+    def as_simulation_parameters(self) -> SimulationParameters:
+        """
+        The same model as a SimulationParameters, for the array functions
+        in poverty_point.parameters (R_ind is the 1.10 used below).
+        """
+        return SimulationParameters(
+            costs=CostParameters(C_travel=self.C_travel_base,
+                                 C_signal=self.C_signal,
+                                 C_opportunity=self.C_opportunity),
+            vulnerability=VulnerabilityParameters(alpha_agg=self.alpha_agg,
+                                                  beta_ind=self.beta_ind),
+            cooperation=CooperationParameters(b_coop=self.b_coop,
+                                              n_optimal=self.n_optimal,
+                                              c_crowd=self.c_crowd,
+                                              B_recip=self.B_recip,
+                                              R_ind=1.10),
+        )
+
 
 def cooperation_benefit(n: float, params: TheoreticalParameters) -> float:
     """
@@ -231,6 +264,21 @@ def strategy_dominance(sigma: float, epsilon: float, n: float,
     return dominance
 
 
+def strategy_dominance_grid(sigma: np.ndarray, epsilon: np.ndarray, n: float,
+                            params: TheoreticalParameters) -> np.ndarray:
+    """
+    strategy_dominance over a whole (ε, σ) grid.
+
+    Returns array of shape (len(epsilon), len(sigma)).
+    """
+    W_agg, W_ind = THEORY_CACHE.fitness_grids(sigma[None, :], epsilon[:, None], n,
+                                              params.as_simulation_parameters())
+
+    W_total = W_agg + W_ind
+    valid = W_total >= 0.001
+    return np.where(valid, (W_agg - W_ind) / np.where(valid, W_total, 1.0), 0.0)
+
+
 # =============================================================================
 # FIGURE 1: BASIC PHASE SPACE (σ vs ε)
 # =============================================================================
@@ -250,11 +298,7 @@ def create_phase_space_sigma_epsilon(params: TheoreticalParameters,
     epsilon_range = np.linspace(0.0, 0.5, 100)
 
     # Calculate dominance across phase space
-    dominance = np.zeros((len(epsilon_range), len(sigma_range)))
-
-    for i, eps in enumerate(epsilon_range):
-        for j, sig in enumerate(sigma_range):
-            dominance[i, j] = strategy_dominance(sig, eps, n_fixed, params)
+    dominance = strategy_dominance_grid(sigma_range, epsilon_range, n_fixed, params)
 
     # Custom colormap: purple (independent) to white to orange (aggregation)
     colors = ['#7b3294', '#c2a5cf', '#f7f7f7', '#fdae61', '#e66101']
@@ -265,10 +309,8 @@ def create_phase_space_sigma_epsilon(params: TheoreticalParameters,
                    origin='lower', aspect='auto', cmap=cmap, vmin=-1, vmax=1)
 
     # Calculate and plot critical threshold line
-    sigma_stars = []
-    for eps in epsilon_range:
-        s_star = critical_threshold(eps, n_fixed, params)
-        sigma_stars.append(s_star)
+    sigma_stars = THEORY_CACHE.critical_threshold(epsilon_range, n_fixed,
+                                                  params.as_simulation_parameters())
 
     ax.plot(sigma_stars, epsilon_range, 'k-', linewidth=2.5, label='σ* (critical threshold)')
     ax.plot(sigma_stars, epsilon_range, 'w--', linewidth=1.5)
@@ -354,8 +396,10 @@ def create_fitness_curves(params: TheoreticalParameters) -> plt.Figure:
     n_values = [15, 25, 40]
     colors_n = ['#1b7837', '#5aae61', '#a6dba0']
 
-    for n, color in zip(n_values, colors_n):
-        sigma_stars = [critical_threshold(eps, n, params) for eps in epsilon_range]
+    sigma_star_curves = THEORY_CACHE.critical_threshold(
+        epsilon_range[None, :], np.array(n_values)[:, None],
+        params.as_simulation_parameters())
+    for n, color, sigma_stars in zip(n_values, colors_n, sigma_star_curves):
         ax2.plot(epsilon_range, sigma_stars, '-', color=color, linewidth=2,
                  label=f'n = {n} bands')
 
@@ -422,8 +466,10 @@ def create_cooperation_benefits_figure(params: TheoreticalParameters) -> plt.Fig
     epsilon_values = [0.1, 0.25, 0.4]
     colors = ['#fee8c8', '#fdbb84', '#e34a33']
 
-    for eps, color in zip(epsilon_values, colors):
-        sigma_stars = [critical_threshold(eps, n, params) for n in n_range]
+    sigma_star_curves = THEORY_CACHE.critical_threshold(
+        np.array(epsilon_values)[:, None], n_range[None, :],
+        params.as_simulation_parameters())
+    for eps, color, sigma_stars in zip(epsilon_values, colors, sigma_star_curves):
         ax2.plot(n_range, sigma_stars, 'o-', color=color, linewidth=2,
                  markersize=8, label=f'ε = {eps}')
 
@@ -455,20 +501,18 @@ def create_3d_phase_space(params: TheoreticalParameters) -> plt.Figure:
     # Custom colormap
     colors = ['#7b3294', '#c2a5cf', '#f7f7f7', '#fdae61', '#e66101']
     cmap = LinearSegmentedColormap.from_list('strategy', colors, N=256)
+    sim_params = params.as_simulation_parameters()
 
     # Panel A: Low aggregation size (n=10)
     ax1 = axes[0, 0]
     n_low = 10
     sigma_range = np.linspace(0.1, 0.9, 50)
     epsilon_range = np.linspace(0.0, 0.5, 50)
-    dominance = np.zeros((len(epsilon_range), len(sigma_range)))
-    for i, eps in enumerate(epsilon_range):
-        for j, sig in enumerate(sigma_range):
-            dominance[i, j] = strategy_dominance(sig, eps, n_low, params)
+    dominance = strategy_dominance_grid(sigma_range, epsilon_range, n_low, params)
 
     im1 = ax1.imshow(dominance, extent=[0.1, 0.9, 0.0, 0.5],
                      origin='lower', aspect='auto', cmap=cmap, vmin=-1, vmax=1)
-    sigma_stars = [critical_threshold(eps, n_low, params) for eps in epsilon_range]
+    sigma_stars = THEORY_CACHE.critical_threshold(epsilon_range, n_low, sim_params)
     ax1.plot(sigma_stars, epsilon_range, 'k-', linewidth=2)
     ax1.set_title(f'A. Small Aggregation (n={n_low} bands)', fontsize=12)
     ax1.set_xlabel('σ')
@@ -477,14 +521,11 @@ def create_3d_phase_space(params: TheoreticalParameters) -> plt.Figure:
     # Panel B: Medium aggregation size (n=25)
     ax2 = axes[0, 1]
     n_med = 25
-    dominance = np.zeros((len(epsilon_range), len(sigma_range)))
-    for i, eps in enumerate(epsilon_range):
-        for j, sig in enumerate(sigma_range):
-            dominance[i, j] = strategy_dominance(sig, eps, n_med, params)
+    dominance = strategy_dominance_grid(sigma_range, epsilon_range, n_med, params)
 
     im2 = ax2.imshow(dominance, extent=[0.1, 0.9, 0.0, 0.5],
                      origin='lower', aspect='auto', cmap=cmap, vmin=-1, vmax=1)
-    sigma_stars = [critical_threshold(eps, n_med, params) for eps in epsilon_range]
+    sigma_stars = THEORY_CACHE.critical_threshold(epsilon_range, n_med, sim_params)
     ax2.plot(sigma_stars, epsilon_range, 'k-', linewidth=2)
     ax2.set_title(f'B. Optimal Aggregation (n={n_med} bands)', fontsize=12)
     ax2.set_xlabel('σ')
@@ -493,14 +534,11 @@ def create_3d_phase_space(params: TheoreticalParameters) -> plt.Figure:
     # Panel C: Large aggregation size (n=45)
     ax3 = axes[1, 0]
     n_high = 45
-    dominance = np.zeros((len(epsilon_range), len(sigma_range)))
-    for i, eps in enumerate(epsilon_range):
-        for j, sig in enumerate(sigma_range):
-            dominance[i, j] = strategy_dominance(sig, eps, n_high, params)
+    dominance = strategy_dominance_grid(sigma_range, epsilon_range, n_high, params)
 
     im3 = ax3.imshow(dominance, extent=[0.1, 0.9, 0.0, 0.5],
                      origin='lower', aspect='auto', cmap=cmap, vmin=-1, vmax=1)
-    sigma_stars = [critical_threshold(eps, n_high, params) for eps in epsilon_range]
+    sigma_stars = THEORY_CACHE.critical_threshold(epsilon_range, n_high, sim_params)
     ax3.plot(sigma_stars, epsilon_range, 'k-', linewidth=2)
     ax3.set_title(f'C. Large Aggregation (n={n_high} bands, crowding)', fontsize=12)
     ax3.set_xlabel('σ')
@@ -511,8 +549,9 @@ def create_3d_phase_space(params: TheoreticalParameters) -> plt.Figure:
     epsilon_range_d = np.linspace(0.05, 0.45, 20)
     n_range_d = np.arange(10, 50, 5)
 
-    for n in n_range_d:
-        sigma_stars = [critical_threshold(eps, n, params) for eps in epsilon_range_d]
+    sigma_star_surface = THEORY_CACHE.critical_threshold(epsilon_range_d[None, :],
+                                                         n_range_d[:, None], sim_params)
+    for n, sigma_stars in zip(n_range_d, sigma_star_surface):
         color = plt.cm.viridis((n - 10) / 40)
         ax4.plot(epsilon_range_d, sigma_stars, '-', color=color, linewidth=1.5,
                  label=f'n={n}' if n in [10, 25, 45] else None)
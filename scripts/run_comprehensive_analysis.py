@@ -21,6 +21,7 @@ from datetime import datetime
 from dataclasses import asdict
 
 from src.poverty_point.integrated_simulation import IntegratedSimulation
+from src.poverty_point.batched_simulation import BatchedIntegratedSimulation
 from src.poverty_point.environmental_scenarios import (
     get_scenario, create_critical_threshold_scenario, ShortfallParams,
     EnvironmentalScenario, SCENARIOS
@@ -49,21 +50,21 @@ def run_sigma_sweep(n_points: int = 10, duration: int = 400, n_replicates: int =
     for i, target_sigma in enumerate(sigma_values):
         print(f"\nσ = {target_sigma:.2f} ({i+1}/{n_points})")
 
-        replicate_results = []
-        for rep in range(n_replicates):
-            scenario = create_critical_threshold_scenario(target_sigma=target_sigma)
-            params = default_parameters(seed=42 + rep)
-            params.duration = duration
-            params.burn_in = 100
+        # All replicates of this σ advance together as one batch
+        scenario = create_critical_threshold_scenario(target_sigma=target_sigma)
+        params = default_parameters()
+        params.duration = duration
+        params.burn_in = 100
 
-            sim = IntegratedSimulation(
-                params=params,
-                env_config=scenario.env_config,
-                shortfall_params=scenario.shortfall_params,
-                seed=42 + rep
-            )
-            sim_results = sim.run(verbose=False)
+        batch = BatchedIntegratedSimulation(
+            params=params,
+            env_config=scenario.env_config,
+            shortfall_params=scenario.shortfall_params,
+            seeds=[42 + rep for rep in range(n_replicates)]
+        )
 
+        replicate_results = []
+        for sim_results in batch.run(verbose=False):
             replicate_results.append({
                 'target_sigma': float(target_sigma),
                 'actual_sigma': float(sim_results.mean_effective_sigma),
@@ -238,22 +239,21 @@ def run_poverty_point_calibration(duration: int = 500, n_replicates: int = 5):
 
     scenario = get_scenario('poverty_point')
 
-    all_results = []
-    for rep in range(n_replicates):
-        print(f"\nReplicate {rep+1}/{n_replicates}")
+    print(f"\nRunning {n_replicates} replicates")
 
-        params = default_parameters(seed=42 + rep)
-        params.duration = duration
-        params.burn_in = 50
+    params = default_parameters()
+    params.duration = duration
+    params.burn_in = 50
 
-        sim = IntegratedSimulation(
-            params=params,
-            env_config=scenario.env_config,
-            shortfall_params=scenario.shortfall_params,
-            seed=42 + rep
-        )
-        sim_results = sim.run(verbose=False)
+    batch = BatchedIntegratedSimulation(
+        params=params,
+        env_config=scenario.env_config,
+        shortfall_params=scenario.shortfall_params,
+        seeds=[42 + rep for rep in range(n_replicates)]
+    )
 
+    all_results = []
+    for sim_results in batch.run(verbose=False):
         all_results.append({
             'final_monument': float(sim_results.final_monument_level),
             'total_exotics': sim_results.total_exotics,
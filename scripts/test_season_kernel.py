@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Equivalence tests for the seasonal step kernel of IntegratedSimulation.
+
+The seasonal kernel evaluates each season in one array pass instead of
+running the season handlers once per month. This script checks it against
+the monthly reference loop:
+
+1. Stacked season productivities and location values equal the
+   month-by-month values exactly
+2. Spring and fall (no random draws) leave band resources exactly as the
+   monthly handlers do
+3. Per-band bookkeeping matches: three strategy, attendance and fitness
+   records per year, and the site state the next year starts from
+4. Over many seeds, the post-burn-in summaries of both kernels agree in
+   distribution (difference of means within a few standard errors)
+
+Exits with status 1 if any check fails.
+"""
+
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+
+from poverty_point.integrated_simulation import IntegratedSimulation
+from poverty_point.parameters import default_parameters
+from poverty_point.vectorized_simulation import BandArrays
+
+
+SUMMARY_METRICS = [
+    'final_strategy_dominance',
+    'mean_aggregation_size',
+    'final_monument_level',
+    'total_exotics',
+    'mean_population',
+    'mean_effective_sigma',
+]
+
+
+def make_simulation(seed: int, duration: int, step_kernel: str) -> IntegratedSimulation:
+    """Create an integrated simulation with a short burn-in."""
+    params = default_parameters(seed=seed)
+    params.duration = duration
+    params.burn_in = min(50, duration // 2)
+    return IntegratedSimulation(params=params, seed=seed, step_kernel=step_kernel)
+
+
+def warmed_up(seed: int, years: int = 20) -> IntegratedSimulation:
+    """Monthly-kernel simulation after a few years, mid-way into a year."""
+    sim = make_simulation(seed, duration=years + 5, step_kernel="monthly")
+    for _ in range(years):
+        sim.step_year()
+    sim.environment.advance_year()
+    sim.in_shortfall, sim.shortfall_severity = sim._evaluate_shortfall()
+    sim.effective_sigma = sim._calculate_effective_sigma()
+    return sim
+
+
+def test_season_productivities(seed: int = 3) -> bool:
+    """Stacked productivity and access totals match single months exactly."""
+    sim = warmed_up(seed)
+    env = sim.environment
+    access = sim.band_access[60.0]
+
+    ok = True
+    for months in [(3, 4, 5), (6, 7, 8), (9, 10, 11), (12, 1, 2)]:
+        stacked = env.get_season_productivities(months)
+        stacked_values = access.zone_values(stacked)
+        for k, month in enumerate(months):
+            env.month = month
+            productivity = env.get_patch_productivities()
+            ok &= np.array_equal(stacked[k], productivity)
+            ok &= np.array_equal(stacked_values[k], access.zone_values(productivity))
+
+    print(f"  season productivities exact: {ok}")
+    return bool(ok)
+
+
+def test_deterministic_seasons(seeds=(3, 7, 11)) -> bool:
+    """Spring and fall give bit-identical resources under both kernels."""
+    ok = True
+    for seed in seeds:
+        monthly = warmed_up(seed)
+        seasonal = copy.deepcopy(monthly)
+
+        bs = BandArrays.from_bands(seasonal.bands)
+        seasonal._run_spring_season(bs)
+        for month in (3, 4, 5):
+            monthly.environment.month = month
+            monthly._run_spring_dispersal()
+        spring_ok = np.array_equal(bs.resources, [b.resources for b in monthly.bands])
+
+        seasonal._run_fall_season(bs)
+        for month in (9, 10, 11):
+            monthly.environment.month = month
+            monthly._run_fall_dispersal()
+        fall_ok = np.array_equal(bs.resources, [b.resources for b in monthly.bands])
+
+        print(f"  seed {seed}: spring exact={spring_ok}, fall exact={fall_ok}")
+        ok &= spring_ok and fall_ok
+
+    return bool(ok)
+
+
+def test_bookkeeping(seed: int = 5, years: int = 30) -> bool:
+    """Histories, memory and site state have the monthly kernel's shape."""
+    reference = make_simulation(seed, years, "monthly")
+    sim = make_simulation(seed, years, "seasonal")
+    for _ in range(years):
+        reference.step_year()
+        sim.step_year()
+
+    checks = {
+        'fitness records': all(b.n_fitness_years == 3 * years for b in sim.bands),
+        'strategy records': all(len(b.strategy_history) == len(r.strategy_history)
+                                for b, r in zip(sim.bands, reference.bands)),
+        'attendance records': all(len(b.aggregation_history) == len(r.aggregation_history)
+                                  for b, r in zip(sim.bands, reference.bands)),
+        'last attendance': (sum(b.last_aggregated for b in sim.bands) ==
+                            sim.aggregation_site.n_attending),
+        'strategy = attendance': all(
+            b.last_aggregated == (b.strategy.value == "aggregator") for b in sim.bands
+        ),
+        'monument records': (len(sim.aggregation_site.monument_history) ==
+                             len(reference.aggregation_site.monument_history)),
+        'month': (sim.month, sim.environment.month) == (reference.month,
+                                                         reference.environment.month),
+        'yearly states': len(sim.results.yearly_states) == years,
+    }
+
+    for name, passed in checks.items():
+        print(f"  {name}: {passed}")
+    return all(checks.values())
+
+
+def run_kernel(step_kernel: str, seeds, duration: int):
+    """Post-burn-in summaries (n_seeds, n_metrics) and wall time of one kernel."""
+    summaries = []
+    start = time.time()
+    for seed in seeds:
+        results = make_simulation(seed, duration, step_kernel).run()
+        summaries.append([getattr(results, name) for name in SUMMARY_METRICS])
+    return np.array(summaries, dtype=float), time.time() - start
+
+
+def test_distribution(n_seeds: int = 24, duration: int = 200,
+                      z_max: float = 3.5) -> bool:
+    """Post-burn-in summaries of both kernels agree over many seeds."""
+    seeds = range(100, 100 + n_seeds)
+    monthly, t_monthly = run_kernel("monthly", seeds, duration)
+    seasonal, t_seasonal = run_kernel("seasonal", seeds, duration)
+
+    print(f"  {'metric':<26} {'monthly':>12} {'seasonal':>12} {'z':>7}")
+    ok = True
+    for k, name in enumerate(SUMMARY_METRICS):
+        diff = seasonal[:, k].mean() - monthly[:, k].mean()
+        se = np.sqrt((monthly[:, k].var(ddof=1) + seasonal[:, k].var(ddof=1)) / n_seeds)
+        z = diff / se if se > 0 else 0.0
+        ok &= abs(z) <= z_max
+        print(f"  {name:<26} {monthly[:, k].mean():>12.4f} "
+              f"{seasonal[:, k].mean():>12.4f} {z:>7.2f}")
+
+    print(f"  time: monthly {t_monthly:.1f}s, seasonal {t_seasonal:.1f}s "
+          f"({t_monthly / t_seasonal:.1f}x)")
+    return bool(ok)
+
+
+def main():
+    """Run all equivalence checks."""
+    print("Seasonal vs monthly step kernel")
+    print("=" * 60)
+
+    tests = [
+        ("Season productivities", test_season_productivities),
+        ("Deterministic seasons", test_deterministic_seasons),
+        ("Bookkeeping", test_bookkeeping),
+        ("Distribution", test_distribution),
+    ]
+
+    failed = []
+    for name, test in tests:
+        print(f"\n{name}")
+        if not test():
+            failed.append(name)
+
+    print("\n" + "=" * 60)
+    if failed:
+        print(f"FAILED: {', '.join(failed)}")
+        sys.exit(1)
+    print("All checks passed")
+
+
+if __name__ == "__main__":
+    main()
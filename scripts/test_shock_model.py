@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Checks for the zone-factor patch shock model.
+
+EnvironmentConfig(shock_model="zone_factor") draws annual patch shocks
+from one common factor per zone plus per-patch noise instead of the dense
+patch covariance. This script runs validate_shock_model on several
+landscapes and checks that:
+
+1. The factor model's exact covariance equals the dense matrix (to
+   rounding error)
+2. The empirical covariance of sampled shocks is within sampling error
+   of the dense matrix: every entry within SAMPLING_Z standard errors,
+   where one standard error is at most sqrt(2 / n_samples) for unit
+   variances
+
+Exits with status 1 if any check fails.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+
+from poverty_point.environment import EnvironmentConfig, validate_shock_model
+
+
+MODEL_TOL = 1e-12
+SAMPLING_Z = 6.0
+N_SAMPLES = 20000
+
+LANDSCAPES = {
+    'default': EnvironmentConfig(),
+    'large (4x patches)': EnvironmentConfig(n_aquatic_patches=40,
+                                            n_terrestrial_patches=48,
+                                            n_mast_patches=32,
+                                            n_ecotone_patches=20),
+}
+
+
+def test_landscape(name: str, config: EnvironmentConfig,
+                   seeds=(1, 7, 42)) -> bool:
+    """Exact and sampled covariance errors of one landscape."""
+    sampling_tol = SAMPLING_Z * np.sqrt(2.0 / N_SAMPLES)
+
+    ok = True
+    for seed in seeds:
+        errors = validate_shock_model(config, n_samples=N_SAMPLES, seed=seed)
+        exact_ok = (errors['model_max_abs_error'] <= MODEL_TOL and
+                    errors['model_relative_frobenius_error'] <= MODEL_TOL)
+        sampled_ok = errors['max_abs_error'] <= sampling_tol
+        print(f"  {name}, seed {seed}: "
+              f"exact max {errors['model_max_abs_error']:.1e}, "
+              f"sampled max {errors['max_abs_error']:.3f} "
+              f"(tol {sampling_tol:.3f}), "
+              f"sampled rel. Frobenius {errors['relative_frobenius_error']:.3f}")
+        ok &= exact_ok and sampled_ok
+
+    return bool(ok)
+
+
+def main():
+    """Run the shock model checks on every landscape."""
+    print("Zone-factor vs dense shock model")
+    print("=" * 60)
+
+    failed = []
+    for name, config in LANDSCAPES.items():
+        print(f"\n{name}")
+        if not test_landscape(name, config):
+            failed.append(name)
+
+    print("\n" + "=" * 60)
+    if failed:
+        print(f"FAILED: {', '.join(failed)}")
+        sys.exit(1)
+    print("All checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,12 @@ Agent definitions for the Poverty Point ABM.
 Agents:
 - Band: Mobile hunter-gatherer group
 - AggregationSite: Location where bands gather
+- ObligationNetwork: Reciprocal obligations between bands
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Deque
 from enum import Enum
 import numpy as np
 
@@ -23,6 +25,66 @@ class Strategy(Enum):
     INDEPENDENT = "independent"    # Remains dispersed
 
 
+class HistoryRetention(Enum):
+    """How much per-year history a band keeps."""
+    NONE = "none"        # Only running memory state, no history lists
+    WINDOW = "window"    # Last history_window years
+    FULL = "full"        # Entire run (grows with duration)
+
+
+# Number of recent years compared against the long-term mean in the
+# memory effect of Band.decide_strategy
+MEMORY_WINDOW = 5
+
+# Size of the memory effect on the fitness difference
+MEMORY_ADJUSTMENT = 0.05
+
+# Soft-max temperature of the strategy choice (higher = more deterministic)
+DECISION_TEMPERATURE = 10.0
+
+
+def memory_adjustment_array(n_fitness_years, recent_fitness, fitness_sum,
+                            last_aggregated):
+    """
+    Memory effect on the fitness difference, for one or many bands.
+
+    Once MEMORY_WINDOW years of fitness are recorded, recent experience
+    reinforces last year's choice if recent fitness beats the long-term
+    mean, and pushes toward switching otherwise. Arguments broadcast.
+
+    Args:
+        n_fitness_years: Years of fitness recorded
+        recent_fitness: Mean fitness of the last MEMORY_WINDOW years
+            (ignored before the window is filled)
+        fitness_sum: Sum of all recorded fitness
+        last_aggregated: Whether the band aggregated last year
+
+    Returns:
+        +MEMORY_ADJUSTMENT or -MEMORY_ADJUSTMENT per band (0.0 before the
+        memory window is filled)
+    """
+    n_fitness_years = np.asarray(n_fitness_years)
+    long_term_fitness = fitness_sum / np.maximum(n_fitness_years, 1)
+    improving = np.asarray(recent_fitness) > long_term_fitness
+    adjustment = np.where(np.asarray(last_aggregated) == improving,
+                          MEMORY_ADJUSTMENT, -MEMORY_ADJUSTMENT)
+    return np.where(n_fitness_years >= MEMORY_WINDOW, adjustment, 0.0)
+
+
+def aggregation_probability(fitness_diff):
+    """
+    Probability of choosing to aggregate given the fitness difference.
+
+    Args:
+        fitness_diff: E[W_agg] - E[W_ind] plus memory adjustment (scalar
+            or array)
+
+    Returns:
+        Sigmoid of DECISION_TEMPERATURE × fitness_diff
+    """
+    return 1.0 / (1.0 + np.exp(-DECISION_TEMPERATURE * fitness_diff))
+
+
 @dataclass
 class Band:
     """
@@ -45,13 +107,52 @@ class Band:
     monument_contributions: float = 0.0     # Total monument investment
     exotic_goods: int = 0                   # Exotic items held
 
-    # Social network (band_id -> obligation strength)
+    # Social network (band_id -> obligation strength). The simulations
+    # keep all bands' obligations in a shared ObligationNetwork instead.
     obligations: Dict[int, float] = field(default_factory=dict)
 
-    # History tracking
+    # History tracking (contents depend on history_retention)
     aggregation_history: List[bool] = field(default_factory=list)
     fitness_history: List[float] = field(default_factory=list)
     strategy_history: List[Strategy] = field(default_factory=list)
+    history_retention: HistoryRetention = HistoryRetention.FULL
+    history_window: int = MEMORY_WINDOW
+
+    # Running memory state (O(1) per year under any retention policy)
+    last_aggregated: bool = False
+    last_fitness: Optional[float] = None
+    fitness_sum: float = 0.0
+    n_fitness_years: int = 0
+    recent_fitness: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=MEMORY_WINDOW)
+    )
+
+    def __post_init__(self) -> None:
+        if self.history_retention == HistoryRetention.WINDOW:
+            window = self.history_window
+            self.aggregation_history = deque(self.aggregation_history, maxlen=window)
+            self.fitness_history = deque(self.fitness_history, maxlen=window)
+            self.strategy_history = deque(self.strategy_history, maxlen=window)
+
+    def record_strategy(self, strategy: Strategy) -> None:
+        """Record this year's strategy choice."""
+        if self.history_retention != HistoryRetention.NONE:
+            self.strategy_history.append(strategy)
+
+    def record_aggregation(self, attended: bool) -> None:
+        """Record whether the band attended aggregation this year."""
+        self.last_aggregated = attended
+        if self.history_retention != HistoryRetention.NONE:
+            self.aggregation_history.append(attended)
+
+    def record_fitness(self, fitness: float) -> None:
+        """Record this year's realized fitness and update running means."""
+        self.last_fitness = fitness
+        self.fitness_sum += fitness
+        self.n_fitness_years += 1
+        self.recent_fitness.append(fitness)
+        if self.history_retention != HistoryRetention.NONE:
+            self.fitness_history.append(fitness)
 
     def decide_strategy(self,
                         expected_n: float,
@@ -78,36 +179,33 @@ class Band:
         E_W_agg = W_aggregator(sigma, epsilon, expected_n, params)
         E_W_ind = W_independent(sigma, params)
 
-        # Base fitness difference
+        # Base fitness difference plus memory effect
         fitness_diff = E_W_agg - E_W_ind
-
-        # Memory effect: recent experience influences decision
-        if len(self.fitness_history) >= 5:
-            recent_fitness = np.mean(self.fitness_history[-5:])
-            long_term_fitness = np.mean(self.fitness_history)
-
-            if self.aggregation_history[-1]:
-                # Was aggregator last year
-                if recent_fitness > long_term_fitness:
-                    fitness_diff += 0.05  # Positive reinforcement
-                else:
-                    fitness_diff -= 0.05  # Negative reinforcement
-            else:
-                # Was independent last year
-                if recent_fitness > long_term_fitness:
-                    fitness_diff -= 0.05  # Stay independent
-                else:
-                    fitness_diff += 0.05  # Try aggregating
+        fitness_diff += self.memory_adjustment()
 
         # Probabilistic choice (sigmoid with temperature)
-        temperature = 10.0  # Higher = more deterministic
-        p_aggregate = 1.0 / (1.0 + np.exp(-temperature * fitness_diff))
+        p_aggregate = aggregation_probability(fitness_diff)
 
         if rng.random() < p_aggregate:
             return Strategy.AGGREGATOR
         else:
             return Strategy.INDEPENDENT
 
+    def memory_adjustment(self) -> float:
+        """
+        Memory effect on the fitness difference in decide_strategy
+        (see memory_adjustment_array).
+
+        Returns:
+            +0.05 or -0.05 (0.0 before the memory window is filled)
+        """
+        if self.n_fitness_years < MEMORY_WINDOW:
+            return 0.0
+
+        recent_fitness = sum(self.recent_fitness) / len(self.recent_fitness)
+        return float(memory_adjustment_array(self.n_fitness_years, recent_fitness,
+                                             self.fitness_sum, self.last_aggregated))
+
     def calculate_travel_cost(self,
                               destination: Tuple[float, float],
                               cost_per_km: float = 0.0005) -> float:
@@ -279,6 +377,230 @@ class Band:
         return deaths
 
 
+def decide_strategies(bands: List[Band],
+                      fitness_diff: float,
+                      rng: np.random.Generator) -> np.ndarray:
+    """
+    Strategy choice of many bands at once.
+
+    Same rule as Band.decide_strategy, with the fitness difference
+    E[W_agg] - E[W_ind] computed once by the caller and all uniform
+    variates drawn in a single call.
+
+    Args:
+        bands: Deciding bands
+        fitness_diff: Expected fitness difference shared by all bands
+        rng: Random number generator
+
+    Returns:
+        Mask of bands choosing AGGREGATOR, in band order
+    """
+    n = len(bands)
+    n_years = np.fromiter((b.n_fitness_years for b in bands), dtype=np.int64, count=n)
+    recent = np.fromiter((sum(b.recent_fitness) / len(b.recent_fitness)
+                          if b.recent_fitness else 0.0 for b in bands),
+                         dtype=float, count=n)
+    fitness_sum = np.fromiter((b.fitness_sum for b in bands), dtype=float, count=n)
+    last_aggregated = np.fromiter((b.last_aggregated for b in bands), dtype=bool, count=n)
+
+    adjustment = memory_adjustment_array(n_years, recent, fitness_sum, last_aggregated)
+    p_aggregate = aggregation_probability(fitness_diff + adjustment)
+    return rng.random(n) < p_aggregate
+
+
+def apply_shortfall_mortality(sizes: np.ndarray,
+                              mortality_rate: np.ndarray,
+                              rng: np.random.Generator) -> np.ndarray:
+    """
+    Shortfall mortality for a whole population in one binomial draw.
+
+    Population-level form of Band.suffer_shortfall.
+
+    Args:
+        sizes: Band sizes
+        mortality_rate: Per-band mortality rate (vulnerability × σ)
+        rng: Random number generator
+
+    Returns:
+        New band sizes (at least 1)
+    """
+    deaths = rng.binomial(sizes, mortality_rate)
+    return np.maximum(1, sizes - deaths)
+
+
+def apply_reproduction(sizes: np.ndarray,
+                       fitness: np.ndarray,
+                       resources: np.ndarray,
+                       birth_rate: float,
+                       death_rate: float,
+                       min_size: int,
+                       max_size: int,
+                       rng: np.random.Generator) -> np.ndarray:
+    """
+    Births, baseline deaths and band-size limits for a whole population.
+
+    Population-level form of Band.reproduce followed by the simulations'
+    min/max band-size clamp: births and deaths are each one binomial draw
+    over all bands.
+
+    Args:
+        sizes: Band sizes
+        fitness: Realized fitness per band
+        resources: Resource holdings per band
+        birth_rate: Base birth rate
+        death_rate: Base death rate
+        min_size: Minimum band size
+        max_size: Maximum band size
+        rng: Random number generator
+
+    Returns:
+        New band sizes
+    """
+    effective_birth_rate = birth_rate * fitness * (0.5 + resources)
+    births = rng.binomial(sizes, effective_birth_rate)
+    deaths = rng.binomial(sizes, death_rate)
+
+    sizes = np.maximum(1, sizes + births - deaths)
+    return np.clip(sizes, min_size, max_size)
+
+
+class ObligationNetwork:
+    """
+    Reciprocal obligations between bands as one sparse directed graph.
+
+    Replaces the per-band obligation dicts with edge arrays owned by the
+    simulation, so forming, calling and pruning obligations are bulk
+    operations. Edges are kept sorted by key = source * n_nodes + target,
+    which makes each band's outgoing edges a contiguous slice.
+
+    Semantics match Band.form_obligation and Band.call_obligation:
+    forming adds strength (capped at 1.0), calling returns help of
+    min(need, 0.5 * strength), weakens the edge by 0.7 and removes it
+    once it falls below 0.05.
+    """
+
+    def __init__(self, n_nodes: int,
+                 max_strength: float = 1.0,
+                 min_strength: float = 0.05):
+        """
+        Args:
+            n_nodes: Number of bands (node ids are 0 .. n_nodes - 1)
+            max_strength: Cap on obligation strength
+            min_strength: Edges weaker than this are removed when pruned
+        """
+        self.n_nodes = n_nodes
+        self.max_strength = max_strength
+        self.min_strength = min_strength
+
+        self.keys = np.empty(0, dtype=np.int64)
+        self.strength = np.empty(0, dtype=float)
+
+    def __len__(self) -> int:
+        """Number of obligations (edges)."""
+        return len(self.keys)
+
+    @property
+    def source(self) -> np.ndarray:
+        """Source band of each edge."""
+        return self.keys // self.n_nodes
+
+    @property
+    def target(self) -> np.ndarray:
+        """Target (partner) band of each edge."""
+        return self.keys % self.n_nodes
+
+    def _edge_ranges(self, source: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Start and end edge index of each source's outgoing slice."""
+        base = np.asarray(source, dtype=np.int64) * self.n_nodes
+        return (np.searchsorted(self.keys, base),
+                np.searchsorted(self.keys, base + self.n_nodes))
+
+    def out_degree(self, source: np.ndarray) -> np.ndarray:
+        """Number of partners of each source band."""
+        start, end = self._edge_ranges(source)
+        return end - start
+
+    def partners(self, band_id: int) -> Dict[int, float]:
+        """Obligations of one band as a partner -> strength dict."""
+        start, end = self._edge_ranges(np.array([band_id]))
+        edges = slice(start[0], end[0])
+        return dict(zip(self.target[edges].tolist(), self.strength[edges].tolist()))
+
+    def form(self, source: np.ndarray, target: np.ndarray,
+             strength: float = 0.1) -> None:
+        """
+        Form or strengthen obligations source -> target in bulk.
+
+        Args:
+            source: Band ids forming obligations
+            target: Partner band ids (same length as source)
+            strength: Strength added to each obligation
+        """
+        keys = (np.asarray(source, dtype=np.int64) * self.n_nodes +
+                np.asarray(target, dtype=np.int64))
+        if len(keys) == 0:
+            return
+
+        # Merge repeated pairs; with positive increments, summing then
+        # capping equals capping after each increment
+        keys, inverse = np.unique(keys, return_inverse=True)
+        added = np.bincount(inverse, minlength=len(keys)) * strength
+
+        pos = np.searchsorted(self.keys, keys)
+        exists = pos < len(self.keys)
+        exists[exists] = self.keys[pos[exists]] == keys[exists]
+
+        self.strength[pos[exists]] = np.minimum(
+            self.max_strength, self.strength[pos[exists]] + added[exists]
+        )
+
+        new = ~exists
+        self.keys = np.insert(self.keys, pos[new], keys[new])
+        self.strength = np.insert(self.strength, pos[new],
+                                  np.minimum(self.max_strength, added[new]))
+
+    def call(self, source: np.ndarray, need: float,
+             u: np.ndarray) -> np.ndarray:
+        """
+        Each source band calls on one uniformly chosen partner.
+
+        Args:
+            source: Distinct band ids calling obligations
+            need: Help requested per band
+            u: Uniform [0, 1) variate per source, used to pick the partner
+
+        Returns:
+            Help received by each source (0 for bands without partners)
+        """
+        start, end = self._edge_ranges(source)
+        count = end - start
+        help_received = np.zeros(len(count))
+
+        linked = count > 0
+        if not linked.any():
+            return help_received
+
+        edges = start[linked] + (u[linked] * count[linked]).astype(np.int64)
+        help_received[linked] = np.minimum(need, self.strength[edges] * 0.5)
+
+        self.strength[edges] *= 0.7
+        if (self.strength[edges] < self.min_strength).any():
+            self.prune()
+
+        return help_received
+
+    def decay(self, factor: float) -> None:
+        """Weaken every obligation by factor and prune weak ones."""
+        self.strength *= factor
+        self.prune()
+
+    def prune(self) -> None:
+        """Remove obligations weaker than min_strength."""
+        keep = self.strength >= self.min_strength
+        self.keys = self.keys[keep]
+        self.strength = self.strength[keep]
+
+
 @dataclass
 class AggregationSite:
     """
@@ -297,13 +619,23 @@ class AggregationSite:
     monument_history: List[float] = field(default_factory=list)
 
     # Current aggregation state
-    attending_bands: List[int] = field(default_factory=list)
     current_population: int = 0
 
     # Exotic goods
     total_exotics: int = 0
     exotic_sources: Dict[str, int] = field(default_factory=dict)
 
+    # Attendance index: a membership mask over band ids, the dense list of
+    # attending ids, and each attendee's position in that list. Arrays grow
+    # on demand, so the site does not need to know the band count up front.
+    _is_attending: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=bool), init=False, repr=False)
+    _attending_ids: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.int64), init=False, repr=False)
+    _position: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.int64), init=False, repr=False)
+    _n_attending: int = field(default=0, init=False, repr=False)
+
     def calculate_cooperation_benefits(self,
                                        params: SimulationParameters) -> float:
         """
@@ -315,8 +647,27 @@ class AggregationSite:
         Returns:
             Cooperation benefit multiplier
         """
-        n = len(self.attending_bands)
-        return cooperation_benefit(n, params.cooperation)
+        return cooperation_benefit(self.n_attending, params.cooperation)
+
+    def _reserve(self, max_band_id: int, n_attending: int) -> None:
+        """Grow the index arrays to hold the given band id and count."""
+        if max_band_id >= len(self._is_attending):
+            capacity = max(max_band_id + 1, 2 * len(self._is_attending))
+            mask = np.zeros(capacity, dtype=bool)
+            mask[:len(self._is_attending)] = self._is_attending
+            position = np.zeros(capacity, dtype=np.int64)
+            position[:len(self._position)] = self._position
+            self._is_attending, self._position = mask, position
+        if n_attending > len(self._attending_ids):
+            capacity = max(n_attending, 2 * len(self._attending_ids))
+            ids = np.zeros(capacity, dtype=np.int64)
+            ids[:self._n_attending] = self._attending_ids[:self._n_attending]
+            self._attending_ids = ids
+
+    def is_attending(self, band_id: int) -> bool:
+        """Whether a band is attending this aggregation (O(1))."""
+        return (band_id < len(self._is_attending)
+                and bool(self._is_attending[band_id]))
 
     def add_attending_band(self, band: Band) -> None:
         """
@@ -325,10 +676,65 @@ class AggregationSite:
         Args:
             band: Attending band
         """
-        if band.band_id not in self.attending_bands:
-            self.attending_bands.append(band.band_id)
-            self.current_population += band.size
-            self.total_exotics += band.exotic_goods
+        if self.is_attending(band.band_id):
+            return
+        self._reserve(band.band_id, self._n_attending + 1)
+        self._is_attending[band.band_id] = True
+        self._position[band.band_id] = self._n_attending
+        self._attending_ids[self._n_attending] = band.band_id
+        self._n_attending += 1
+        self.current_population += band.size
+        self.total_exotics += band.exotic_goods
+
+    def add_attending_bands(self,
+                            band_ids: np.ndarray,
+                            sizes: np.ndarray,
+                            exotic_goods: np.ndarray) -> None:
+        """
+        Record many attending bands at once.
+
+        Bands already attending are ignored, as in add_attending_band.
+
+        Args:
+            band_ids: Distinct band ids
+            sizes: Size of each band
+            exotic_goods: Exotic goods held by each band
+        """
+        band_ids = np.asarray(band_ids, dtype=np.int64)
+        if len(band_ids) == 0:
+            return
+        self._reserve(int(band_ids.max()), self._n_attending + len(band_ids))
+        new = ~self._is_attending[band_ids]
+        band_ids = band_ids[new]
+        start, stop = self._n_attending, self._n_attending + len(band_ids)
+
+        self._is_attending[band_ids] = True
+        self._position[band_ids] = np.arange(start, stop)
+        self._attending_ids[start:stop] = band_ids
+        self._n_attending = stop
+        self.current_population += int(np.asarray(sizes)[new].sum())
+        self.total_exotics += int(np.asarray(exotic_goods)[new].sum())
+
+    def sample_partners(self,
+                        band_ids: np.ndarray,
+                        rng: np.random.Generator) -> np.ndarray:
+        """
+        Draw one uniformly chosen other attendee for each given attendee.
+
+        Each draw is O(1): an index into the dense attendee list that skips
+        the caller's own position. Requires at least two attendees.
+
+        Args:
+            band_ids: Attending band ids
+            rng: Random number generator
+
+        Returns:
+            Partner band id for each entry of band_ids
+        """
+        band_ids = np.asarray(band_ids, dtype=np.int64)
+        offset = rng.integers(0, self._n_attending - 1, len(band_ids))
+        offset += offset >= self._position[band_ids]  # Skip self
+        return self._attending_ids[offset]
 
     def record_construction(self, investment: float) -> None:
         """
@@ -342,19 +748,184 @@ class AggregationSite:
 
     def reset_annual_state(self) -> None:
         """Reset attendance for new year."""
-        self.attending_bands = []
+        self._is_attending[self.attending_bands] = False
+        self._n_attending = 0
         self.current_population = 0
 
+    @property
+    def attending_bands(self) -> np.ndarray:
+        """Ids of attending bands, in arrival order (read-only view)."""
+        ids = self._attending_ids[:self._n_attending]
+        ids.flags.writeable = False
+        return ids
+
     @property
     def n_attending(self) -> int:
         """Number of bands currently attending."""
-        return len(self.attending_bands)
+        return self._n_attending
+
+
+class PopulationCounters:
+    """
+    Population totals kept up to date as band state changes.
+
+    The simulations record the number of aggregators, total population,
+    total exotics and mean last fitness per strategy every year. Rather
+    than scanning every band, they report each change here (strategy
+    switches, size changes from reproduction, shortfall mortality and
+    size limits, exotic acquisition, fitness records), so reading the
+    totals is O(1). check() compares the counters with a full scan.
+    """
+
+    def __init__(self,
+                 sizes: np.ndarray,
+                 is_aggregator: np.ndarray,
+                 exotic_goods: np.ndarray,
+                 last_fitness: np.ndarray):
+        """
+        Start the counters from band state arrays.
+
+        Args:
+            sizes: Band sizes
+            is_aggregator: Mask of bands whose strategy is AGGREGATOR
+            exotic_goods: Exotic goods held per band
+            last_fitness: Last recorded fitness per band (NaN if none)
+        """
+        is_aggregator = np.asarray(is_aggregator, dtype=bool)
+        last_fitness = np.asarray(last_fitness, dtype=float)
+        has_fitness = ~np.isnan(last_fitness)
+
+        self.n_bands = len(is_aggregator)
+        self.n_aggregators = int(is_aggregator.sum())
+        self.total_population = int(np.sum(sizes))
+        self.total_exotics = int(np.sum(exotic_goods))
+        self.fitness_sum = {
+            Strategy.AGGREGATOR: float(last_fitness[is_aggregator & has_fitness].sum()),
+            Strategy.INDEPENDENT: float(last_fitness[~is_aggregator & has_fitness].sum()),
+        }
+        self.fitness_count = {
+            Strategy.AGGREGATOR: int((is_aggregator & has_fitness).sum()),
+            Strategy.INDEPENDENT: int((~is_aggregator & has_fitness).sum()),
+        }
+
+    @classmethod
+    def from_bands(cls, bands: List[Band]) -> "PopulationCounters":
+        """
+        Count band agents with one full scan.
+
+        Args:
+            bands: Band objects
+
+        Returns:
+            PopulationCounters matching the bands
+        """
+        n = len(bands)
+        return cls(
+            sizes=np.fromiter((b.size for b in bands), dtype=np.int64, count=n),
+            is_aggregator=np.fromiter((b.strategy == Strategy.AGGREGATOR for b in bands),
+                                      dtype=bool, count=n),
+            exotic_goods=np.fromiter((b.exotic_goods for b in bands),
+                                     dtype=np.int64, count=n),
+            last_fitness=np.fromiter(
+                (np.nan if b.last_fitness is None else b.last_fitness for b in bands),
+                dtype=float, count=n
+            ),
+        )
+
+    @property
+    def n_independents(self) -> int:
+        """Number of bands whose strategy is INDEPENDENT."""
+        return self.n_bands - self.n_aggregators
+
+    @property
+    def mean_band_size(self) -> float:
+        """Mean band size (0 if there are no bands)."""
+        return self.total_population / self.n_bands if self.n_bands > 0 else 0.0
+
+    def mean_fitness(self, strategy: Strategy) -> float:
+        """Mean last fitness of bands with a strategy (0 if none recorded)."""
+        count = self.fitness_count[strategy]
+        return self.fitness_sum[strategy] / count if count > 0 else 0.0
+
+    def strategy_changed(self, old: Strategy, new: Strategy,
+                         last_fitness: Optional[float]) -> None:
+        """
+        A band switched strategy.
+
+        Args:
+            old: Previous strategy
+            new: New strategy
+            last_fitness: The band's last recorded fitness (None if none)
+        """
+        if old == new:
+            return
+        self.n_aggregators += 1 if new == Strategy.AGGREGATOR else -1
+        if last_fitness is not None:
+            self.fitness_sum[old] -= last_fitness
+            self.fitness_count[old] -= 1
+            self.fitness_sum[new] += last_fitness
+            self.fitness_count[new] += 1
+
+    def size_changed(self, old_size: int, new_size: int) -> None:
+        """A band's size changed from old_size to new_size."""
+        self.total_population += new_size - old_size
+
+    def exotics_added(self, n: int = 1) -> None:
+        """A band acquired n exotic goods."""
+        self.total_exotics += n
+
+    def fitness_recorded(self, strategy: Strategy,
+                         old_fitness: Optional[float], new_fitness: float) -> None:
+        """
+        A band recorded a new fitness value.
+
+        Args:
+            strategy: The band's current strategy
+            old_fitness: Its previous last fitness (None if none)
+            new_fitness: The fitness being recorded
+        """
+        if old_fitness is None:
+            self.fitness_count[strategy] += 1
+            self.fitness_sum[strategy] += new_fitness
+        else:
+            self.fitness_sum[strategy] += new_fitness - old_fitness
+
+    def check(self, bands: List[Band], rtol: float = 1e-9) -> None:
+        """
+        Compare the counters with a full scan of the bands.
+
+        Integer totals must match exactly; fitness means, which are
+        updated by running sums, must match to rtol.
+
+        Args:
+            bands: Band objects the counters describe
+            rtol: Relative tolerance for the fitness means
+
+        Raises:
+            RuntimeError: If any counter disagrees with the scan
+        """
+        scan = PopulationCounters.from_bands(bands)
+        mismatched = [
+            name for name in ('n_bands', 'n_aggregators', 'total_population',
+                              'total_exotics', 'fitness_count')
+            if getattr(self, name) != getattr(scan, name)
+        ]
+        mismatched += [
+            f"mean_fitness[{strategy.value}]" for strategy in Strategy
+            if not np.isclose(self.mean_fitness(strategy), scan.mean_fitness(strategy),
+                              rtol=rtol, atol=0.0)
+        ]
+        if mismatched:
+            raise RuntimeError(f"Population counters out of sync: "
+                               f"{', '.join(mismatched)}")
 
 
 def create_bands(n_bands: int,
                  initial_size: int,
                  region_size: float,
-                 rng: np.random.Generator) -> List[Band]:
+                 rng: np.random.Generator,
+                 history_retention: HistoryRetention = HistoryRetention.FULL,
+                 history_window: int = MEMORY_WINDOW) -> List[Band]:
     """
     Create initial population of bands.
 
@@ -365,6 +936,8 @@ def create_bands(n_bands: int,
         initial_size: Initial size per band
         region_size: Region diameter (km)
         rng: Random number generator
+        history_retention: How much per-year history each band keeps
+        history_window: Years kept under HistoryRetention.WINDOW
 
     Returns:
         List of Band objects
@@ -388,7 +961,9 @@ def create_bands(n_bands: int,
             size=initial_size + rng.integers(-5, 6),  # Some variation
             home_location=(x, y),
             strategy=strategy,
-            resources=0.4 + 0.2 * rng.random()  # Initial resources
+            resources=0.4 + 0.2 * rng.random(),  # Initial resources
+            history_retention=history_retention,
+            history_window=history_window
         )
 
         bands.append(band)
@@ -0,0 +1,927 @@
+"""
+Replicate-batched simulation engines for the Poverty Point ABM.
+
+Sweeps run many replicates (seeds) of the same parameter point. The
+engines in this module advance R independent replicates together, with
+band state held in (R, n_bands) arrays, so each phase of the annual cycle
+is one array operation across all replicates and bands:
+
+- BatchedSimulation: replicates of core_simulation.PovertyPointSimulation
+- BatchedIntegratedSimulation: replicates of
+  integrated_simulation.IntegratedSimulation
+
+Each replicate keeps its own random number generator, seeded exactly as
+the serial engine would be, so initial conditions (band placement, patch
+layout, aggregation site) are identical to a serial run with that seed.
+Within a run, draws are made per phase rather than per band, so
+trajectories match the serial engines in distribution, not bit for bit.
+"""
+
+import numpy as np
+from dataclasses import replace
+from typing import List, Optional, Sequence, Tuple
+
+from .parameters import (
+    SimulationParameters, default_parameters,
+    W_aggregator_array, W_independent_array, critical_threshold
+)
+from .agents import (
+    ObligationNetwork, aggregation_probability, create_bands,
+    memory_adjustment_array
+)
+from .core_simulation import SimulationResults, YearlyState
+from .environment import (
+    AccessMatrix, EnvironmentConfig, ResourceZone, ZONES, ZONE_INDEX, SEASONAL_TABLE
+)
+from .environmental_scenarios import ShortfallParams
+from .integrated_simulation import (
+    IntegratedSimulation, IntegratedResults, IntegratedState, effective_sigma
+)
+from .vectorized_simulation import BandArrays
+from .timeseries import RollingWindow, make_state_series
+
+
+# =============================================================================
+# Per-replicate random draws
+# =============================================================================
+
+def _uniform(rngs: Sequence[np.random.Generator], n: int) -> np.ndarray:
+    """Draw an (R, n) block of uniforms, one row per replicate stream."""
+    return np.stack([rng.random(n) for rng in rngs])
+
+
+def _binomial(rngs: Sequence[np.random.Generator],
+              n: np.ndarray, p: np.ndarray,
+              active: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Draw (R, n_bands) binomials, row r from replicate stream r.
+
+    Rows where active is False are left at zero without drawing.
+    """
+    p = np.broadcast_to(p, n.shape)
+    out = np.zeros(n.shape, dtype=np.int64)
+    for r, rng in enumerate(rngs):
+        if active is None or active[r]:
+            out[r] = rng.binomial(n[r], p[r])
+    return out
+
+
+# =============================================================================
+# Shared band-level kernels
+# =============================================================================
+
+def _memory_adjustment(bs: BandArrays) -> np.ndarray:
+    """
+    Memory-effect adjustment to the fitness difference (see
+    Band.decide_strategy), for every band in every replicate.
+    """
+    return memory_adjustment_array(bs.n_fitness, bs.fitness_recent.mean(axis=-1),
+                                   bs.fitness_sum, bs.attended)
+
+
+def _choose_strategies(bs: BandArrays, fitness_diff: np.ndarray,
+                       rngs: Sequence[np.random.Generator]) -> None:
+    """Soft-max strategy choice (temperature 10) for all bands."""
+    fitness_diff = fitness_diff + _memory_adjustment(bs)
+
+    p_aggregate = aggregation_probability(fitness_diff)
+
+    bs.is_aggregator = _uniform(rngs, bs.n_bands) < p_aggregate
+
+
+def _invest_and_acquire(bs: BandArrays, attending: np.ndarray,
+                        investing: np.ndarray, investment_rate: float,
+                        rngs: Sequence[np.random.Generator]) -> np.ndarray:
+    """
+    Monument investment and exotic acquisition for attending bands.
+
+    Args:
+        bs: Band arrays (modified in place)
+        attending: (R, n) mask of attending bands
+        investing: (R, n) mask of bands that invest in the monument
+        investment_rate: Fraction of resources invested (C_signal)
+        rngs: Replicate streams
+
+    Returns:
+        (R,) total construction per replicate
+    """
+    n = bs.n_bands
+
+    variation = 0.8 + 0.4 * _uniform(rngs, n)
+    investment = np.where(
+        investing,
+        bs.size * investment_rate * bs.resources * variation,
+        0.0
+    )
+    bs.monument_contributions += investment
+    bs.prestige += investment * 0.1
+
+    acquisition_cost = 0.1
+    p_acquire = 0.3 * (1 + bs.prestige / (1 + bs.prestige))
+    acquired = (attending &
+                (bs.resources >= acquisition_cost + 0.2) &
+                (_uniform(rngs, n) < p_acquire))
+    bs.exotic_goods += acquired
+    bs.resources -= acquisition_cost * acquired
+    bs.prestige += 0.15 * acquired
+
+    return investment.sum(axis=-1)
+
+
+def _form_obligations(network: ObligationNetwork, attending: np.ndarray,
+                      rngs: Sequence[np.random.Generator]) -> None:
+    """
+    Each attending band forms an obligation (p = 0.3) with a uniformly
+    chosen other attendee of the same replicate.
+
+    The network spans all replicates; band b of replicate r is node
+    r * n_bands + b.
+    """
+    R, n = attending.shape
+    counts = attending.sum(axis=1)
+
+    forming = attending & (_uniform(rngs, n) < 0.3) & (counts[:, None] > 1)
+    u = _uniform(rngs, n)
+    if not forming.any():
+        return
+
+    # Rank of each band among its replicate's attendees, then a random
+    # offset into the other (count - 1) attendees that skips self
+    rank = np.cumsum(attending, axis=1) - 1
+    offset = np.floor(u * (counts[:, None] - 1)).astype(np.int64)
+    offset += offset >= rank
+
+    attendees = np.flatnonzero(attending.ravel())
+    start = np.cumsum(counts) - counts
+
+    r_idx, b_idx = np.nonzero(forming)
+    partners = attendees[start[r_idx] + offset[r_idx, b_idx]]
+    network.form(r_idx * n + b_idx, partners)
+
+
+def _call_obligations(network: ObligationNetwork, callers: np.ndarray,
+                      need: float,
+                      rngs: Sequence[np.random.Generator]) -> np.ndarray:
+    """
+    Callers draw help from one uniformly chosen existing partner.
+
+    Args:
+        network: Obligations over all replicates (see _form_obligations)
+        callers: (R, n) mask of bands calling obligations
+        need: Help requested per band
+        rngs: Replicate streams
+
+    Returns:
+        (R, n) help received
+    """
+    u = _uniform(rngs, callers.shape[1])
+    help_received = np.zeros(callers.shape)
+
+    nodes = np.flatnonzero(callers.ravel())
+    if len(nodes) > 0:
+        help_received.ravel()[nodes] = network.call(nodes, need, u.ravel()[nodes])
+
+    return help_received
+
+
+def _reproduce(bs: BandArrays, fitness: np.ndarray,
+               params: SimulationParameters,
+               rngs: Sequence[np.random.Generator]) -> None:
+    """Births, baseline deaths and band-size limits for all bands."""
+    pop = params.population
+
+    effective_birth_rate = pop.birth_rate * fitness * (0.5 + bs.resources)
+    births = _binomial(rngs, bs.size, effective_birth_rate)
+    deaths = _binomial(rngs, bs.size, pop.death_rate)
+
+    size = np.maximum(1, bs.size + births - deaths)
+    bs.size = np.clip(size, pop.min_band_size, pop.max_band_size)
+
+
+def _fitness_by_strategy(bs: BandArrays) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean last-year fitness of aggregators and independents per replicate."""
+    agg = bs.is_aggregator
+    n_agg = agg.sum(axis=-1)
+    n_ind = bs.n_bands - n_agg
+
+    if bs.n_fitness == 0:
+        zeros = np.zeros(len(n_agg))
+        return zeros, zeros
+
+    agg_sum = np.where(agg, bs.last_fitness, 0.0).sum(axis=-1)
+    ind_sum = np.where(agg, 0.0, bs.last_fitness).sum(axis=-1)
+    mean_agg = np.where(n_agg > 0, agg_sum / np.maximum(n_agg, 1), 0.0)
+    mean_ind = np.where(n_ind > 0, ind_sum / np.maximum(n_ind, 1), 0.0)
+    return mean_agg, mean_ind
+
+
+# =============================================================================
+# Core model
+# =============================================================================
+
+class BatchedSimulation:
+    """
+    R runs of PovertyPointSimulation advanced together.
+
+    Runs share params except the seed and, optionally, σ and ε, which
+    may be given per run to simulate a whole σ × ε × replicate block as
+    one tensor. Band state is a stacked BandArrays with (R, n_bands)
+    fields; aggregation-site and shortfall state are (R,) arrays.
+    """
+
+    def __init__(self,
+                 params: Optional[SimulationParameters] = None,
+                 seeds: Optional[Sequence[int]] = None,
+                 sigmas: Optional[Sequence[float]] = None,
+                 epsilons: Optional[Sequence[float]] = None):
+        """
+        Initialize batched simulation.
+
+        Args:
+            params: Simulation parameters (uses defaults if None)
+            seeds: One seed per run (defaults to [params.seed])
+            sigmas: Per-run σ (defaults to params.sigma for every run)
+            epsilons: Per-run ε (defaults to params.epsilon for every run)
+        """
+        self.params = params or default_parameters()
+        self.seeds = list(seeds) if seeds is not None else [self.params.seed]
+        self.n_replicates = len(self.seeds)
+
+        R = self.n_replicates
+        self.sigma = np.broadcast_to(
+            self.params.sigma if sigmas is None else np.asarray(sigmas, dtype=float), (R,)
+        ).copy()
+        self.epsilon = np.broadcast_to(
+            self.params.epsilon if epsilons is None else np.asarray(epsilons, dtype=float), (R,)
+        ).copy()
+
+        # One stream per replicate, bands created exactly as in the
+        # serial engine
+        self.rngs = [np.random.default_rng(seed) for seed in self.seeds]
+        self.band_state = BandArrays.stack([
+            BandArrays.from_bands(create_bands(
+                n_bands=self.params.population.n_bands,
+                initial_size=self.params.population.initial_band_size,
+                region_size=self.params.environment.region_size,
+                rng=rng
+            ))
+            for rng in self.rngs
+        ])
+
+        # Obligations of all replicates in one network (node r * n + b)
+        self.obligations = ObligationNetwork(R * self.band_state.n_bands)
+
+        # Aggregation site at center (maximum ecotone)
+        center = self.params.environment.region_size / 2
+        self.site_location = (center, center)
+        self._site_distance = np.hypot(center - self.band_state.home_x,
+                                       center - self.band_state.home_y)
+
+        # Site state per replicate
+        self.n_attending = np.zeros(R, dtype=np.int64)
+        self.aggregation_population = np.zeros(R, dtype=np.int64)
+        self.monument_level = np.zeros(R)
+        self.annual_construction = np.zeros(R)
+
+        # Shortfall state per replicate
+        self.year = 0
+        self.in_shortfall = np.zeros(R, dtype=bool)
+        self.shortfall_remaining = np.zeros(R, dtype=np.int64)
+        self.shortfall_magnitude = np.zeros(R)
+
+        self.results = [
+            SimulationResults(
+                sigma=float(s), epsilon=float(e), seed=seed,
+                yearly_states=make_state_series(YearlyState, self.params)
+            )
+            for s, e, seed in zip(self.sigma, self.epsilon, self.seeds)
+        ]
+
+    def _update_shortfalls(self) -> None:
+        """Continue or generate shortfall events in every replicate."""
+        for r, rng in enumerate(self.rngs):
+            if self.shortfall_remaining[r] > 0:
+                self.shortfall_remaining[r] -= 1
+                if self.shortfall_remaining[r] == 0:
+                    self.in_shortfall[r] = False
+                    self.shortfall_magnitude[r] = 0.0
+                continue
+
+            sigma = self.sigma[r]
+            mean_interval = 20 * (1 - sigma) + 5
+            if rng.random() < 1.0 / mean_interval:
+                magnitude = 0.3 + 0.5 * sigma + rng.normal(0, 0.1)
+                magnitude = np.clip(magnitude, 0.2, 0.9)
+                self.in_shortfall[r] = True
+                self.shortfall_magnitude[r] = magnitude
+                self.shortfall_remaining[r] = max(1, int(1 + magnitude * 2.5))
+
+    def _fitness(self, n: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(W_agg, W_ind) per replicate, shaped (R, 1) for broadcasting."""
+        W_agg = W_aggregator_array(self.sigma, self.epsilon, n, self.params)
+        W_ind = W_independent_array(self.sigma, self.params)
+        return W_agg[:, None], W_ind[:, None]
+
+    def _shortfall_factor(self) -> np.ndarray:
+        """(R, 1) productivity multiplier from current shortfalls."""
+        return np.where(self.in_shortfall, 1 - self.shortfall_magnitude, 1.0)[:, None]
+
+    def _run_dispersal_season(self) -> None:
+        """Dispersal season foraging."""
+        bs = self.band_state
+
+        base_harvest = (0.4 + 0.2 * _uniform(self.rngs, bs.n_bands)) * self._shortfall_factor()
+        harvest = np.where(
+            bs.is_aggregator,
+            base_harvest * (1 - self.params.costs.C_opportunity),
+            base_harvest
+        )
+
+        consumption = bs.size * 0.02
+        bs.resources = np.clip(bs.resources + harvest - consumption, 0.0, 1.0)
+
+    def _run_strategy_decisions(self) -> None:
+        """Strategy decisions from last year's aggregation size."""
+        expected_n = np.maximum(5, self.n_attending)
+        W_agg, W_ind = self._fitness(expected_n)
+        _choose_strategies(self.band_state, W_agg - W_ind, self.rngs)
+
+    def _run_aggregation_season(self) -> None:
+        """Aggregation season: travel, investment, exotics, obligations."""
+        bs = self.band_state
+        agg = bs.is_aggregator
+
+        # Travel to aggregation site
+        travel_cost = self._site_distance * 0.0005
+        bs.resources = np.where(
+            agg, bs.resources - np.minimum(travel_cost, bs.resources * 0.5), bs.resources
+        )
+
+        # Register attendance
+        self.n_attending = agg.sum(axis=1)
+        self.aggregation_population = np.where(agg, bs.size, 0).sum(axis=1)
+        bs.attended = agg.copy()
+
+        construction = _invest_and_acquire(
+            bs, agg, agg & (bs.resources >= 0.3), self.params.costs.C_signal,
+            self.rngs
+        )
+        _form_obligations(self.obligations, agg, self.rngs)
+
+        # Independents continue foraging
+        extra_harvest = 0.1 * self._shortfall_factor()
+        bs.resources = np.where(agg, bs.resources,
+                                np.minimum(1.0, bs.resources + extra_harvest))
+
+        self.monument_level += construction
+        self.annual_construction = construction
+
+    def _apply_shortfall_mortality(self) -> None:
+        """Shortfall mortality in replicates currently in shortfall."""
+        if not self.in_shortfall.any():
+            return
+
+        bs = self.band_state
+        vulnerability = self.params.vulnerability
+        sigma = self.sigma[:, None]
+
+        mortality_rate = np.where(
+            bs.is_aggregator,
+            vulnerability.alpha_agg * sigma * (1 - self.epsilon[:, None]),
+            vulnerability.beta_ind * sigma
+        )
+        deaths = _binomial(self.rngs, bs.size, mortality_rate, active=self.in_shortfall)
+        bs.size = np.maximum(1, bs.size - deaths)
+
+        callers = bs.is_aggregator & self.in_shortfall[:, None]
+        bs.resources += _call_obligations(self.obligations, callers, 0.2, self.rngs)
+
+    def _apply_reproduction(self) -> None:
+        """Reproduction with fitness from this year's attendance."""
+        bs = self.band_state
+        W_agg, W_ind = self._fitness(self.n_attending)
+        fitness = np.where(bs.attended, W_agg, W_ind)
+        bs.record_fitness(fitness)
+        _reproduce(bs, fitness, self.params, self.rngs)
+
+    def _record_state(self) -> None:
+        """Record one YearlyState row per replicate."""
+        bs = self.band_state
+        n_total = bs.n_bands
+        n_agg = bs.is_aggregator.sum(axis=1)
+        total_population = bs.size.sum(axis=1)
+        total_exotics = bs.exotic_goods.sum(axis=1)
+        mean_agg, mean_ind = _fitness_by_strategy(bs)
+
+        for r, results in enumerate(self.results):
+            results.yearly_states.record(
+                year=self.year,
+                total_population=int(total_population[r]),
+                n_bands=n_total,
+                mean_band_size=float(total_population[r] / n_total),
+                n_aggregators=int(n_agg[r]),
+                n_independents=int(n_total - n_agg[r]),
+                strategy_dominance=float((2 * n_agg[r] - n_total) / n_total),
+                aggregation_size=int(self.n_attending[r]),
+                aggregation_population=int(self.aggregation_population[r]),
+                monument_level=float(self.monument_level[r]),
+                annual_construction=float(self.annual_construction[r]),
+                total_exotics=int(total_exotics[r]),
+                sigma_effective=float(self.sigma[r] * (1 - self.epsilon[r])),
+                in_shortfall=bool(self.in_shortfall[r]),
+                shortfall_magnitude=float(self.shortfall_magnitude[r]),
+                mean_fitness_aggregators=float(mean_agg[r]),
+                mean_fitness_independents=float(mean_ind[r])
+            )
+
+    def step(self) -> None:
+        """Execute one year in every replicate."""
+        self._update_shortfalls()
+        self._run_dispersal_season()
+        self._run_strategy_decisions()
+        self._run_aggregation_season()
+        self._apply_shortfall_mortality()
+        self._apply_reproduction()
+        self._record_state()
+        self.year += 1
+
+    def run(self, verbose: bool = False) -> List[SimulationResults]:
+        """
+        Run all replicates for params.duration years.
+
+        Args:
+            verbose: Print progress updates
+
+        Returns:
+            One SimulationResults per seed, in seed order
+        """
+        if verbose:
+            print(f"Running {self.n_replicates} batched runs: "
+                  f"σ={self.sigma.min():.2f}-{self.sigma.max():.2f}, "
+                  f"ε={self.epsilon.min():.2f}-{self.epsilon.max():.2f}")
+
+        for _ in range(self.params.duration):
+            self.step()
+
+            if verbose and self.year % 100 == 0:
+                bs = self.band_state
+                dominance = (2 * bs.is_aggregator.sum(axis=1) - bs.n_bands) / bs.n_bands
+                print(f"  Year {self.year}: "
+                      f"mean dominance={np.mean(dominance):.2f}")
+
+        for results in self.results:
+            results.compute_summary(burn_in=self.params.burn_in)
+            results.sigma_star_theoretical = critical_threshold(
+                results.epsilon,
+                n=self.params.cooperation.n_optimal,
+                params=self.params
+            )
+
+        return self.results
+
+
+def run_replicates(sigma: float, epsilon: float, seeds: Sequence[int],
+                   duration: int = 600, verbose: bool = False,
+                   summary_only: bool = False) -> List[SimulationResults]:
+    """
+    Run replicates of one (σ, ε) point with the batched core engine.
+
+    Args:
+        sigma: Environmental uncertainty
+        epsilon: Ecotone advantage
+        seeds: One random seed per replicate
+        duration: Simulation duration in years
+        verbose: Print progress
+        summary_only: Keep only post-burn-in summary statistics
+
+    Returns:
+        One SimulationResults per seed
+    """
+    params = default_parameters(sigma=sigma, epsilon=epsilon)
+    params.duration = duration
+    params.summary_only = summary_only
+
+    return BatchedSimulation(params, seeds=seeds).run(verbose=verbose)
+
+
+def run_grid_block(sigmas: Sequence[float], epsilons: Sequence[float],
+                   seeds: Sequence[int], duration: int = 600,
+                   verbose: bool = False,
+                   summary_only: bool = False) -> List[SimulationResults]:
+    """
+    Run a block of phase-space points as one tensor simulation.
+
+    Args:
+        sigmas: σ for each run
+        epsilons: ε for each run
+        seeds: Random seed for each run
+        duration: Simulation duration in years
+        verbose: Print progress
+        summary_only: Keep only post-burn-in summary statistics
+
+    Returns:
+        One SimulationResults per run, in input order
+    """
+    params = default_parameters()
+    params.duration = duration
+    params.summary_only = summary_only
+
+    sim = BatchedSimulation(params, seeds=seeds, sigmas=sigmas, epsilons=epsilons)
+    return sim.run(verbose=verbose)
+
+
+# =============================================================================
+# Integrated model
+# =============================================================================
+
+class BatchedIntegratedSimulation:
+    """
+    R replicates of IntegratedSimulation advanced together.
+
+    Each replicate is initialized by constructing an IntegratedSimulation
+    with its seed, so environment, band placement and aggregation site
+    are identical to the serial run. Patch productivity and every band's
+    location value are then evaluated for all replicates at once from
+    sparse access matrices (Environment.build_access_matrix) stacked over
+    replicates.
+    """
+
+    def __init__(self,
+                 params: Optional[SimulationParameters] = None,
+                 env_config: Optional[EnvironmentConfig] = None,
+                 shortfall_params: Optional[ShortfallParams] = None,
+                 seeds: Optional[Sequence[int]] = None):
+        """
+        Initialize batched integrated simulation.
+
+        Args:
+            params: Simulation parameters (uses defaults if None)
+            env_config: Environment configuration (uses defaults if None)
+            shortfall_params: Shortfall generation parameters (uses defaults if None)
+            seeds: One seed per replicate (defaults to [params.seed])
+        """
+        self.params = params or default_parameters()
+        self.seeds = list(seeds) if seeds is not None else [self.params.seed]
+        self.n_replicates = len(self.seeds)
+        self.shortfall_params = shortfall_params or ShortfallParams()
+
+        sims = [
+            IntegratedSimulation(
+                params=replace(self.params, seed=seed),
+                env_config=env_config,
+                shortfall_params=self.shortfall_params,
+                seed=seed
+            )
+            for seed in self.seeds
+        ]
+        self.env_config = sims[0].env_config
+
+        # Replicate streams continue from where initialization left them
+        self.rngs = [sim.rng for sim in sims]
+        self.environments = [sim.environment for sim in sims]
+        self.band_state = BandArrays.stack(
+            [BandArrays.from_bands(sim.bands) for sim in sims]
+        )
+
+        self._init_landscape(sims)
+
+        # Obligations of all replicates in one network (node r * n + b)
+        self.obligations = ObligationNetwork(self.n_replicates * self.band_state.n_bands)
+
+        # Site state per replicate
+        R = self.n_replicates
+        self.n_attending = np.zeros(R, dtype=np.int64)
+        self.aggregation_population = np.zeros(R, dtype=np.int64)
+        self.monument_level = np.zeros(R)
+        self.last_construction = np.zeros(R)
+
+        # State tracking
+        self.year = 0
+        self.month = 1
+        self.annual_productivities = RollingWindow(
+            self.shortfall_params.sigma_window, shape=(R,)
+        )
+        self.effective_sigma = np.zeros(R)
+
+        # Shortfall tracking
+        self.in_shortfall = np.zeros(R, dtype=bool)
+        self.shortfall_severity = np.zeros(R)
+        self.shortfall_remaining = np.zeros(R, dtype=np.int64)
+
+        self.results = [
+            IntegratedResults(
+                seed=seed, duration_years=self.params.duration,
+                yearly_states=make_state_series(IntegratedState, self.params)
+            )
+            for seed in self.seeds
+        ]
+
+    def _init_landscape(self, sims: List[IntegratedSimulation]) -> None:
+        """Pack patch state and precompute patch access."""
+        bs = self.band_state
+
+        patch_zone, base, variability = [], [], []
+        band_access = {50.0: [], 60.0: []}
+        site_access = {50.0: [], 80.0: []}
+        site_xy, epsilon = [], []
+
+        for r, sim in enumerate(sims):
+            env = sim.environment
+            patches = env.patch_state
+            patch_zone.append(patches.zone)
+            base.append(patches.base_productivity)
+            variability.append(patches.variability)
+
+            homes = np.column_stack([bs.home_x[r], bs.home_y[r]])
+            for radius, matrices in band_access.items():
+                matrices.append(env.build_access_matrix(homes, radius))
+            for radius, matrices in site_access.items():
+                matrices.append(env.build_access_matrix(
+                    [sim.aggregation_site.location], radius))
+
+            site_xy.append(sim.aggregation_site.location)
+            epsilon.append(sim.aggregation_site.ecotone_advantage)
+
+        self.patch_zone = np.stack(patch_zone)
+        self.patch_base = np.array(base)
+        self.patch_variability = np.array(variability)
+        self.patch_shock = np.zeros_like(self.patch_base)
+
+        # One access matrix per radius over all replicates' points
+        n_patches = self.patch_base.shape[1]
+        self._band_access = {radius: AccessMatrix.stack(matrices, n_patches)
+                             for radius, matrices in band_access.items()}
+        self._site_access = {radius: AccessMatrix.stack(matrices, n_patches)
+                             for radius, matrices in site_access.items()}
+
+        site_xy = np.array(site_xy)
+        self.site_locations = site_xy
+        self.epsilon = np.array(epsilon)
+        self._site_distance = np.hypot(site_xy[:, 0:1] - bs.home_x,
+                                       site_xy[:, 1:2] - bs.home_y)
+
+    # -------------------------------------------------------------------------
+    # Environment
+    # -------------------------------------------------------------------------
+
+    def _advance_environment(self) -> None:
+        """Draw this year's correlated patch shocks in every replicate."""
+        for r, env in enumerate(self.environments):
+            env.advance_year()
+            self.patch_shock[r] = env.patch_state.annual_shock
+
+    def _patch_productivity(self) -> np.ndarray:
+        """(R, P) patch productivity for the current month."""
+        multiplier = SEASONAL_TABLE[self.patch_zone, self.month]
+        return np.maximum(0.0, self.patch_base * multiplier + self.patch_shock)
+
+    def _zone_productivity(self, prod: np.ndarray) -> np.ndarray:
+        """(R, n_zones) mean productivity per zone (0 if zone is empty)."""
+        out = np.zeros((self.n_replicates, len(ZONES)))
+        for z in range(len(ZONES)):
+            in_zone = self.patch_zone == z
+            count = in_zone.sum(axis=1)
+            total = np.where(in_zone, prod, 0.0).sum(axis=1)
+            out[:, z] = np.where(count > 0, total / np.maximum(count, 1), 0.0)
+        return out
+
+    def _band_value(self, prod: np.ndarray, radius: float,
+                    mast_only: bool = False) -> np.ndarray:
+        """
+        (R, n) location value at band homes ('total', or the mast entry
+        if mast_only) for the current patch productivity.
+        """
+        access = self._band_access[radius]
+        if mast_only:
+            values = access.zone_values(prod.ravel())[:, ZONE_INDEX[ResourceZone.MAST]]
+        else:
+            values = access.totals(prod.ravel())
+        return values.reshape(self.n_replicates, -1)
+
+    def _site_value(self, prod: np.ndarray, radius: float) -> np.ndarray:
+        """(R,) total location value at each replicate's aggregation site."""
+        return self._site_access[radius].totals(prod.ravel())
+
+    def _evaluate_shortfall(self) -> None:
+        """Record mean productivity and continue or start shortfalls."""
+        zone_prod = self._zone_productivity(self._patch_productivity())
+        positive = zone_prod > 0
+        n_zones = positive.sum(axis=1)
+        mean_prod = np.where(
+            n_zones > 0,
+            np.where(positive, zone_prod, 0.0).sum(axis=1) / np.maximum(n_zones, 1),
+            0.0
+        )
+        self.annual_productivities.push(mean_prod)
+
+        sp = self.shortfall_params
+        for r, rng in enumerate(self.rngs):
+            if self.shortfall_remaining[r] > 0:
+                self.shortfall_remaining[r] -= 1
+                self.in_shortfall[r] = True
+                continue
+
+            if rng.random() < 1.0 / sp.mean_interval:
+                magnitude = sp.magnitude_mean + rng.normal(0, sp.magnitude_std)
+                magnitude = float(np.clip(magnitude, 0.1, 0.9))
+                duration = max(1, int(1 + magnitude * sp.duration_scale))
+                self.shortfall_remaining[r] = duration - 1
+                self.in_shortfall[r] = True
+                self.shortfall_severity[r] = magnitude
+            else:
+                self.in_shortfall[r] = False
+                self.shortfall_severity[r] = 0.0
+
+    def _calculate_effective_sigma(self) -> np.ndarray:
+        """Effective σ per replicate (see IntegratedSimulation)."""
+        return effective_sigma(self.shortfall_params, self.annual_productivities)
+
+    def _fitness(self, n: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(W_agg, W_ind) per replicate at effective σ, shaped (R, 1)."""
+        W_agg = W_aggregator_array(self.effective_sigma, self.epsilon, n, self.params)
+        W_ind = W_independent_array(self.effective_sigma, self.params)
+        return W_agg[:, None], W_ind[:, None]
+
+    # -------------------------------------------------------------------------
+    # Seasons
+    # -------------------------------------------------------------------------
+
+    def _run_spring_dispersal(self) -> None:
+        """Spring dispersal foraging from home-range productivity."""
+        bs = self.band_state
+        prod = self._patch_productivity()
+
+        base_harvest = self._band_value(prod, 50.0) * 0.3
+        harvest = np.where(
+            bs.is_aggregator,
+            base_harvest * (1 - self.params.costs.C_opportunity),
+            base_harvest
+        )
+
+        consumption = bs.size * 0.015
+        bs.resources = np.clip(bs.resources + harvest - consumption, 0.0, 1.0)
+
+    def _run_summer_aggregation(self) -> None:
+        """Summer aggregation month."""
+        bs = self.band_state
+        prod = self._patch_productivity()
+
+        # Reset aggregation site
+        self.n_attending[:] = 0
+        self.aggregation_population[:] = 0
+
+        expected_n = np.maximum(5, self.n_attending)
+        site_total = self._site_value(prod, 80.0)
+
+        W_agg, W_ind = self._fitness(expected_n)
+        _choose_strategies(bs, W_agg - W_ind, self.rngs)
+        agg = bs.is_aggregator
+
+        # Travel and attendance
+        travel_cost = self._site_distance * 0.0005
+        bs.resources = np.where(
+            agg, bs.resources - np.minimum(travel_cost, bs.resources * 0.3), bs.resources
+        )
+        self.n_attending = agg.sum(axis=1)
+        self.aggregation_population = np.where(agg, bs.size, 0).sum(axis=1)
+        bs.attended = agg.copy()
+
+        # Ecotone harvest at the site
+        bs.resources = bs.resources + np.where(agg, site_total[:, None] * 0.2, 0.0)
+
+        construction = _invest_and_acquire(
+            bs, agg, agg & (bs.resources > 0.3), self.params.costs.C_signal,
+            self.rngs
+        )
+        _form_obligations(self.obligations, agg, self.rngs)
+
+        # Independents forage at home
+        home_harvest = self._band_value(prod, 50.0) * 0.25
+        bs.resources = np.where(agg, bs.resources,
+                                np.minimum(1.0, bs.resources + home_harvest))
+
+        self.monument_level += construction
+        self.last_construction = construction
+
+    def _run_fall_dispersal(self) -> None:
+        """Fall dispersal with mast bonus."""
+        bs = self.band_state
+        prod = self._patch_productivity()
+
+        mast_bonus = self._band_value(prod, 60.0, mast_only=True) * 0.5
+        harvest = self._band_value(prod, 60.0) * 0.2 + mast_bonus
+
+        consumption = bs.size * 0.012
+        bs.resources = np.clip(bs.resources + harvest - consumption, 0.0, 1.0)
+
+    def _run_winter_mortality(self) -> None:
+        """Winter fitness, shortfall mortality and reproduction."""
+        bs = self.band_state
+
+        W_agg, W_ind = self._fitness(self.n_attending)
+        fitness = np.where(bs.attended, W_agg, W_ind)
+        bs.record_fitness(fitness)
+
+        if self.in_shortfall.any():
+            in_shortfall = self.in_shortfall[:, None]
+            callers = bs.is_aggregator & in_shortfall
+            bs.resources += _call_obligations(self.obligations, callers, 0.15, self.rngs)
+
+            vulnerability = np.where(bs.is_aggregator,
+                                     self.params.vulnerability.alpha_agg,
+                                     self.params.vulnerability.beta_ind)
+            mortality_rate = vulnerability * self.effective_sigma[:, None]
+            deaths = _binomial(self.rngs, bs.size, mortality_rate,
+                               active=self.in_shortfall)
+            bs.size = np.maximum(1, bs.size - deaths)
+
+        _reproduce(bs, fitness, self.params, self.rngs)
+
+    def _record_state(self) -> None:
+        """Record one annual IntegratedState row per replicate."""
+        bs = self.band_state
+        prod = self._patch_productivity()
+        zone_prod = self._zone_productivity(prod)
+        site_total = self._site_value(prod, 50.0)
+
+        n_total = bs.n_bands
+        n_agg = bs.is_aggregator.sum(axis=1)
+        total_population = bs.size.sum(axis=1)
+        total_exotics = bs.exotic_goods.sum(axis=1)
+        mean_agg, mean_ind = _fitness_by_strategy(bs)
+
+        for r, results in enumerate(self.results):
+            results.yearly_states.record(
+                year=self.year,
+                month=self.month,
+                total_population=int(total_population[r]),
+                n_bands=n_total,
+                mean_band_size=float(total_population[r] / n_total),
+                n_aggregators=int(n_agg[r]),
+                n_independents=int(n_total - n_agg[r]),
+                strategy_dominance=float((2 * n_agg[r] - n_total) / n_total),
+                aggregation_size=int(self.n_attending[r]),
+                aggregation_population=int(self.aggregation_population[r]),
+                monument_level=float(self.monument_level[r]),
+                annual_construction=float(self.last_construction[r]),
+                total_exotics=int(total_exotics[r]),
+                mean_productivity=float(zone_prod[r].mean()),
+                productivity_by_zone={
+                    zone.value: float(zone_prod[r, z]) for z, zone in enumerate(ZONES)
+                },
+                effective_sigma=float(self.effective_sigma[r]),
+                ecotone_value=float(site_total[r]),
+                in_shortfall=bool(self.in_shortfall[r]),
+                shortfall_severity=float(self.shortfall_severity[r]),
+                mean_fitness_aggregators=float(mean_agg[r]),
+                mean_fitness_independents=float(mean_ind[r])
+            )
+
+    def step_year(self) -> None:
+        """Execute one full year in every replicate."""
+        self._advance_environment()
+        self._evaluate_shortfall()
+        self.effective_sigma = self._calculate_effective_sigma()
+
+        seasons = [
+            ([3, 4, 5], self._run_spring_dispersal),
+            ([6, 7, 8], self._run_summer_aggregation),
+            ([9, 10, 11], self._run_fall_dispersal),
+            ([12, 1, 2], self._run_winter_mortality),
+        ]
+        for months, handler in seasons:
+            for month in months:
+                self.month = month
+                handler()
+
+        self._record_state()
+        self.year += 1
+
+    def run(self, verbose: bool = False) -> List[IntegratedResults]:
+        """
+        Run all replicates for params.duration years.
+
+        Args:
+            verbose: Print progress updates
+
+        Returns:
+            One IntegratedResults per seed, in seed order
+        """
+        if verbose:
+            print(f"Running {self.n_replicates} batched integrated replicates: "
+                  f"{self.params.duration} years")
+
+        for _ in range(self.params.duration):
+            self.step_year()
+
+            if verbose and self.year % 100 == 0:
+                bs = self.band_state
+                dominance = (2 * bs.is_aggregator.sum(axis=1) - bs.n_bands) / bs.n_bands
+                print(f"  Year {self.year}: "
+                      f"mean dominance={np.mean(dominance):.2f}, "
+                      f"mean σ_eff={self.effective_sigma.mean():.3f}")
+
+        for results in self.results:
+            results.compute_summary(burn_in=self.params.burn_in)
+
+        return self.results
@@ -7,14 +7,21 @@ with the architecture defined in docs/ABM_ARCHITECTURE.md.
 
 import numpy as np
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional, Union
 from enum import Enum
 
 from .parameters import (
     SimulationParameters, default_parameters,
     W_aggregator, W_independent, cooperation_benefit, critical_threshold
 )
-from .agents import Band, AggregationSite, Strategy, create_bands, create_aggregation_site
+from .agents import (
+    Band, AggregationSite, Strategy, HistoryRetention, ObligationNetwork,
+    PopulationCounters, apply_shortfall_mortality, apply_reproduction,
+    decide_strategies, create_bands, create_aggregation_site
+)
+from .timeseries import (
+    StateSeries, StreamingSummary, RunningStats, format_progress, make_state_series
+)
 
 
 @dataclass
@@ -59,8 +66,11 @@ class SimulationResults:
     epsilon: float
     seed: int
 
-    # Time series
-    yearly_states: List[YearlyState] = field(default_factory=list)
+    # Time series, one column per recorded YearlyState field (or running
+    # statistics only, in summary-only mode)
+    yearly_states: Union[StateSeries, StreamingSummary] = field(
+        default_factory=lambda: StateSeries(YearlyState)
+    )
 
     # Summary statistics (computed after simulation)
     final_strategy_dominance: float = 0.0
@@ -69,25 +79,34 @@ class SimulationResults:
     total_exotics: int = 0
     mean_population: float = 0.0
 
+    # Post-burn-in statistics per summary field
+    statistics: Dict[str, RunningStats] = field(default_factory=dict)
+
     # Theoretical comparison
     sigma_star_theoretical: float = 0.0
 
     def compute_summary(self, burn_in: int = 100) -> None:
-        """Compute summary statistics from time series."""
-        # Use post-burn-in data
-        analysis_states = [s for s in self.yearly_states if s.year >= burn_in]
+        """
+        Compute summary statistics from time series.
 
-        if not analysis_states:
-            return
+        Fills `statistics` with mean, variance, min and max of each summary
+        field after burn-in. A summary field that was not recorded (see
+        params.record_fields) has no `statistics` entry, and the summary
+        attribute computed from it stays at its default of 0.
+        """
+        stats = self.yearly_states.summarize(burn_in)
+        self.statistics = stats
 
-        self.final_strategy_dominance = np.mean([s.strategy_dominance
-                                                  for s in analysis_states])
-        self.mean_aggregation_size = np.mean([s.aggregation_size
-                                               for s in analysis_states])
-        self.final_monument_level = analysis_states[-1].monument_level
-        self.total_exotics = analysis_states[-1].total_exotics
-        self.mean_population = np.mean([s.total_population
-                                         for s in analysis_states])
+        if 'strategy_dominance' in stats:
+            self.final_strategy_dominance = stats['strategy_dominance'].mean
+        if 'aggregation_size' in stats:
+            self.mean_aggregation_size = stats['aggregation_size'].mean
+        if 'monument_level' in stats:
+            self.final_monument_level = stats['monument_level'].last
+        if 'total_exotics' in stats:
+            self.total_exotics = int(stats['total_exotics'].last)
+        if 'total_population' in stats:
+            self.mean_population = stats['total_population'].mean
 
 
 class PovertyPointSimulation:
@@ -119,9 +138,17 @@ class PovertyPointSimulation:
             n_bands=self.params.population.n_bands,
             initial_size=self.params.population.initial_band_size,
             region_size=self.params.environment.region_size,
-            rng=self.rng
+            rng=self.rng,
+            history_retention=HistoryRetention(self.params.history_retention),
+            history_window=self.params.history_window
         )
 
+        # Running population totals, updated as band state changes
+        self.counters = PopulationCounters.from_bands(self.bands)
+
+        # Reciprocal obligations between bands
+        self.obligations = ObligationNetwork(len(self.bands))
+
         # Initialize aggregation site at center (maximum ecotone)
         center = self.params.environment.region_size / 2
         self.aggregation_site = create_aggregation_site(
@@ -140,7 +167,8 @@ class PovertyPointSimulation:
         self.results = SimulationResults(
             sigma=self.params.sigma,
             epsilon=self.params.epsilon,
-            seed=self.params.seed
+            seed=self.params.seed,
+            yearly_states=make_state_series(YearlyState, self.params)
         )
 
     def _generate_shortfall(self) -> Tuple[bool, float, int]:
@@ -204,20 +232,24 @@ class PovertyPointSimulation:
         Bands decide their strategy for this year.
 
         Decision based on expected fitness comparison with memory effects.
+        The expected fitness of each strategy is the same for every band,
+        so it is computed once and all bands choose in one array step.
         """
         # Estimate expected aggregation size (from last year)
         last_n = self.aggregation_site.n_attending
         expected_n = max(5, last_n)  # Minimum expected
 
-        for band in self.bands:
-            band.strategy = band.decide_strategy(
-                expected_n=expected_n,
-                sigma=self.params.sigma,
-                epsilon=self.params.epsilon,
-                params=self.params,
-                rng=self.rng
-            )
-            band.strategy_history.append(band.strategy)
+        fitness_diff = (
+            W_aggregator(self.params.sigma, self.params.epsilon, expected_n, self.params) -
+            W_independent(self.params.sigma, self.params)
+        )
+        aggregate = decide_strategies(self.bands, fitness_diff, self.rng)
+
+        for band, agg in zip(self.bands, aggregate.tolist()):
+            strategy = Strategy.AGGREGATOR if agg else Strategy.INDEPENDENT
+            self.counters.strategy_changed(band.strategy, strategy, band.last_fitness)
+            band.strategy = strategy
+            band.record_strategy(band.strategy)
 
     def _run_aggregation_season(self) -> None:
         """
@@ -247,7 +279,7 @@ class PovertyPointSimulation:
 
                 # Register attendance
                 self.aggregation_site.add_attending_band(band)
-                band.aggregation_history.append(True)
+                band.record_aggregation(True)
 
                 # Invest in monument
                 investment = band.invest_in_monument(
@@ -257,31 +289,54 @@ class PovertyPointSimulation:
                 total_construction += investment
 
                 # Attempt exotic acquisition
-                band.acquire_exotic(
-                    acquisition_cost=0.1,
-                    rng=self.rng
-                )
-
-                # Form obligations with other attending bands
-                if len(self.aggregation_site.attending_bands) > 1:
-                    potential_partners = [
-                        b_id for b_id in self.aggregation_site.attending_bands
-                        if b_id != band.band_id
-                    ]
-                    if potential_partners and self.rng.random() < 0.3:
-                        partner_id = self.rng.choice(potential_partners)
-                        band.form_obligation(partner_id)
+                if band.acquire_exotic(acquisition_cost=0.1, rng=self.rng):
+                    self.counters.exotics_added(1)
 
             else:
                 # Independent: continue foraging
                 extra_harvest = 0.1 * (1 - self.shortfall_magnitude if self.in_shortfall else 1)
                 band.resources += extra_harvest
                 band.resources = min(1.0, band.resources)
-                band.aggregation_history.append(False)
+                band.record_aggregation(False)
+
+        # Form obligations among attending bands
+        self._form_obligations()
 
         # Record construction
         self.aggregation_site.record_construction(total_construction)
 
+    def _form_obligations(self) -> None:
+        """
+        Each attending band forms an obligation (p = 0.3) with a
+        uniformly chosen other attending band, as one bulk update.
+        """
+        site = self.aggregation_site
+        if site.n_attending < 2:
+            return
+
+        attending = site.attending_bands
+        forming = attending[self.rng.random(site.n_attending) < 0.3]
+        self.obligations.form(forming, site.sample_partners(forming, self.rng))
+
+    def _call_obligations(self, need: float) -> None:
+        """
+        Aggregators with obligations each call on one random partner.
+
+        Args:
+            need: Help requested per band
+        """
+        callers = np.array([b.band_id for b in self.bands
+                            if b.strategy == Strategy.AGGREGATOR], dtype=np.int64)
+        callers = callers[self.obligations.out_degree(callers) > 0]
+        if len(callers) == 0:
+            return
+
+        help_received = self.obligations.call(
+            callers, need=need, u=self.rng.random(len(callers))
+        )
+        for band_id, amount in zip(callers.tolist(), help_received.tolist()):
+            self.bands[band_id].resources += amount
+
     def _apply_shortfall_mortality(self) -> None:
         """
         Apply mortality during shortfall.
@@ -292,84 +347,91 @@ class PovertyPointSimulation:
         if not self.in_shortfall:
             return
 
-        for band in self.bands:
-            if band.strategy == Strategy.AGGREGATOR:
-                # Effective sigma reduced by ecotone
-                sigma_eff = self.params.sigma * (1 - self.params.epsilon)
-                vulnerability = self.params.vulnerability.alpha_agg
-            else:
-                sigma_eff = self.params.sigma
-                vulnerability = self.params.vulnerability.beta_ind
+        vulnerability = self.params.vulnerability
+        is_agg = np.fromiter((b.strategy == Strategy.AGGREGATOR for b in self.bands),
+                             dtype=bool, count=len(self.bands))
+
+        # Aggregators' effective sigma is reduced by the ecotone
+        mortality_rate = np.where(
+            is_agg,
+            vulnerability.alpha_agg * (self.params.sigma * (1 - self.params.epsilon)),
+            vulnerability.beta_ind * self.params.sigma
+        )
 
-            # Mortality
-            band.suffer_shortfall(vulnerability, sigma_eff, self.rng)
+        # Mortality, one binomial draw for all bands
+        sizes = self._band_sizes()
+        self._set_band_sizes(
+            sizes, apply_shortfall_mortality(sizes, mortality_rate, self.rng)
+        )
 
-            # Aggregators can call obligations for help
-            if band.strategy == Strategy.AGGREGATOR and band.obligations:
-                partner_id = self.rng.choice(list(band.obligations.keys()))
-                help_received = band.call_obligation(partner_id, need=0.2)
-                band.resources += help_received
+        # Aggregators can call obligations for help
+        self._call_obligations(need=0.2)
 
     def _apply_reproduction(self) -> None:
         """
         Apply reproduction and baseline mortality.
 
-        Fitness affects birth rate.
+        Fitness affects birth rate. Births and deaths are drawn for all
+        bands at once.
         """
-        for band in self.bands:
-            # Calculate realized fitness
-            if band.aggregation_history and band.aggregation_history[-1]:
-                fitness = W_aggregator(
-                    self.params.sigma,
-                    self.params.epsilon,
-                    self.aggregation_site.n_attending,
-                    self.params
-                )
-            else:
-                fitness = W_independent(self.params.sigma, self.params)
-
-            band.fitness_history.append(fitness)
+        # Realized fitness of each strategy, the same for every band
+        W_agg = W_aggregator(
+            self.params.sigma,
+            self.params.epsilon,
+            self.aggregation_site.n_attending,
+            self.params
+        )
+        W_ind = W_independent(self.params.sigma, self.params)
+
+        fitness_by_band = np.empty(len(self.bands))
+        for i, band in enumerate(self.bands):
+            fitness = W_agg if band.last_aggregated else W_ind
+            self.counters.fitness_recorded(band.strategy, band.last_fitness, fitness)
+            band.record_fitness(fitness)
+            fitness_by_band[i] = fitness
+
+        # Reproduction, then band dissolution/fission limits
+        pop = self.params.population
+        resources = np.fromiter((b.resources for b in self.bands), dtype=float,
+                                count=len(self.bands))
+        sizes = self._band_sizes()
+        self._set_band_sizes(sizes, apply_reproduction(
+            sizes, fitness_by_band, resources,
+            birth_rate=pop.birth_rate, death_rate=pop.death_rate,
+            min_size=pop.min_band_size, max_size=pop.max_band_size,
+            rng=self.rng
+        ))
 
-            # Reproduction
-            band.reproduce(
-                fitness=fitness,
-                birth_rate=self.params.population.birth_rate,
-                death_rate=self.params.population.death_rate,
-                rng=self.rng
-            )
+    def _band_sizes(self) -> np.ndarray:
+        """Current size of every band, in band order."""
+        return np.fromiter((b.size for b in self.bands), dtype=np.int64,
+                           count=len(self.bands))
 
-            # Band dissolution/fission
-            if band.size < self.params.population.min_band_size:
-                band.size = self.params.population.min_band_size
-            elif band.size > self.params.population.max_band_size:
-                band.size = self.params.population.max_band_size
+    def _set_band_sizes(self, old_sizes: np.ndarray, sizes: np.ndarray) -> None:
+        """Write new band sizes back to the bands and the counters."""
+        self.counters.size_changed(int(old_sizes.sum()), int(sizes.sum()))
+        for band, size in zip(self.bands, sizes.tolist()):
+            band.size = size
 
-    def _record_state(self) -> YearlyState:
-        """
-        Record current state.
+    def _record_state(self) -> None:
+        """Record current state from the population counters."""
+        counters = self.counters
+        if self.params.check_counters:
+            counters.check(self.bands)
 
-        Returns:
-            YearlyState snapshot
-        """
         # Count strategies
-        n_agg = sum(1 for b in self.bands if b.strategy == Strategy.AGGREGATOR)
-        n_ind = len(self.bands) - n_agg
-        n_total = len(self.bands)
+        n_total = counters.n_bands
+        n_agg = counters.n_aggregators
+        n_ind = counters.n_independents
 
         # Strategy dominance
         dominance = (n_agg - n_ind) / n_total if n_total > 0 else 0.0
 
-        # Fitness by strategy
-        agg_fitness = [b.fitness_history[-1] for b in self.bands
-                       if b.strategy == Strategy.AGGREGATOR and b.fitness_history]
-        ind_fitness = [b.fitness_history[-1] for b in self.bands
-                       if b.strategy == Strategy.INDEPENDENT and b.fitness_history]
-
-        state = YearlyState(
+        self.results.yearly_states.record(
             year=self.year,
-            total_population=sum(b.size for b in self.bands),
-            n_bands=len(self.bands),
-            mean_band_size=np.mean([b.size for b in self.bands]),
+            total_population=counters.total_population,
+            n_bands=n_total,
+            mean_band_size=counters.mean_band_size,
             n_aggregators=n_agg,
             n_independents=n_ind,
             strategy_dominance=dominance,
@@ -380,23 +442,20 @@ class PovertyPointSimulation:
                                  self.aggregation_site.monument_history[-2]
                                  if len(self.aggregation_site.monument_history) > 1
                                  else self.aggregation_site.monument_level),
-            total_exotics=sum(b.exotic_goods for b in self.bands),
+            total_exotics=counters.total_exotics,
             sigma_effective=self.params.sigma * (1 - self.params.epsilon),
             in_shortfall=self.in_shortfall,
             shortfall_magnitude=self.shortfall_magnitude,
-            mean_fitness_aggregators=np.mean(agg_fitness) if agg_fitness else 0.0,
-            mean_fitness_independents=np.mean(ind_fitness) if ind_fitness else 0.0
+            mean_fitness_aggregators=counters.mean_fitness(Strategy.AGGREGATOR),
+            mean_fitness_independents=counters.mean_fitness(Strategy.INDEPENDENT)
         )
 
-        self.results.yearly_states.append(state)
-        return state
-
     def step(self) -> YearlyState:
         """
         Execute one year of simulation.
 
         Returns:
-            State after this year
+            State after this year (built from the recorded row on demand)
         """
         # 1. Shortfall determination
         if self.shortfall_remaining > 0:
@@ -427,10 +486,10 @@ class PovertyPointSimulation:
         self._apply_reproduction()
 
         # 7. Record state
-        state = self._record_state()
+        self._record_state()
 
         self.year += 1
-        return state
+        return self.results.yearly_states[-1]
 
     def run(self, verbose: bool = False) -> SimulationResults:
         """
@@ -451,9 +510,11 @@ class PovertyPointSimulation:
 
             if verbose and self.year % 100 == 0:
                 state = self.results.yearly_states[-1]
-                print(f"  Year {self.year}: Pop={state.total_population}, "
-                      f"Dominance={state.strategy_dominance:.2f}, "
-                      f"Monument={state.monument_level:.0f}")
+                print(f"  Year {self.year}: " + format_progress(state, (
+                    ('Pop', 'total_population', 'd'),
+                    ('Dominance', 'strategy_dominance', '.2f'),
+                    ('Monument', 'monument_level', '.0f'),
+                )))
 
         # Compute summary statistics
         self.results.compute_summary(burn_in=self.params.burn_in)
@@ -473,8 +534,9 @@ class PovertyPointSimulation:
 
 
 def run_single_simulation(sigma: float, epsilon: float, seed: int,
-                          duration: int = 600, verbose: bool = False
-                          ) -> SimulationResults:
+                          duration: int = 600, verbose: bool = False,
+                          engine: str = "agent",
+                          summary_only: bool = False) -> SimulationResults:
     """
     Convenience function to run a single simulation.
 
@@ -484,14 +546,25 @@ def run_single_simulation(sigma: float, epsilon: float, seed: int,
         seed: Random seed
         duration: Simulation duration in years
         verbose: Print progress
+        engine: "agent" (list of Band objects) or "vectorized"
+            (struct-of-arrays, see vectorized_simulation.py)
+        summary_only: Keep only post-burn-in summary statistics, not
+            per-year state
 
     Returns:
         SimulationResults object
     """
     params = default_parameters(sigma=sigma, epsilon=epsilon, seed=seed)
     params.duration = duration
-
-    sim = PovertyPointSimulation(params)
+    params.summary_only = summary_only
+
+    if engine == "agent":
+        sim = PovertyPointSimulation(params)
+    elif engine == "vectorized":
+        from .vectorized_simulation import VectorizedSimulation
+        sim = VectorizedSimulation(params)
+    else:
+        raise ValueError(f"Unknown engine '{engine}'. Available: agent, vectorized")
     return sim.run(verbose=verbose)
 
 
@@ -0,0 +1,226 @@
+"""
+Self-consistent critical thresholds with an emergent aggregation size.
+
+critical_threshold assumes the aggregation size n is fixed (n_optimal),
+but in the simulation n emerges from the strategy choices and grows with
+σ. EmergentThresholdSolver finds the σ* where
+
+    W_agg(σ, ε, max(min_n, n(σ, ε))) = W_ind(σ)
+
+with n(σ, ε) taken from one of two estimators:
+
+- "mean_field": post-burn-in aggregation size of the noise-corrected
+  MeanFieldModel (deterministic, a fraction of a second per call)
+- "batched": post-burn-in aggregation size of short BatchedSimulation
+  runs, added in batches of seeds until the standard error of every grid
+  point falls below sem_tol (or max_runs is reached)
+
+n is measured on a fixed (ε, σ) lattice and interpolated linearly in
+between. Lattice rows are measured on first use and kept, so solving for
+many ε values only pays for the rows that bracket them, and later calls
+reuse the stored outcomes.
+"""
+
+import dataclasses
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .batched_simulation import BatchedSimulation
+from .mean_field import MeanFieldModel
+from .parameters import (
+    SimulationParameters, default_parameters, W_aggregator_array,
+    W_independent_array
+)
+
+
+ESTIMATORS = ('mean_field', 'batched')
+
+# Bisection steps inside the bracketing σ cell (cell width / 2**40)
+_BISECTION_STEPS = 40
+
+
+class EmergentThresholdSolver:
+    """
+    σ* with n(σ, ε) from the mean-field model or short batched runs.
+
+    Measured lattice rows are cached on the instance; reuse one solver for
+    all the thresholds of a figure or sweep.
+    """
+
+    def __init__(self,
+                 params: Optional[SimulationParameters] = None,
+                 estimator: str = 'mean_field',
+                 sigma_grid: Optional[np.ndarray] = None,
+                 epsilon_grid: Optional[np.ndarray] = None,
+                 min_n: float = 5.0,
+                 duration: int = 300,
+                 batch_size: int = 4,
+                 max_runs: int = 16,
+                 sem_tol: float = 0.25):
+        """
+        Create a solver.
+
+        Args:
+            params: Simulation parameters (uses defaults if None); sigma
+                and epsilon are ignored
+            estimator: "mean_field" or "batched"
+            sigma_grid: σ values at which n is measured (default 0.1 to
+                0.9 in steps of 0.05); σ* is searched over this range
+            epsilon_grid: ε rows of the lattice (default 0 to 0.5 in steps
+                of 0.1); requested ε must lie within it
+            min_n: Lower bound on the aggregation size used for W_agg
+            duration: Years per run, including params.burn_in
+            batch_size: Seeds added per grid point per batch ("batched")
+            max_runs: Seed limit per grid point ("batched")
+            sem_tol: Target standard error of n, in bands ("batched")
+
+        Raises:
+            ValueError: If the estimator is unknown
+        """
+        if estimator not in ESTIMATORS:
+            raise ValueError(f"Unknown estimator '{estimator}'. "
+                             f"Available: {', '.join(ESTIMATORS)}")
+
+        self.params = params or default_parameters()
+        self.estimator = estimator
+        self.sigma_grid = np.asarray(
+            np.linspace(0.1, 0.9, 17) if sigma_grid is None else sigma_grid,
+            dtype=float)
+        self.epsilon_grid = np.asarray(
+            np.linspace(0.0, 0.5, 6) if epsilon_grid is None else epsilon_grid,
+            dtype=float)
+        self.min_n = min_n
+        self.duration = duration
+        self.batch_size = batch_size
+        self.max_runs = max_runs
+        self.sem_tol = sem_tol
+
+        # Lattice row index -> (mean n, standard error, runs) per σ
+        self._rows: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    @property
+    def n_simulations(self) -> int:
+        """Simulation runs made so far (0 for the mean-field estimator)."""
+        return int(sum(runs.sum() for _, _, runs in self._rows.values()))
+
+    def _measure_mean_field(self, rows: np.ndarray
+                            ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """n over the σ grid for the given lattice rows, from MeanFieldModel."""
+        model = MeanFieldModel(self.params, sigma=self.sigma_grid[None, :],
+                               epsilon=self.epsilon_grid[rows, None],
+                               noise_correction=True)
+        n = model.run(self.duration).mean_aggregation_size
+        zeros = np.zeros_like(n)
+        return n, zeros, zeros.astype(int)
+
+    def _measure_batched(self, rows: np.ndarray
+                         ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """n over the σ grid for the given lattice rows, from batched runs."""
+        params = dataclasses.replace(self.params, duration=self.duration,
+                                     summary_only=True)
+        shape = (len(rows), len(self.sigma_grid))
+        sigma = np.broadcast_to(self.sigma_grid[None, :], shape).ravel()
+        epsilon = np.broadcast_to(self.epsilon_grid[rows, None], shape).ravel()
+        samples = [[] for _ in range(sigma.size)]
+
+        # Every point gets one batch; later batches go only to points whose
+        # standard error is still above sem_tol
+        pending = np.arange(sigma.size)
+        while pending.size:
+            start = len(samples[pending[0]])
+            point = np.repeat(pending, self.batch_size)
+            seeds = start + np.tile(np.arange(self.batch_size), pending.size)
+            sim = BatchedSimulation(params, seeds=seeds, sigmas=sigma[point],
+                                    epsilons=epsilon[point])
+            for i, results in zip(point, sim.run()):
+                samples[i].append(results.mean_aggregation_size)
+
+            runs = np.array([len(samples[i]) for i in pending])
+            sem = np.array([np.std(samples[i], ddof=1) for i in pending]) / np.sqrt(runs)
+            pending = pending[(sem > self.sem_tol) & (runs < self.max_runs)]
+
+        n = np.array([np.mean(s) for s in samples])
+        runs = np.array([len(s) for s in samples])
+        sem = np.array([np.std(s, ddof=1) for s in samples]) / np.sqrt(runs)
+        return n.reshape(shape), sem.reshape(shape), runs.reshape(shape)
+
+    def _lattice_rows(self, rows: np.ndarray) -> np.ndarray:
+        """Mean n for the given lattice rows, measuring any not yet cached."""
+        missing = np.array(sorted(set(rows.tolist()) - set(self._rows)), dtype=int)
+        if missing.size:
+            measure = (self._measure_mean_field if self.estimator == 'mean_field'
+                       else self._measure_batched)
+            n, sem, runs = measure(missing)
+            for k, row in enumerate(missing):
+                self._rows[int(row)] = (n[k], sem[k], runs[k])
+        return np.array([self._rows[int(row)][0] for row in rows])
+
+    def emergent_n(self, epsilon: np.ndarray) -> np.ndarray:
+        """
+        Emergent aggregation size over the σ grid.
+
+        Args:
+            epsilon: ε values within the lattice range
+
+        Returns:
+            Array of shape (len(epsilon), len(sigma_grid))
+
+        Raises:
+            ValueError: If an ε value lies outside the lattice
+        """
+        epsilon = np.atleast_1d(np.asarray(epsilon, dtype=float))
+        grid = self.epsilon_grid
+        if np.any((epsilon < grid[0]) | (epsilon > grid[-1])):
+            raise ValueError(f"epsilon must lie in [{grid[0]}, {grid[-1]}]")
+
+        upper = np.clip(np.searchsorted(grid, epsilon), 1, len(grid) - 1)
+        lower = upper - 1
+        weight = (epsilon - grid[lower]) / (grid[upper] - grid[lower])
+        n_lower = self._lattice_rows(lower)
+        n_upper = self._lattice_rows(upper)
+        return n_lower + weight[:, None] * (n_upper - n_lower)
+
+    def _fitness_difference(self, sigma: np.ndarray, epsilon: np.ndarray,
+                            n: np.ndarray) -> np.ndarray:
+        """W_agg - W_ind with the aggregation size floored at min_n."""
+        W_agg = W_aggregator_array(sigma, epsilon, np.maximum(self.min_n, n),
+                                   self.params)
+        return W_agg - W_independent_array(sigma, self.params)
+
+    def solve(self, epsilon: np.ndarray) -> np.ndarray:
+        """
+        Self-consistent σ* for each ε.
+
+        σ* is the first σ in the grid range where W_agg(σ, n(σ)) reaches
+        W_ind(σ), with n linear in σ between grid points. It is sigma_grid[0]
+        where aggregation already wins there, and NaN where it never does.
+
+        Args:
+            epsilon: ε values within the lattice range
+
+        Returns:
+            σ* per ε
+        """
+        epsilon = np.atleast_1d(np.asarray(epsilon, dtype=float))
+        sigma = self.sigma_grid
+        n = self.emergent_n(epsilon)
+        diff = self._fitness_difference(sigma[None, :], epsilon[:, None], n)
+
+        crosses = (diff[:, :-1] < 0) & (diff[:, 1:] >= 0)
+        first = np.argmax(crosses, axis=1)
+        rows = np.arange(len(epsilon))
+        s1, s2 = sigma[first], sigma[first + 1]
+        n1, n2 = n[rows, first], n[rows, first + 1]
+
+        # Bisection inside the bracketing cell, all ε at once
+        lo, hi = s1.copy(), s2.copy()
+        for _ in range(_BISECTION_STEPS):
+            mid = 0.5 * (lo + hi)
+            n_mid = n1 + (n2 - n1) * (mid - s1) / (s2 - s1)
+            below = self._fitness_difference(mid, epsilon, n_mid) < 0
+            lo = np.where(below, mid, lo)
+            hi = np.where(below, hi, mid)
+
+        sigma_star = np.where(crosses.any(axis=1), hi, np.nan)
+        return np.where(diff[:, 0] >= 0, sigma[0], sigma_star)
@@ -9,10 +9,13 @@ This module implements:
 """
 
 import numpy as np
-from dataclasses import dataclass
-from typing import List, Tuple, Dict, Optional
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import List, Tuple, Dict, Optional, Sequence
 from enum import Enum
 
+from .spatial import GridIndex
+
 
 class ResourceZone(Enum):
     """Types of ecological zones around Poverty Point."""
@@ -22,6 +25,11 @@ class ResourceZone(Enum):
     ECOTONE = "ecotone"  # Mixed access - Macon Ridge position
 
 
+# Zone order used for per-zone arrays
+ZONES = list(ResourceZone)
+ZONE_INDEX = {zone: i for i, zone in enumerate(ZONES)}
+
+
 @dataclass
 class SeasonalProfile:
     """Seasonal productivity multipliers for a resource zone."""
@@ -70,6 +78,12 @@ SEASONAL_PROFILES = {
     )
 }
 
+# Seasonal multiplier for (zone index, month 1-12); column 0 unused
+SEASONAL_TABLE = np.array([
+    [0.0] + [SEASONAL_PROFILES[zone].get_multiplier(m) for m in range(1, 13)]
+    for zone in ZONES
+])
+
 
 @dataclass
 class EcologicalPatch:
@@ -105,6 +119,245 @@ class EcologicalPatch:
         return self.current_productivity
 
 
+@dataclass
+class PatchArrays:
+    """
+    Patch state of an Environment as parallel arrays (one entry per patch).
+
+    Productivity for a month is one expression over all patches:
+    max(0, base_productivity * SEASONAL_TABLE[zone, month] + annual_shock).
+    """
+    zone: np.ndarray                  # int64, index into ZONES
+    x: np.ndarray                     # float64
+    y: np.ndarray                     # float64
+    base_productivity: np.ndarray     # float64
+    variability: np.ndarray           # float64, inter-annual SD
+    annual_shock: np.ndarray          # float64
+    current_productivity: np.ndarray  # float64, last evaluated month
+
+    @classmethod
+    def from_patches(cls, patches: List[EcologicalPatch]) -> "PatchArrays":
+        """
+        Pack EcologicalPatch objects into arrays.
+
+        Args:
+            patches: Patches in patch_id order
+
+        Returns:
+            PatchArrays with the same state
+        """
+        return cls(
+            zone=np.array([ZONE_INDEX[p.zone_type] for p in patches], dtype=np.int64),
+            x=np.array([p.location[0] for p in patches], dtype=float),
+            y=np.array([p.location[1] for p in patches], dtype=float),
+            base_productivity=np.array([p.base_productivity for p in patches], dtype=float),
+            variability=np.array([p.variability for p in patches], dtype=float),
+            annual_shock=np.array([p.annual_shock for p in patches], dtype=float),
+            current_productivity=np.array([p.current_productivity for p in patches],
+                                          dtype=float),
+        )
+
+    @property
+    def n_patches(self) -> int:
+        """Number of patches."""
+        return len(self.zone)
+
+    def seasonal_productivity(self, month: int) -> np.ndarray:
+        """
+        Productivity of every patch for a month, also stored as
+        current_productivity.
+
+        Args:
+            month: Month (1-12)
+
+        Returns:
+            Array (n_patches,)
+        """
+        multiplier = SEASONAL_TABLE[self.zone, month]
+        self.current_productivity = np.maximum(
+            0.0, self.base_productivity * multiplier + self.annual_shock
+        )
+        return self.current_productivity
+
+    def season_productivity(self, months: Sequence[int]) -> np.ndarray:
+        """
+        Productivity of every patch for several months of the same year.
+
+        Row k equals seasonal_productivity(months[k]); current_productivity
+        is left at the last month, as if the months were evaluated in turn.
+
+        Args:
+            months: Months (1-12)
+
+        Returns:
+            Array (len(months), n_patches)
+        """
+        multiplier = SEASONAL_TABLE[self.zone][:, list(months)].T
+        productivity = np.maximum(
+            0.0, self.base_productivity * multiplier + self.annual_shock
+        )
+        self.current_productivity = productivity[-1].copy()
+        return productivity
+
+
+class PatchView(EcologicalPatch):
+    """
+    EcologicalPatch backed by one row of a PatchArrays.
+
+    Reads and writes go to the arrays, so code written against
+    Environment.patches keeps working on array-backed state.
+    """
+
+    def __init__(self, arrays: PatchArrays, index: int):
+        self._arrays = arrays
+        self._index = index
+
+    @property
+    def patch_id(self) -> int:
+        return self._index
+
+    @property
+    def zone_type(self) -> ResourceZone:
+        return ZONES[self._arrays.zone[self._index]]
+
+    @property
+    def location(self) -> Tuple[float, float]:
+        return (float(self._arrays.x[self._index]),
+                float(self._arrays.y[self._index]))
+
+    @property
+    def base_productivity(self) -> float:
+        return float(self._arrays.base_productivity[self._index])
+
+    @base_productivity.setter
+    def base_productivity(self, value: float) -> None:
+        self._arrays.base_productivity[self._index] = value
+
+    @property
+    def variability(self) -> float:
+        return float(self._arrays.variability[self._index])
+
+    @variability.setter
+    def variability(self, value: float) -> None:
+        self._arrays.variability[self._index] = value
+
+    @property
+    def annual_shock(self) -> float:
+        return float(self._arrays.annual_shock[self._index])
+
+    @annual_shock.setter
+    def annual_shock(self, value: float) -> None:
+        self._arrays.annual_shock[self._index] = value
+
+    @property
+    def current_productivity(self) -> float:
+        return float(self._arrays.current_productivity[self._index])
+
+    @current_productivity.setter
+    def current_productivity(self, value: float) -> None:
+        self._arrays.current_productivity[self._index] = value
+
+    def get_seasonal_productivity(self, month: int) -> float:
+        """Calculate productivity for a given month."""
+        multiplier = SEASONAL_TABLE[self._arrays.zone[self._index], month]
+        self.current_productivity = max(0.0,
+            self.base_productivity * multiplier + self.annual_shock
+        )
+        return self.current_productivity
+
+
+@dataclass
+class AccessMatrix:
+    """
+    Sparse proximity weights from fixed points to patches.
+
+    One entry per (point, patch) pair within the access radius, with the
+    weight 1 - d/r used by Environment.get_location_value. Access does not
+    depend on productivity, so the diversity bonus is fixed as well and a
+    location value is one weighted sum over the entries.
+    """
+    n_points: int
+    access_radius: float
+    points: np.ndarray             # int64, point index per entry
+    patches: np.ndarray            # int64, patch index per entry
+    zones: np.ndarray              # int64, zone index of the patch
+    weights: np.ndarray            # float64, proximity weight
+    diversity_bonus: np.ndarray    # float64, per point
+    n_zones_accessible: np.ndarray  # int64, per point
+
+    @classmethod
+    def stack(cls, replicates: List["AccessMatrix"],
+              n_patches: int) -> "AccessMatrix":
+        """
+        Combine per-replicate access matrices into one.
+
+        Points and patches of replicate r are offset by r times the
+        per-replicate counts, so zone_values / totals of the stacked matrix
+        take the (R * n_patches,) flattened productivity of all replicates
+        and return values for all (R * n_points) points in one call.
+
+        Args:
+            replicates: AccessMatrix per replicate, with equal point counts
+                and the same access radius
+            n_patches: Patches per replicate
+
+        Returns:
+            AccessMatrix over R * n_points points
+        """
+        n_points = replicates[0].n_points
+        return cls(
+            n_points=n_points * len(replicates),
+            access_radius=replicates[0].access_radius,
+            points=np.concatenate([m.points + r * n_points
+                                   for r, m in enumerate(replicates)]),
+            patches=np.concatenate([m.patches + r * n_patches
+                                    for r, m in enumerate(replicates)]),
+            zones=np.concatenate([m.zones for m in replicates]),
+            weights=np.concatenate([m.weights for m in replicates]),
+            diversity_bonus=np.concatenate([m.diversity_bonus for m in replicates]),
+            n_zones_accessible=np.concatenate([m.n_zones_accessible
+                                               for m in replicates])
+        )
+
+    def zone_values(self, productivity: np.ndarray) -> np.ndarray:
+        """
+        Proximity-weighted productivity per point and zone.
+
+        Args:
+            productivity: Current productivity of every patch, or a stack
+                of productivity vectors with shape (..., n_patches)
+
+        Returns:
+            Array (..., n_points, len(ZONES)) in ZONES order
+        """
+        productivity = np.asarray(productivity)
+        stack_shape = productivity.shape[:-1]
+        n_stack = int(np.prod(stack_shape))
+        n_zones = len(ZONES)
+        n_bins = self.n_points * n_zones
+
+        # One bincount over all stacked vectors, each in its own bin range
+        bins = self.points * n_zones + self.zones
+        bins = (np.arange(n_stack)[:, None] * n_bins + bins).ravel()
+        weights = self.weights * productivity.reshape(n_stack, -1)[:, self.patches]
+        values = np.bincount(bins, weights=weights.ravel(),
+                             minlength=n_stack * n_bins)
+        return values.reshape(*stack_shape, self.n_points, n_zones)
+
+    def totals(self, productivity: np.ndarray) -> np.ndarray:
+        """
+        Total location value per point (get_location_value()['total']).
+
+        Args:
+            productivity: Current productivity of every patch, or a stack
+                of productivity vectors with shape (..., n_patches)
+
+        Returns:
+            Array (..., n_points)
+        """
+        return self.zone_values(productivity).sum(axis=-1) + self.diversity_bonus
+
+
 @dataclass
 class EnvironmentConfig:
     """Configuration for the environmental model."""
@@ -135,6 +388,112 @@ class EnvironmentConfig:
     aquatic_mast_cov: float = 0.1  # Slight positive (both weather-dependent)
     terrestrial_mast_cov: float = 0.2  # Moderate positive
 
+    # Aggregation-site placement: "random" (best of uniformly sampled
+    # candidates) or "grid" (coarse-to-fine grid search, deterministic)
+    site_search: str = "random"
+
+    # Shock generator: "dense" (full patch covariance, factored once) or
+    # "zone_factor" (zone-level common factors plus idiosyncratic noise,
+    # O(n_patches) per year; see ZoneFactorShocks)
+    shock_model: str = "dense"
+
+
+def zone_correlation_matrix(config: EnvironmentConfig) -> np.ndarray:
+    """
+    Shock correlation between patches of each pair of zones.
+
+    Same zone 0.5; aquatic-terrestrial, aquatic-mast and terrestrial-mast
+    from config; ecotone with any other zone 0.1.
+
+    Args:
+        config: Environment configuration
+
+    Returns:
+        Symmetric (len(ZONES), len(ZONES)) array in ZONES order
+    """
+    table = np.full((len(ZONES), len(ZONES)), 0.1)
+    np.fill_diagonal(table, 0.5)
+    pairs = [
+        (ResourceZone.AQUATIC, ResourceZone.TERRESTRIAL, config.aquatic_terrestrial_cov),
+        (ResourceZone.AQUATIC, ResourceZone.MAST, config.aquatic_mast_cov),
+        (ResourceZone.TERRESTRIAL, ResourceZone.MAST, config.terrestrial_mast_cov),
+    ]
+    for zone_a, zone_b, value in pairs:
+        a, b = ZONE_INDEX[zone_a], ZONE_INDEX[zone_b]
+        table[a, b] = table[b, a] = value
+    return table
+
+
+@dataclass
+class ZoneFactorShocks:
+    """
+    Low-rank generator for correlated annual patch shocks.
+
+    The dense model gives patches i != j the covariance
+    C[z_i, z_j] * v_i * v_j (C from zone_correlation_matrix, v the patch
+    variability) and unit variance. The same structure is produced by one
+    common factor per zone plus independent noise:
+
+        x_i = v_i * (L f)[z_i] + sqrt(1 - v_i^2 C[z_i, z_i]) * e_i
+
+    with L L^T = C and f, e standard normal. A year costs O(n_patches)
+    instead of a dense matrix product.
+    """
+    zone: np.ndarray          # int64, zone index per patch
+    scale: np.ndarray         # float64, factor loading scale (variability)
+    loadings: np.ndarray      # (n_zones, n_zones), L with L L^T = C
+    noise_sd: np.ndarray      # float64, idiosyncratic SD per patch
+
+    @classmethod
+    def from_patches(cls, patches: PatchArrays,
+                     config: EnvironmentConfig) -> "ZoneFactorShocks":
+        """
+        Build the factor model for a set of patches.
+
+        Negative eigenvalues of the zone correlation table, if any, are
+        clipped to zero.
+
+        Args:
+            patches: Patch arrays (zone and variability are used)
+            config: Environment configuration (zone correlations)
+
+        Returns:
+            ZoneFactorShocks for these patches
+        """
+        table = zone_correlation_matrix(config)
+        eigvals, eigvecs = np.linalg.eigh(table)
+        loadings = eigvecs * np.sqrt(np.clip(eigvals, 0.0, None))
+
+        scale = patches.variability.copy()
+        common_var = scale ** 2 * np.diag(table)[patches.zone]
+        noise_sd = np.sqrt(np.clip(1.0 - common_var, 0.0, None))
+
+        return cls(zone=patches.zone.copy(), scale=scale,
+                   loadings=loadings, noise_sd=noise_sd)
+
+    def draw(self, rng: np.random.Generator, n_years: int) -> np.ndarray:
+        """
+        Draw unit shocks for several years.
+
+        Args:
+            rng: Random number generator
+            n_years: Number of years
+
+        Returns:
+            Array (n_years, n_patches)
+        """
+        factors = rng.standard_normal((n_years, self.loadings.shape[1]))
+        zone_shocks = factors @ self.loadings.T
+        noise = rng.standard_normal((n_years, len(self.zone)))
+        return self.scale * zone_shocks[:, self.zone] + self.noise_sd * noise
+
+    def covariance(self) -> np.ndarray:
+        """Dense covariance implied by the model (for validation)."""
+        table = self.loadings @ self.loadings.T
+        cov = np.outer(self.scale, self.scale) * table[np.ix_(self.zone, self.zone)]
+        cov[np.diag_indices_from(cov)] += self.noise_sd ** 2
+        return cov
+
 
 class Environment:
     """
@@ -153,11 +512,35 @@ class Environment:
         self.year = 0
         self.month = 1
 
-        # Initialize patches
-        self.patches = self._create_patches()
+        # Initialize patches; state lives in arrays, with EcologicalPatch
+        # views for per-patch access
+        self.patch_state = PatchArrays.from_patches(self._create_patches())
+        self.patches: List[EcologicalPatch] = [
+            PatchView(self.patch_state, i)
+            for i in range(self.patch_state.n_patches)
+        ]
+
+        # Spatial index for radius queries (patches never move)
+        self.patch_index = GridIndex.for_density(
+            self.patch_state.x, self.patch_state.y, config.region_size
+        )
+
+        # Create covariance matrix for annual shocks, factored once, or
+        # the low-rank zone-factor model for large landscapes
+        if config.shock_model == "dense":
+            self.cov_matrix, self.shock_factor = self._dense_shock_model()
+            self.factor_shocks = None
+        elif config.shock_model == "zone_factor":
+            self.cov_matrix = None
+            self.shock_factor = None
+            self.factor_shocks = ZoneFactorShocks.from_patches(self.patch_state, config)
+        else:
+            raise ValueError(f"Unknown shock model '{config.shock_model}'. "
+                             f"Available: dense, zone_factor")
 
-        # Create covariance matrix for annual shocks
-        self.cov_matrix = self._build_covariance_matrix()
+        # Pre-generated annual shocks (see pregenerate_shocks)
+        self._pending_shocks = np.zeros((0, self.patch_state.n_patches))
+        self._next_shock = 0
 
     def _create_patches(self) -> List[EcologicalPatch]:
         """Create spatially distributed patches of each zone type."""
@@ -243,59 +626,67 @@ class Environment:
         Build covariance matrix for annual productivity shocks.
 
         Patches of different zone types can have correlated shocks.
-        Negative correlation = buffering effect.
-        """
-        n = len(self.patches)
-        cov = np.eye(n)
-
-        for i, patch_i in enumerate(self.patches):
-            for j, patch_j in enumerate(self.patches):
-                if i >= j:
-                    continue
-
-                # Base covariance on zone types
-                zones = {patch_i.zone_type, patch_j.zone_type}
-
-                if zones == {ResourceZone.AQUATIC, ResourceZone.TERRESTRIAL}:
-                    cov_val = self.config.aquatic_terrestrial_cov
-                elif zones == {ResourceZone.AQUATIC, ResourceZone.MAST}:
-                    cov_val = self.config.aquatic_mast_cov
-                elif zones == {ResourceZone.TERRESTRIAL, ResourceZone.MAST}:
-                    cov_val = self.config.terrestrial_mast_cov
-                elif patch_i.zone_type == patch_j.zone_type:
-                    # Same zone type: positive correlation
-                    cov_val = 0.5
-                else:
-                    # Ecotone with others: slight positive
-                    cov_val = 0.1
+        Negative correlation = buffering effect. The matrix is cached by
+        zone correlations, zone layout and variabilities (see
+        _dense_shock_model), so replicates of one config share it.
+        """
+        return self._dense_shock_model()[0]
+
+    def _dense_shock_model(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Cached (covariance, factor) for this landscape's patches."""
+        patches = self.patch_state
+        table = zone_correlation_matrix(self.config)
+        return _dense_shock_model(
+            tuple(table.ravel().tolist()),
+            patches.zone.astype(np.int64).tobytes(),
+            patches.variability.astype(float).tobytes()
+        )
 
-                # Scale by variance
-                var_i = patch_i.variability ** 2
-                var_j = patch_j.variability ** 2
-                cov[i, j] = cov_val * np.sqrt(var_i * var_j)
-                cov[j, i] = cov[i, j]
+    def draw_shocks(self, n_years: int) -> np.ndarray:
+        """
+        Draw annual shocks for several years in one batch.
 
-        # Ensure positive semi-definite
-        eigvals = np.linalg.eigvalsh(cov)
-        if eigvals.min() < 0:
-            cov += np.eye(n) * (abs(eigvals.min()) + 0.01)
+        Args:
+            n_years: Number of years
 
-        return cov
+        Returns:
+            Array (n_years, n_patches) of annual_shock values, identical to
+            what n_years successive advance_year calls would draw
+        """
+        if self.factor_shocks is not None:
+            shocks = self.factor_shocks.draw(self.rng, n_years)
+        else:
+            n = self.patch_state.n_patches
+            z = self.rng.standard_normal((n_years, 1, n))
+            shocks = (z @ self.shock_factor.T)[:, 0]
+        return shocks * self.patch_state.variability
+
+    def pregenerate_shocks(self, n_years: int) -> None:
+        """
+        Pre-generate the next n_years of shocks for advance_year.
+
+        Later years beyond the pre-generated ones are drawn as usual, so
+        the sequence of shocks does not depend on whether this is called.
+
+        Args:
+            n_years: Number of years (e.g. the simulation duration)
+        """
+        pending = self._pending_shocks[self._next_shock:]
+        self._pending_shocks = np.concatenate([pending, self.draw_shocks(n_years)])
+        self._next_shock = 0
 
     def advance_year(self) -> None:
         """Advance to a new year with correlated productivity shocks."""
         self.year += 1
 
-        # Generate correlated annual shocks
-        n = len(self.patches)
-        try:
-            shocks = self.rng.multivariate_normal(np.zeros(n), self.cov_matrix)
-        except np.linalg.LinAlgError:
-            # Fallback to independent shocks if covariance issues
-            shocks = self.rng.normal(0, 1, n)
+        # Correlated annual shocks, pre-generated or drawn now
+        if self._next_shock < len(self._pending_shocks):
+            shocks = self._pending_shocks[self._next_shock]
+            self._next_shock += 1
+        else:
+            shocks = self.draw_shocks(1)[0]
 
-        for i, patch in enumerate(self.patches):
-            patch.annual_shock = shocks[i] * patch.variability
+        self.patch_state.annual_shock = shocks.copy()
 
     def advance_month(self) -> None:
         """Advance to the next month."""
@@ -308,13 +699,90 @@ class Environment:
         """Get current productivity for a specific patch."""
         return self.patches[patch_id].get_seasonal_productivity(self.month)
 
+    def get_patch_productivities(self) -> np.ndarray:
+        """Get current productivity for every patch, in patch order."""
+        return self.patch_state.seasonal_productivity(self.month)
+
+    def get_season_productivities(self, months: Sequence[int]) -> np.ndarray:
+        """
+        Get productivity for every patch in each of several months.
+
+        Args:
+            months: Months of the current year (1-12)
+
+        Returns:
+            Array (len(months), n_patches), row k as get_patch_productivities()
+            would return it with month = months[k]
+        """
+        return self.patch_state.season_productivity(months)
+
+    def query_patches(self, points: np.ndarray, radius: float
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find the patches within a radius of many points in one call.
+
+        Args:
+            points: (n, 2) array of (x, y) coordinates
+            radius: Query radius (km)
+
+        Returns:
+            (point_idx, patch_idx, distance) for every pair within the
+            radius, ordered by point and then patch id
+        """
+        return self.patch_index.query_radius(points, radius)
+
+    def build_access_matrix(self, points: np.ndarray,
+                            access_radius: float = 50.0) -> AccessMatrix:
+        """
+        Precompute patch access for fixed locations.
+
+        Args:
+            points: (n, 2) array of (x, y) coordinates
+            access_radius: Maximum distance to access resources
+
+        Returns:
+            AccessMatrix reproducing get_location_value for each point
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        point_idx, patch_idx, distance = self.query_patches(points, access_radius)
+        weights = 1.0 - distance / access_radius
+
+        # Zones with at least one accessible patch, per point
+        zones = self.patch_state.zone[patch_idx]
+        n_zones = len(ZONES)
+        has_zone = np.zeros((len(points), n_zones), dtype=bool)
+        has_zone[point_idx, zones] = True
+        n_zones_accessible = has_zone.sum(axis=1)
+        diversity_bonus = np.where(n_zones_accessible > 1,
+                                   0.1 * (n_zones_accessible - 1), 0.0)
+
+        return AccessMatrix(
+            n_points=len(points),
+            access_radius=access_radius,
+            points=point_idx,
+            patches=patch_idx,
+            zones=zones,
+            weights=weights,
+            diversity_bonus=diversity_bonus,
+            n_zones_accessible=n_zones_accessible
+        )
+
     def get_zone_productivity(self, zone: ResourceZone) -> float:
         """Get average productivity across all patches of a zone type."""
-        zone_patches = [p for p in self.patches if p.zone_type == zone]
-        if not zone_patches:
-            return 0.0
-        return float(np.mean([p.get_seasonal_productivity(self.month)
-                       for p in zone_patches]))
+        return float(self.get_zone_productivities()[ZONE_INDEX[zone]])
+
+    def get_zone_productivities(self) -> np.ndarray:
+        """
+        Get average productivity per zone type.
+
+        Returns:
+            Array (len(ZONES),) in ZONES order, 0 for zones without patches
+        """
+        prod = self.get_patch_productivities()
+        zone = self.patch_state.zone
+        totals = np.bincount(zone, weights=prod, minlength=len(ZONES))
+        counts = np.bincount(zone, minlength=len(ZONES))
+        return np.where(counts > 0, totals / np.maximum(counts, 1), 0.0)
 
     def get_location_value(self, location: Tuple[float, float],
                           access_radius: float = 50.0) -> Dict[str, float]:
@@ -328,23 +796,14 @@ class Environment:
         Returns:
             Dictionary with productivity by zone type and total
         """
-        values = {zone.value: 0.0 for zone in ResourceZone}
-        n_accessible = {zone.value: 0 for zone in ResourceZone}
+        access = self.build_access_matrix([location], access_radius)
 
-        for patch in self.patches:
-            dx = patch.location[0] - location[0]
-            dy = patch.location[1] - location[1]
-            distance = np.sqrt(dx**2 + dy**2)
-
-            if distance <= access_radius:
-                # Productivity weighted by proximity
-                weight = 1.0 - (distance / access_radius)
-                prod = patch.get_seasonal_productivity(self.month)
-                values[patch.zone_type.value] += prod * weight
-                n_accessible[patch.zone_type.value] += 1
+        # Productivity weighted by proximity
+        zone_values = access.zone_values(self.get_patch_productivities())[0]
+        values = {zone.value: float(zone_values[z]) for z, zone in enumerate(ZONES)}
 
         # Calculate diversity bonus (access to multiple zone types)
-        n_zones = sum(1 for v in n_accessible.values() if v > 0)
+        n_zones = int(access.n_zones_accessible[0])
         diversity_bonus = 0.1 * (n_zones - 1) if n_zones > 1 else 0
 
         total = sum(values.values()) + diversity_bonus
@@ -354,6 +813,21 @@ class Environment:
 
         return values
 
+    def score_sites(self, candidates: np.ndarray,
+                    access_radius: float = 50.0) -> np.ndarray:
+        """
+        Total location value of many candidate sites at once.
+
+        Args:
+            candidates: (n, 2) array of (x, y) coordinates
+            access_radius: Maximum distance to access resources
+
+        Returns:
+            Array (n,) of get_location_value(...)['total']
+        """
+        access = self.build_access_matrix(candidates, access_radius)
+        return access.totals(self.get_patch_productivities())
+
     def find_optimal_aggregation_site(self,
                                       n_candidates: int = 100,
                                       access_radius: float = 50.0
@@ -361,24 +835,199 @@ class Environment:
         """
         Find the optimal location for aggregation based on resource access.
 
+        Scores n_candidates uniformly random locations in one batch.
+
         Returns:
             Tuple of (best_location, value)
         """
         best_location = (self.config.region_size / 2, self.config.region_size / 2)
         best_value = 0.0
 
-        for _ in range(n_candidates):
-            x = self.rng.uniform(0, self.config.region_size)
-            y = self.rng.uniform(0, self.config.region_size)
-            value_dict = self.get_location_value((x, y), access_radius)
-            total = value_dict['total']
+        candidates = self.rng.uniform(0, self.config.region_size, (n_candidates, 2))
+        values = self.score_sites(candidates, access_radius)
 
-            if total > best_value:
-                best_value = total
-                best_location = (x, y)
+        # First candidate with the highest positive value
+        if n_candidates > 0 and values.max() > best_value:
+            best = int(np.argmax(values))
+            best_value = float(values[best])
+            best_location = (float(candidates[best, 0]), float(candidates[best, 1]))
 
         return best_location, best_value
 
+    def search_aggregation_site(self,
+                                access_radius: float = 50.0,
+                                grid_size: int = 16,
+                                n_keep: int = 4,
+                                precision: float = 0.5
+                                ) -> Tuple[Tuple[float, float], float]:
+        """
+        Find the optimal aggregation location by coarse-to-fine grid search.
+
+        Scores a grid_size x grid_size grid of cell centres, then
+        repeatedly scores a 5 x 5 grid around each of the n_keep best
+        candidates at half the previous spacing, until the spacing is
+        below precision. Deterministic and draws no random numbers.
+
+        Args:
+            access_radius: Maximum distance to access resources
+            grid_size: Cells per side of the initial grid
+            n_keep: Candidates refined at each level
+            precision: Final grid spacing (km)
+
+        Returns:
+            Tuple of (best_location, value)
+        """
+        region = self.config.region_size
+        spacing = region / grid_size
+        centres = (np.arange(grid_size) + 0.5) * spacing
+        candidates = np.stack(np.meshgrid(centres, centres, indexing='ij'),
+                              axis=-1).reshape(-1, 2)
+        values = self.score_sites(candidates, access_radius)
+
+        best = int(np.argmax(values))
+        best_location, best_value = candidates[best], values[best]
+
+        local = np.linspace(-1.0, 1.0, 5)
+        local = np.stack(np.meshgrid(local, local, indexing='ij'), axis=-1).reshape(-1, 2)
+        while spacing > precision:
+            keep = candidates[np.argsort(-values, kind='stable')[:n_keep]]
+            candidates = np.clip((keep[:, None, :] + local[None] * spacing).reshape(-1, 2),
+                                 0.0, region)
+            spacing /= 2
+            values = self.score_sites(candidates, access_radius)
+
+            best = int(np.argmax(values))
+            if values[best] > best_value:
+                best_location, best_value = candidates[best], values[best]
+
+        return (float(best_location[0]), float(best_location[1])), float(best_value)
+
+
+def _covariance_from_layout(table: np.ndarray, zone: np.ndarray,
+                            variability: np.ndarray) -> np.ndarray:
+    """
+    Dense shock covariance for a patch layout, by broadcasting.
+
+    Off-diagonal entries are table[z_i, z_j] * sqrt(v_i^2 * v_j^2) with unit
+    diagonal. If the result is not positive semi-definite, a ridge of
+    |min eigenvalue| + 0.01 is added.
+
+    Args:
+        table: Zone correlation table (zone_correlation_matrix)
+        zone: Zone index per patch
+        variability: Variability per patch
+
+    Returns:
+        Covariance matrix (n_patches, n_patches)
+    """
+    n = len(zone)
+    var = variability ** 2
+    cov = table[np.ix_(zone, zone)] * np.sqrt(np.outer(var, var))
+    np.fill_diagonal(cov, 1.0)
+
+    # Ensure positive semi-definite
+    if n > 0:
+        min_eigval = np.linalg.eigvalsh(cov).min()
+        if min_eigval < 0:
+            cov += np.eye(n) * (abs(min_eigval) + 0.01)
+
+    return cov
+
+
+def _factor_covariance(cov: np.ndarray) -> np.ndarray:
+    """
+    Factor the shock covariance once.
+
+    Uses the SVD factor F = U sqrt(S), as rng.multivariate_normal does,
+    so z @ F.T for standard normal z reproduces its draws for the same
+    seed. If the decomposition fails, falls back to independent shocks.
+
+    Args:
+        cov: Covariance matrix
+
+    Returns:
+        Factor F with F @ F.T == cov
+    """
+    try:
+        u, s, _ = np.linalg.svd(cov)
+    except np.linalg.LinAlgError:
+        return np.eye(len(cov))
+    return u * np.sqrt(s)
+
+
+@lru_cache(maxsize=16)
+def _dense_shock_model(table: Tuple[float, ...], zone: bytes,
+                       variability: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Covariance and factor for a landscape, cached by its key.
+
+    Patch zones and variabilities come from the config rather than the
+    seed, so every replicate of a config hits the same entry. The arrays
+    are shared between environments and marked read-only.
+
+    Args:
+        table: Flattened zone correlation table
+        zone: Zone index per patch (int64 bytes)
+        variability: Variability per patch (float64 bytes)
+
+    Returns:
+        (covariance, factor)
+    """
+    n_zones = len(ZONES)
+    cov = _covariance_from_layout(
+        np.array(table).reshape(n_zones, n_zones),
+        np.frombuffer(zone, dtype=np.int64),
+        np.frombuffer(variability, dtype=float)
+    )
+    factor = _factor_covariance(cov)
+    cov.flags.writeable = False
+    factor.flags.writeable = False
+    return cov, factor
+
+
+def validate_shock_model(config: Optional[EnvironmentConfig] = None,
+                         n_samples: int = 20000,
+                         seed: int = 42) -> Dict[str, float]:
+    """
+    Compare the zone-factor shock model against the dense covariance.
+
+    Builds the same landscape with both models, samples unit shocks from
+    the factor model and compares their empirical covariance with the
+    dense matrix (including its PSD repair, if one was applied).
+
+    Args:
+        config: Environment configuration (uses defaults if None)
+        n_samples: Number of sampled years
+        seed: Random seed (same landscape for both models)
+
+    Returns:
+        Dictionary with max_abs_error and relative_frobenius_error of the
+        empirical covariance, and the same for the model's exact
+        covariance (model_max_abs_error, model_relative_frobenius_error)
+    """
+    config = config or EnvironmentConfig()
+    dense = Environment(replace(config, shock_model="dense"), seed=seed)
+    factor = Environment(replace(config, shock_model="zone_factor"), seed=seed)
+
+    target = dense.cov_matrix
+    model = factor.factor_shocks
+    samples = model.draw(np.random.default_rng(seed), n_samples)
+    empirical = np.cov(samples, rowvar=False)
+
+    def errors(cov: np.ndarray) -> Tuple[float, float]:
+        diff = cov - target
+        return (float(np.abs(diff).max()),
+                float(np.linalg.norm(diff) / np.linalg.norm(target)))
+
+    max_abs, rel_frob = errors(empirical)
+    model_max_abs, model_rel_frob = errors(model.covariance())
+    return {
+        'max_abs_error': max_abs,
+        'relative_frobenius_error': rel_frob,
+        'model_max_abs_error': model_max_abs,
+        'model_relative_frobenius_error': model_rel_frob,
+    }
+
 
 def test_environment():
     """Test the environmental model."""
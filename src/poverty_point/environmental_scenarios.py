@@ -36,6 +36,13 @@ class ShortfallParams:
     # duration = max(1, int(1 + magnitude * duration_scale))
     duration_scale: float = 2.5
 
+    # Effective σ = shortfall_sigma_weight * (σ from frequency × magnitude)
+    #             + env_sigma_weight * (2 × CV of mean zone productivity
+    #               over the last sigma_window years)
+    sigma_window: int = 10
+    shortfall_sigma_weight: float = 0.7
+    env_sigma_weight: float = 0.3
+
 
 @dataclass
 class EnvironmentalScenario:
@@ -14,11 +14,11 @@ than abstract σ parameters.
 
 import numpy as np
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Union
 from enum import Enum
 
 from .environment import (
-    Environment, EnvironmentConfig, ResourceZone, EcologicalPatch
+    Environment, EnvironmentConfig, ResourceZone, EcologicalPatch, ZONES, ZONE_INDEX
 )
 from .parameters import (
     SimulationParameters, default_parameters,
@@ -26,8 +26,17 @@ from .parameters import (
     CostParameters, VulnerabilityParameters, CooperationParameters,
     EnvironmentParameters, PopulationParameters
 )
-from .agents import Band, AggregationSite, Strategy
+from .agents import (
+    Band, AggregationSite, Strategy, HistoryRetention, ObligationNetwork,
+    PopulationCounters, aggregation_probability, decide_strategies, memory_adjustment_array,
+    apply_shortfall_mortality, apply_reproduction
+)
+from .vectorized_simulation import BandArrays
 from .environmental_scenarios import ShortfallParams, EnvironmentalScenario
+from .timeseries import (
+    StateSeries, StreamingSummary, RunningStats, RollingWindow, format_progress,
+    make_state_series
+)
 
 
 @dataclass
@@ -70,6 +79,38 @@ class IntegratedState:
     mean_fitness_independents: float
 
 
+@dataclass
+class MonthlyState:
+    """
+    Light per-month snapshot for seasonality analyses.
+
+    Recorded in monthly trace mode (params.monthly_trace). Each field
+    group is only computed if one of its fields is recorded.
+    """
+    year: int
+    month: int
+
+    # Environment: mean patch productivity per zone
+    productivity_aquatic: float
+    productivity_terrestrial: float
+    productivity_mast: float
+    productivity_ecotone: float
+
+    # Bands
+    mean_resources: float
+    total_population: int
+    n_aggregators: int
+
+    # Aggregation site
+    aggregation_size: int
+    monument_level: float
+
+
+# MonthlyState fields computed from each source
+_MONTHLY_PRODUCTIVITY_FIELDS = {f'productivity_{zone.value}' for zone in ZONES}
+_MONTHLY_BAND_FIELDS = {'mean_resources', 'total_population', 'n_aggregators'}
+
+
 @dataclass
 class IntegratedResults:
     """Complete results from integrated simulation."""
@@ -77,9 +118,15 @@ class IntegratedResults:
     seed: int
     duration_years: int
 
-    # Time series
-    yearly_states: List[IntegratedState] = field(default_factory=list)
-    monthly_states: List[IntegratedState] = field(default_factory=list)
+    # Time series, one column per recorded IntegratedState field (or running
+    # statistics only, in summary-only mode)
+    yearly_states: Union[StateSeries, StreamingSummary] = field(
+        default_factory=lambda: StateSeries(IntegratedState)
+    )
+    # Monthly trace (empty unless params.monthly_trace)
+    monthly_states: StateSeries = field(
+        default_factory=lambda: StateSeries(MonthlyState)
+    )
 
     # Summary (post-burn-in)
     final_strategy_dominance: float = 0.0
@@ -89,27 +136,70 @@ class IntegratedResults:
     mean_population: float = 0.0
     mean_effective_sigma: float = 0.0
 
+    # Post-burn-in statistics per summary field
+    statistics: Dict[str, RunningStats] = field(default_factory=dict)
+
     def compute_summary(self, burn_in: int = 100) -> None:
-        """Compute summary statistics from time series."""
-        analysis_states = [s for s in self.yearly_states if s.year >= burn_in]
+        """
+        Compute summary statistics from time series.
 
-        if not analysis_states:
-            return
+        Fills `statistics` with mean, variance, min and max of each summary
+        field after burn-in. A summary field that was not recorded (see
+        params.record_fields) has no `statistics` entry, and the summary
+        attribute computed from it stays at its default of 0.
+        """
+        stats = self.yearly_states.summarize(burn_in)
+        self.statistics = stats
+
+        if 'strategy_dominance' in stats:
+            self.final_strategy_dominance = stats['strategy_dominance'].mean
+        if 'aggregation_size' in stats:
+            self.mean_aggregation_size = stats['aggregation_size'].mean
+        if 'monument_level' in stats:
+            self.final_monument_level = stats['monument_level'].last
+        if 'total_exotics' in stats:
+            self.total_exotics = int(stats['total_exotics'].last)
+        if 'total_population' in stats:
+            self.mean_population = stats['total_population'].mean
+        if 'effective_sigma' in stats:
+            self.mean_effective_sigma = stats['effective_sigma'].mean
+
+
+def effective_sigma(shortfall_params: ShortfallParams,
+                    productivity: RollingWindow) -> Union[float, np.ndarray]:
+    """
+    Effective environmental uncertainty (σ) from shortfalls and productivity.
 
-        self.final_strategy_dominance = np.mean([
-            s.strategy_dominance for s in analysis_states
-        ])
-        self.mean_aggregation_size = np.mean([
-            s.aggregation_size for s in analysis_states
-        ])
-        self.final_monument_level = analysis_states[-1].monument_level
-        self.total_exotics = analysis_states[-1].total_exotics
-        self.mean_population = np.mean([
-            s.total_population for s in analysis_states
-        ])
-        self.mean_effective_sigma = np.mean([
-            s.effective_sigma for s in analysis_states
-        ])
+    Combines:
+    1. A base σ from shortfall frequency and magnitude
+    2. Twice the CV of mean productivity over the rolling window, once at
+       least 5 years (or the whole window, if shorter) have been observed
+
+    Works elementwise when the window holds one value per replicate.
+
+    Args:
+        shortfall_params: Shortfall frequency, magnitude and σ weights
+        productivity: Rolling window of annual mean productivity
+
+    Returns:
+        σ clipped to [0, 1] (an array if the window holds arrays)
+    """
+    sp = shortfall_params
+
+    # Higher frequency and magnitude = higher sigma
+    base_sigma = 5.0 * (1.0 / sp.mean_interval) * sp.magnitude_mean
+
+    if productivity.count < min(5, productivity.window):
+        sigma = np.full(np.shape(productivity.mean()), base_sigma)
+    else:
+        mean_prod = productivity.mean()
+        safe_mean = np.where(mean_prod > 0, mean_prod, 1.0)
+        env_sigma = np.where(mean_prod > 0,
+                             productivity.std() / safe_mean * 2.0, 0.0)
+        sigma = (sp.shortfall_sigma_weight * base_sigma +
+                 sp.env_sigma_weight * env_sigma)
+
+    return np.clip(sigma, 0.0, 1.0)
 
 
 class Season(Enum):
@@ -145,13 +235,24 @@ class IntegratedSimulation:
 
     Environmental σ is derived from actual productivity variance rather
     than being an input parameter.
+
+    Each season spans three months. The "monthly" step kernel runs the
+    season handlers band by band once per month. The "seasonal" kernel
+    packs band state into arrays once per year and evaluates each season
+    in one pass: the three months' productivities and location values are
+    computed together, and the per-month updates are array operations
+    over all bands. It applies the same monthly updates with the same
+    seasonal multipliers, but draws random numbers per season rather than
+    per band, so it matches the monthly kernel in distribution, not bit
+    for bit.
     """
 
     def __init__(self,
                  params: Optional[SimulationParameters] = None,
                  env_config: Optional[EnvironmentConfig] = None,
                  shortfall_params: Optional[ShortfallParams] = None,
-                 seed: int = 42):
+                 seed: int = 42,
+                 step_kernel: str = "monthly"):
         """
         Initialize integrated simulation.
 
@@ -160,7 +261,17 @@ class IntegratedSimulation:
             env_config: Environment configuration (uses defaults if None)
             shortfall_params: Shortfall generation parameters (uses defaults if None)
             seed: Random seed
+            step_kernel: "monthly" (reference) or "seasonal" (one array
+                pass per season)
+
+        Raises:
+            ValueError: If step_kernel is unknown
         """
+        if step_kernel not in ("monthly", "seasonal"):
+            raise ValueError(f"Unknown step kernel '{step_kernel}'. "
+                             f"Available: monthly, seasonal")
+        self.step_kernel = step_kernel
+
         self.params = params or default_parameters(seed=seed)
         self.params.seed = seed
 
@@ -187,13 +298,39 @@ class IntegratedSimulation:
         # Initialize bands (from agents.py pattern)
         self.bands = self._create_bands()
 
+        # Running population totals, updated as band state changes
+        self.counters = PopulationCounters.from_bands(self.bands)
+
+        # Reciprocal obligations between bands
+        self.obligations = ObligationNetwork(len(self.bands))
+
         # Initialize aggregation site at ecotone location
         self.aggregation_site = self._create_aggregation_site()
 
+        # Draw the whole run's correlated patch shocks in one batch
+        self.environment.pregenerate_shocks(self.params.duration)
+
+        # Band homes and the site never move, so patch access for each
+        # radius used is precomputed once
+        homes = np.array([b.home_location for b in self.bands])
+        self.band_access = {
+            radius: self.environment.build_access_matrix(homes, radius)
+            for radius in (50.0, 60.0)
+        }
+        self.site_access = {
+            radius: self.environment.build_access_matrix(
+                [self.aggregation_site.location], radius)
+            for radius in (50.0, 80.0)
+        }
+        self.travel_costs = np.array([
+            b.calculate_travel_cost(self.aggregation_site.location)
+            for b in self.bands
+        ])
+
         # State tracking
         self.year = 0
         self.month = 1
-        self.annual_productivities: List[float] = []
+        self.annual_productivities = RollingWindow(self.shortfall_params.sigma_window)
         self.effective_sigma = 0.0
 
         # Shortfall tracking
@@ -204,8 +341,16 @@ class IntegratedSimulation:
         # Results
         self.results = IntegratedResults(
             seed=seed,
-            duration_years=self.params.duration
+            duration_years=self.params.duration,
+            yearly_states=make_state_series(IntegratedState, self.params)
         )
+        if self.params.monthly_trace:
+            fields = self.params.monthly_fields
+            self.results.monthly_states = StateSeries(
+                MonthlyState, capacity=12 * self.params.duration,
+                fields=None if fields is None else tuple(fields) + ('month',)
+            )
+        self._monthly_fields = frozenset(self.results.monthly_states.fields)
 
     def _create_bands(self) -> List[Band]:
         """Create initial band population distributed across region."""
@@ -226,7 +371,9 @@ class IntegratedSimulation:
                 size=self.params.population.initial_band_size + self.rng.integers(-5, 6),
                 home_location=(x, y),
                 strategy=strategy,
-                resources=0.4 + 0.2 * self.rng.random()
+                resources=0.4 + 0.2 * self.rng.random(),
+                history_retention=HistoryRetention(self.params.history_retention),
+                history_window=self.params.history_window
             )
             bands.append(band)
 
@@ -235,10 +382,19 @@ class IntegratedSimulation:
     def _create_aggregation_site(self) -> AggregationSite:
         """Create aggregation site at optimal ecotone location."""
         # Find best location using environment model
-        best_loc, best_val = self.environment.find_optimal_aggregation_site(
-            n_candidates=200,
-            access_radius=self.env_config.region_size * 0.1
-        )
+        access_radius = self.env_config.region_size * 0.1
+        if self.env_config.site_search == "random":
+            best_loc, best_val = self.environment.find_optimal_aggregation_site(
+                n_candidates=200,
+                access_radius=access_radius
+            )
+        elif self.env_config.site_search == "grid":
+            best_loc, best_val = self.environment.search_aggregation_site(
+                access_radius=access_radius
+            )
+        else:
+            raise ValueError(f"Unknown site search '{self.env_config.site_search}'. "
+                             f"Available: random, grid")
 
         # Calculate ecotone advantage (ε) from location value
         # Normalize to [0, 1] based on expected range
@@ -260,32 +416,10 @@ class IntegratedSimulation:
         2. Shortfall frequency and severity from shortfall_params
 
         The shortfall parameters directly represent σ in the theoretical model.
+        The productivity CV is taken over a rolling window of
+        shortfall_params.sigma_window years (see effective_sigma).
         """
-        # Base sigma from shortfall parameters
-        # Higher frequency and magnitude = higher sigma
-        freq_component = 1.0 / self.shortfall_params.mean_interval  # More frequent = higher
-        mag_component = self.shortfall_params.magnitude_mean
-
-        # Combine: σ ≈ frequency * magnitude (scaled)
-        base_sigma = 5.0 * freq_component * mag_component
-
-        # Add environmental variance component
-        if len(self.annual_productivities) >= 5:
-            recent_prods = self.annual_productivities[-10:]
-            mean_prod = np.mean(recent_prods)
-            std_prod = np.std(recent_prods)
-            if mean_prod > 0:
-                cv = std_prod / mean_prod
-                env_sigma = cv * 2.0
-            else:
-                env_sigma = 0.0
-
-            # Weighted combination
-            sigma = 0.7 * base_sigma + 0.3 * env_sigma
-        else:
-            sigma = base_sigma
-
-        return float(np.clip(sigma, 0.0, 1.0))
+        return float(effective_sigma(self.shortfall_params, self.annual_productivities))
 
     def _evaluate_shortfall(self) -> Tuple[bool, float]:
         """
@@ -297,20 +431,13 @@ class IntegratedSimulation:
         Returns:
             (is_shortfall, severity)
         """
-        # Get mean productivity across all zones
-        mean_prod = 0.0
-        n_zones = 0
-        for zone in ResourceZone:
-            zone_prod = self.environment.get_zone_productivity(zone)
-            if zone_prod > 0:
-                mean_prod += zone_prod
-                n_zones += 1
-
-        if n_zones > 0:
-            mean_prod /= n_zones
+        # Get mean productivity across zones with positive productivity
+        zone_prod = self.environment.get_zone_productivities()
+        positive = zone_prod[zone_prod > 0]
+        mean_prod = positive.sum() / len(positive) if len(positive) > 0 else 0.0
 
         # Record for sigma calculation
-        self.annual_productivities.append(float(mean_prod))
+        self.annual_productivities.push(mean_prod)
 
         # Check for continuing shortfall
         if self.shortfall_remaining > 0:
@@ -340,13 +467,13 @@ class IntegratedSimulation:
         Spring dispersal: Bands forage independently.
         Resource acquisition based on actual zone productivity.
         """
-        for band in self.bands:
-            # Get productivity near band's home location
-            location_value = self.environment.get_location_value(
-                band.home_location,
-                access_radius=50.0
-            )
-            base_harvest = location_value['total'] * 0.3
+        # Productivity near each band's home location
+        location_totals = self.band_access[50.0].totals(
+            self.environment.get_patch_productivities()
+        )
+
+        for band, location_total in zip(self.bands, location_totals):
+            base_harvest = location_total * 0.3
 
             # Aggregators prepare for travel (reduced foraging)
             if band.strategy == Strategy.AGGREGATOR:
@@ -369,25 +496,30 @@ class IntegratedSimulation:
         # Calculate expected aggregation benefits
         expected_n = max(5, self.aggregation_site.n_attending)
 
-        # Get actual ecotone value at aggregation site
-        site_value = self.environment.get_location_value(
-            self.aggregation_site.location,
-            access_radius=80.0  # Larger radius during aggregation
-        )
-        ecotone_benefit = site_value.get('diversity_bonus', 0.0)
+        # Get actual ecotone value at aggregation site (larger radius
+        # during aggregation) and home values for independents
+        productivity = self.environment.get_patch_productivities()
+        site_access = self.site_access[80.0]
+        site_total = site_access.totals(productivity)[0]
+        ecotone_benefit = site_access.diversity_bonus[0]
+        location_totals = self.band_access[50.0].totals(productivity)
 
         total_construction = 0.0
 
-        for band in self.bands:
-            # Bands decide strategy based on current conditions
-            band.strategy = band.decide_strategy(
-                expected_n=expected_n,
-                sigma=self.effective_sigma,
-                epsilon=self.aggregation_site.ecotone_advantage,
-                params=self.params,
-                rng=self.rng
-            )
-            band.strategy_history.append(band.strategy)
+        # Bands decide strategy based on current conditions; expected
+        # fitness is the same for every band, so all choose at once
+        fitness_diff = (
+            W_aggregator(self.effective_sigma, self.aggregation_site.ecotone_advantage,
+                         expected_n, self.params) -
+            W_independent(self.effective_sigma, self.params)
+        )
+        aggregate = decide_strategies(self.bands, fitness_diff, self.rng)
+
+        for band, agg in zip(self.bands, aggregate.tolist()):
+            strategy = Strategy.AGGREGATOR if agg else Strategy.INDEPENDENT
+            self.counters.strategy_changed(band.strategy, strategy, band.last_fitness)
+            band.strategy = strategy
+            band.record_strategy(band.strategy)
 
             if band.strategy == Strategy.AGGREGATOR:
                 # Travel to aggregation site
@@ -398,10 +530,10 @@ class IntegratedSimulation:
 
                 # Register attendance
                 self.aggregation_site.add_attending_band(band)
-                band.aggregation_history.append(True)
+                band.record_aggregation(True)
 
                 # Benefit from ecotone resources during aggregation
-                aggregation_harvest = site_value['total'] * 0.2
+                aggregation_harvest = site_total * 0.2
                 band.resources += aggregation_harvest
 
                 # Monument investment
@@ -413,48 +545,87 @@ class IntegratedSimulation:
                     total_construction += investment
 
                 # Exotic acquisition
-                band.acquire_exotic(
-                    acquisition_cost=0.1,
-                    rng=self.rng
-                )
-
-                # Form social obligations
-                if len(self.aggregation_site.attending_bands) > 1:
-                    potential_partners = [
-                        b_id for b_id in self.aggregation_site.attending_bands
-                        if b_id != band.band_id
-                    ]
-                    if potential_partners and self.rng.random() < 0.3:
-                        partner_id = self.rng.choice(potential_partners)
-                        band.form_obligation(partner_id)
+                if band.acquire_exotic(acquisition_cost=0.1, rng=self.rng):
+                    self.counters.exotics_added(1)
 
             else:
                 # Independent: continue foraging at home
-                band.aggregation_history.append(False)
-                location_value = self.environment.get_location_value(
-                    band.home_location, access_radius=50.0
-                )
-                harvest = location_value['total'] * 0.25
+                band.record_aggregation(False)
+                harvest = location_totals[band.band_id] * 0.25
                 band.resources += harvest
                 band.resources = min(1.0, band.resources)
 
+        # Form social obligations among attending bands
+        self._form_obligations()
+
         # Record construction
         self.aggregation_site.record_construction(total_construction)
 
+    def _form_obligations(self) -> None:
+        """
+        Each attending band forms an obligation (p = 0.3) with a
+        uniformly chosen other attending band, as one bulk update.
+        """
+        site = self.aggregation_site
+        if site.n_attending < 2:
+            return
+
+        attending = site.attending_bands
+        forming = attending[self.rng.random(site.n_attending) < 0.3]
+        self.obligations.form(forming, site.sample_partners(forming, self.rng))
+
+    def _call_obligations(self, need: float) -> None:
+        """
+        Aggregators with obligations each call on one random partner.
+
+        Args:
+            need: Help requested per band
+        """
+        callers, help_received = self._draw_obligation_help(
+            np.array([b.strategy == Strategy.AGGREGATOR for b in self.bands],
+                     dtype=bool),
+            need
+        )
+        for band_id, amount in zip(callers.tolist(), help_received.tolist()):
+            self.bands[band_id].resources += amount
+
+    def _draw_obligation_help(self, is_aggregator: np.ndarray,
+                              need: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Aggregators with obligations each call on one random partner.
+
+        Args:
+            is_aggregator: Mask of aggregating bands, in band order
+            need: Help requested per band
+
+        Returns:
+            (callers, help_received): band ids that called and the help
+            each received
+        """
+        callers = np.flatnonzero(is_aggregator)
+        callers = callers[self.obligations.out_degree(callers) > 0]
+        if len(callers) == 0:
+            return callers, np.zeros(0)
+
+        return callers, self.obligations.call(
+            callers, need=need, u=self.rng.random(len(callers))
+        )
+
     def _run_fall_dispersal(self) -> None:
         """
         Fall dispersal: Mast harvest, final foraging before winter.
         """
-        for band in self.bands:
-            # Mast zone productivity peaks in fall
-            location_value = self.environment.get_location_value(
-                band.home_location,
-                access_radius=60.0
-            )
+        # Mast zone productivity peaks in fall
+        access = self.band_access[60.0]
+        zone_values = access.zone_values(self.environment.get_patch_productivities())
+        location_totals = zone_values.sum(axis=1) + access.diversity_bonus
+
+        # Extra benefit if mast is accessible
+        mast_bonus = zone_values[:, ZONE_INDEX[ResourceZone.MAST]] * 0.5
 
-            # Extra benefit if mast is accessible
-            mast_bonus = location_value.get('mast', 0.0) * 0.5
-            harvest = location_value['total'] * 0.2 + mast_bonus
+        for band, location_total, band_mast_bonus in zip(
+                self.bands, location_totals, mast_bonus):
+            harvest = location_total * 0.2 + band_mast_bonus
 
             # Consumption and storage for winter
             consumption = band.size * 0.012
@@ -464,85 +635,374 @@ class IntegratedSimulation:
     def _run_winter_mortality(self) -> None:
         """
         Winter: Mortality and reproduction based on fitness.
+
+        Shortfall deaths, births and baseline deaths are each drawn for
+        all bands at once.
         """
-        for band in self.bands:
-            # Calculate realized fitness
-            if band.aggregation_history and band.aggregation_history[-1]:
-                fitness = W_aggregator(
-                    self.effective_sigma,
-                    self.aggregation_site.ecotone_advantage,
-                    self.aggregation_site.n_attending,
-                    self.params
-                )
-            else:
-                fitness = W_independent(self.effective_sigma, self.params)
+        # Aggregators can call obligations during shortfall
+        if self.in_shortfall:
+            self._call_obligations(need=0.15)
+
+        # Realized fitness of each strategy, the same for every band
+        W_agg = W_aggregator(
+            self.effective_sigma,
+            self.aggregation_site.ecotone_advantage,
+            self.aggregation_site.n_attending,
+            self.params
+        )
+        W_ind = W_independent(self.effective_sigma, self.params)
+
+        n = len(self.bands)
+        fitness_by_band = np.empty(n)
+        for i, band in enumerate(self.bands):
+            fitness = W_agg if band.last_aggregated else W_ind
+            self.counters.fitness_recorded(band.strategy, band.last_fitness, fitness)
+            band.record_fitness(fitness)
+            fitness_by_band[i] = fitness
+
+        old_sizes = np.fromiter((b.size for b in self.bands), dtype=np.int64, count=n)
+        sizes = old_sizes
+
+        # Shortfall mortality
+        if self.in_shortfall:
+            is_agg = np.fromiter((b.strategy == Strategy.AGGREGATOR for b in self.bands),
+                                 dtype=bool, count=n)
+            vulnerability = np.where(is_agg, self.params.vulnerability.alpha_agg,
+                                     self.params.vulnerability.beta_ind)
+            sizes = apply_shortfall_mortality(
+                sizes, vulnerability * self.effective_sigma, self.rng
+            )
+
+        # Reproduction and band size constraints
+        pop = self.params.population
+        resources = np.fromiter((b.resources for b in self.bands), dtype=float, count=n)
+        sizes = apply_reproduction(
+            sizes, fitness_by_band, resources,
+            birth_rate=pop.birth_rate, death_rate=pop.death_rate,
+            min_size=pop.min_band_size, max_size=pop.max_band_size,
+            rng=self.rng
+        )
+
+        self.counters.size_changed(int(old_sizes.sum()), int(sizes.sum()))
+        for band, size in zip(self.bands, sizes.tolist()):
+            band.size = size
+
+    # -------------------------------------------------------------------------
+    # Seasonal step kernel
+    # -------------------------------------------------------------------------
+
+    def _run_spring_season(self, bs: BandArrays) -> None:
+        """
+        Spring dispersal (months 3-5) for all bands in one pass.
+
+        Same updates as three calls of _run_spring_dispersal.
+
+        Args:
+            bs: Band arrays (modified in place)
+        """
+        productivity = self.environment.get_season_productivities((3, 4, 5))
+        location_totals = self.band_access[50.0].totals(productivity)
+
+        harvest_share = np.where(bs.is_aggregator,
+                                 1 - self.params.costs.C_opportunity, 1.0)
+        consumption = bs.size * 0.015
+
+        for month, month_totals in zip((3, 4, 5), location_totals):
+            harvest = month_totals * 0.3 * harvest_share
+            bs.resources = np.clip(bs.resources + (harvest - consumption), 0.0, 1.0)
+            self._end_season_month(month, bs)
+
+    def _run_summer_season(self, bs: BandArrays) -> np.ndarray:
+        """
+        Summer aggregation (months 6-8) for all bands in one pass.
 
-            band.fitness_history.append(fitness)
+        Each month, as in _run_summer_aggregation, the site is reset, every
+        band re-decides, aggregators travel, attend, harvest at the site,
+        invest and try to acquire exotics, and independents forage at home.
+        The decision probabilities and the months' site and home values
+        are computed once for the season.
+
+        Args:
+            bs: Band arrays (modified in place)
+
+        Returns:
+            (3, n_bands) mask of aggregating (and so attending) bands per
+            month
+        """
+        site = self.aggregation_site
+        costs = self.params.costs
+        n = bs.n_bands
+
+        productivity = self.environment.get_season_productivities((6, 7, 8))
+        site_totals = self.site_access[80.0].totals(productivity)[:, 0]
+        location_totals = self.band_access[50.0].totals(productivity)
+
+        # The site is reset before expected_n is read, so it is the same
+        # every month
+        site.reset_annual_state()
+        expected_n = max(5, site.n_attending)
+        fitness_diff = (
+            W_aggregator(self.effective_sigma, site.ecotone_advantage,
+                         expected_n, self.params) -
+            W_independent(self.effective_sigma, self.params)
+        )
+
+        # Memory effect; recent and long-term fitness do not change during
+        # the summer, only which strategy was used last
+        recent_fitness = bs.fitness_recent.mean(axis=1)
+
+        decide_u, invest_u, acquire_u = self.rng.random((3, 3, n))
+        aggregating = np.zeros((3, n), dtype=bool)
+        acquisition_cost = 0.1
+
+        for k, month in enumerate((6, 7, 8)):
+            if k > 0:
+                site.reset_annual_state()
+
+            diff = fitness_diff + memory_adjustment_array(
+                bs.n_fitness, recent_fitness, bs.fitness_sum, bs.attended
+            )
+            p_aggregate = aggregation_probability(diff)
+            agg = decide_u[k] < p_aggregate
+            aggregating[k] = agg
+            bs.is_aggregator = agg
+            bs.attended = agg
+
+            # Travel and attendance
+            bs.resources[agg] -= np.minimum(self.travel_costs[agg],
+                                            bs.resources[agg] * 0.3)
+            site.add_attending_bands(bs.band_id[agg], bs.size[agg],
+                                     bs.exotic_goods[agg])
+            bs.resources[agg] += site_totals[k] * 0.2
+
+            # Monument investment
+            investing = agg & (bs.resources > 0.3)
+            investment = np.where(
+                investing,
+                bs.size * costs.C_signal * bs.resources *
+                (0.8 + 0.4 * invest_u[k]),
+                0.0
+            )
+            bs.monument_contributions += investment
+            bs.prestige += investment * 0.1
+
+            # Exotic acquisition
+            p_acquire = 0.3 * (1 + bs.prestige / (1 + bs.prestige))
+            acquired = (agg & (bs.resources >= acquisition_cost + 0.2) &
+                        (acquire_u[k] < p_acquire))
+            bs.exotic_goods += acquired
+            bs.resources -= acquisition_cost * acquired
+            bs.prestige += 0.15 * acquired
+
+            # Independents forage at home
+            ind = ~agg
+            bs.resources[ind] = np.minimum(
+                1.0, bs.resources[ind] + location_totals[k, ind] * 0.25
+            )
+
+            self._form_obligations()
+            site.record_construction(float(investment.sum()))
+            self._end_season_month(month, bs)
+
+        return aggregating
+
+    def _run_fall_season(self, bs: BandArrays) -> None:
+        """
+        Fall dispersal (months 9-11) for all bands in one pass.
+
+        Same updates as three calls of _run_fall_dispersal.
+
+        Args:
+            bs: Band arrays (modified in place)
+        """
+        productivity = self.environment.get_season_productivities((9, 10, 11))
+        access = self.band_access[60.0]
+        zone_values = access.zone_values(productivity)
+        location_totals = zone_values.sum(axis=-1) + access.diversity_bonus
+        mast_bonus = zone_values[..., ZONE_INDEX[ResourceZone.MAST]] * 0.5
+
+        consumption = bs.size * 0.012
+        for k, month in enumerate((9, 10, 11)):
+            harvest = location_totals[k] * 0.2 + mast_bonus[k]
+            bs.resources = np.clip(bs.resources + (harvest - consumption), 0.0, 1.0)
+            self._end_season_month(month, bs)
+
+    def _run_winter_season(self, bs: BandArrays) -> np.ndarray:
+        """
+        Winter mortality and reproduction (months 12, 1, 2) in one pass.
 
-            # Shortfall mortality
+        Realized fitness depends only on last summer's attendance, so it is
+        computed once; obligation calls, shortfall mortality, births,
+        deaths and size limits are applied each month as in
+        _run_winter_mortality.
+
+        Args:
+            bs: Band arrays (modified in place)
+
+        Returns:
+            Realized fitness of each band (recorded once per month by the
+            write-back in _run_season_kernel)
+        """
+        site = self.aggregation_site
+        pop = self.params.population
+        vulnerability = self.params.vulnerability
+
+        fitness = np.where(
+            bs.attended,
+            W_aggregator(self.effective_sigma, site.ecotone_advantage,
+                         site.n_attending, self.params),
+            W_independent(self.effective_sigma, self.params)
+        )
+        mortality_rate = np.where(bs.is_aggregator, vulnerability.alpha_agg,
+                                  vulnerability.beta_ind) * self.effective_sigma
+
+        for month in (12, 1, 2):
             if self.in_shortfall:
-                if band.strategy == Strategy.AGGREGATOR:
-                    vulnerability = self.params.vulnerability.alpha_agg
-                    # Aggregators can call obligations
-                    if band.obligations:
-                        partner_id = self.rng.choice(list(band.obligations.keys()))
-                        help_received = band.call_obligation(partner_id, need=0.15)
-                        band.resources += help_received
-                else:
-                    vulnerability = self.params.vulnerability.beta_ind
-
-                band.suffer_shortfall(
-                    vulnerability,
-                    self.effective_sigma,
-                    self.rng
+                callers, help_received = self._draw_obligation_help(
+                    bs.is_aggregator, need=0.15
                 )
+                bs.resources[callers] += help_received
+
+            if self.in_shortfall:
+                bs.size = apply_shortfall_mortality(bs.size, mortality_rate, self.rng)
 
-            # Reproduction
-            band.reproduce(
-                fitness=fitness,
-                birth_rate=self.params.population.birth_rate,
-                death_rate=self.params.population.death_rate,
+            bs.size = apply_reproduction(
+                bs.size, fitness, bs.resources,
+                birth_rate=pop.birth_rate, death_rate=pop.death_rate,
+                min_size=pop.min_band_size, max_size=pop.max_band_size,
                 rng=self.rng
             )
+            self._end_season_month(month, bs)
+
+        return fitness
+
+    def _end_season_month(self, month: int, bs: BandArrays) -> None:
+        """Record a month of the seasonal kernel in monthly trace mode."""
+        if self.params.monthly_trace:
+            self.month = month
+            self.environment.month = month
+            self._record_month(bs)
+
+    def _run_season_kernel(self) -> None:
+        """
+        Run spring through winter with the seasonal kernel.
 
-            # Band size constraints
-            if band.size < self.params.population.min_band_size:
-                band.size = self.params.population.min_band_size
-            elif band.size > self.params.population.max_band_size:
-                band.size = self.params.population.max_band_size
+        Band state is packed into arrays once, the four seasons are run on
+        the arrays, and the result (including each month's strategy,
+        attendance and fitness records) is written back to the Band agents.
+        """
+        bs = BandArrays.from_bands(self.bands)
+
+        self._run_spring_season(bs)
+        aggregating = self._run_summer_season(bs)
+        self._run_fall_season(bs)
+        fitness = self._run_winter_season(bs)
+
+        self.month = 2
+        self.environment.month = 2
+
+        for i, band in enumerate(self.bands):
+            band.size = int(bs.size[i])
+            band.resources = float(bs.resources[i])
+            band.prestige = float(bs.prestige[i])
+            band.monument_contributions = float(bs.monument_contributions[i])
+            band.exotic_goods = int(bs.exotic_goods[i])
+            band.strategy = (Strategy.AGGREGATOR if bs.is_aggregator[i]
+                             else Strategy.INDEPENDENT)
+            for attended in aggregating[:, i].tolist():
+                band.record_strategy(Strategy.AGGREGATOR if attended
+                                     else Strategy.INDEPENDENT)
+                band.record_aggregation(attended)
+            for _ in range(3):
+                band.record_fitness(float(fitness[i]))
+
+        self.counters = PopulationCounters(bs.size, bs.is_aggregator,
+                                           bs.exotic_goods, fitness)
+
+    def _run_monthly_cycle(self) -> None:
+        """Run spring through winter one month at a time (reference kernel)."""
+        seasons = [
+            ([3, 4, 5], self._run_spring_dispersal),      # Spring: Dispersal
+            ([6, 7, 8], self._run_summer_aggregation),    # Summer: Aggregation
+            ([9, 10, 11], self._run_fall_dispersal),      # Fall: Dispersal
+            ([12, 1, 2], self._run_winter_mortality),     # Winter: Mortality/reproduction
+        ]
+
+        for months, run_month in seasons:
+            for month in months:
+                self.month = month
+                self.environment.month = month
+                run_month()
+                if self.params.monthly_trace:
+                    self._record_month()
+
+    def _record_month(self, bs: Optional[BandArrays] = None) -> None:
+        """
+        Record a MonthlyState for the current month (monthly trace mode).
+
+        Only the field groups being recorded are computed: zone
+        productivity, one pass over band sizes, resources and strategies,
+        and the site counters.
+
+        Args:
+            bs: Band arrays of the seasonal kernel (None reads the Band agents)
+        """
+        fields = self._monthly_fields
+        values = {'year': self.year, 'month': self.month}
+
+        if fields & _MONTHLY_PRODUCTIVITY_FIELDS:
+            zone_prod = self.environment.get_zone_productivities()
+            values.update({f'productivity_{zone.value}': float(zone_prod[z])
+                           for z, zone in enumerate(ZONES)})
+
+        if fields & _MONTHLY_BAND_FIELDS:
+            if bs is None:
+                n = len(self.bands)
+                resources = np.fromiter((b.resources for b in self.bands), float, n)
+                sizes = np.fromiter((b.size for b in self.bands), np.int64, n)
+                is_aggregator = np.fromiter(
+                    (b.strategy == Strategy.AGGREGATOR for b in self.bands), bool, n
+                )
+            else:
+                resources, sizes, is_aggregator = bs.resources, bs.size, bs.is_aggregator
+            values.update(
+                mean_resources=float(resources.mean()) if len(resources) > 0 else 0.0,
+                total_population=int(sizes.sum()),
+                n_aggregators=int(is_aggregator.sum())
+            )
+
+        values.update(aggregation_size=self.aggregation_site.n_attending,
+                      monument_level=self.aggregation_site.monument_level)
+        self.results.monthly_states.record(**values)
+
+    def _record_state(self) -> None:
+        """Record the current annual state in results.yearly_states."""
+        counters = self.counters
+        if self.params.check_counters:
+            counters.check(self.bands)
 
-    def _record_state(self, annual: bool = False) -> IntegratedState:
-        """Record current simulation state."""
         # Count strategies
-        n_agg = sum(1 for b in self.bands if b.strategy == Strategy.AGGREGATOR)
-        n_ind = len(self.bands) - n_agg
-        n_total = len(self.bands)
+        n_total = counters.n_bands
+        n_agg = counters.n_aggregators
+        n_ind = counters.n_independents
 
         dominance = (n_agg - n_ind) / n_total if n_total > 0 else 0.0
 
         # Productivity by zone
-        prod_by_zone = {}
-        for zone in ResourceZone:
-            prod_by_zone[zone.value] = self.environment.get_zone_productivity(zone)
-
-        # Fitness by strategy
-        agg_fitness = [b.fitness_history[-1] for b in self.bands
-                       if b.strategy == Strategy.AGGREGATOR and b.fitness_history]
-        ind_fitness = [b.fitness_history[-1] for b in self.bands
-                       if b.strategy == Strategy.INDEPENDENT and b.fitness_history]
+        zone_prod = self.environment.get_zone_productivities()
+        prod_by_zone = {zone.value: float(zone_prod[z]) for z, zone in enumerate(ZONES)}
 
         # Ecotone value
-        site_value = self.environment.get_location_value(
-            self.aggregation_site.location,
-            access_radius=50.0
-        )
+        site_total = self.site_access[50.0].totals(
+            self.environment.get_patch_productivities()
+        )[0]
 
-        state = IntegratedState(
+        self.results.yearly_states.record(
             year=self.year,
             month=self.month,
-            total_population=sum(b.size for b in self.bands),
-            n_bands=len(self.bands),
-            mean_band_size=np.mean([b.size for b in self.bands]),
+            total_population=counters.total_population,
+            n_bands=n_total,
+            mean_band_size=counters.mean_band_size,
             n_aggregators=n_agg,
             n_independents=n_ind,
             strategy_dominance=dominance,
@@ -555,24 +1015,17 @@ class IntegratedSimulation:
                 if len(self.aggregation_site.monument_history) > 1
                 else self.aggregation_site.monument_level
             ),
-            total_exotics=sum(b.exotic_goods for b in self.bands),
+            total_exotics=counters.total_exotics,
             mean_productivity=np.mean(list(prod_by_zone.values())),
             productivity_by_zone=prod_by_zone,
             effective_sigma=self.effective_sigma,
-            ecotone_value=site_value['total'],
+            ecotone_value=float(site_total),
             in_shortfall=self.in_shortfall,
             shortfall_severity=self.shortfall_severity,
-            mean_fitness_aggregators=np.mean(agg_fitness) if agg_fitness else 0.0,
-            mean_fitness_independents=np.mean(ind_fitness) if ind_fitness else 0.0
+            mean_fitness_aggregators=counters.mean_fitness(Strategy.AGGREGATOR),
+            mean_fitness_independents=counters.mean_fitness(Strategy.INDEPENDENT)
         )
 
-        if annual:
-            self.results.yearly_states.append(state)
-        else:
-            self.results.monthly_states.append(state)
-
-        return state
-
     def step_year(self) -> IntegratedState:
         """Execute one full year of simulation."""
         # Advance environment to new year
@@ -585,35 +1038,16 @@ class IntegratedSimulation:
         self.effective_sigma = self._calculate_effective_sigma()
 
         # Run seasonal cycle
-        # Spring (months 3-5): Dispersal
-        for month in [3, 4, 5]:
-            self.month = month
-            self.environment.month = month
-            self._run_spring_dispersal()
-
-        # Summer (months 6-8): Aggregation
-        for month in [6, 7, 8]:
-            self.month = month
-            self.environment.month = month
-            self._run_summer_aggregation()
-
-        # Fall (months 9-11): Dispersal
-        for month in [9, 10, 11]:
-            self.month = month
-            self.environment.month = month
-            self._run_fall_dispersal()
-
-        # Winter (months 12, 1, 2): Mortality/reproduction
-        for month in [12, 1, 2]:
-            self.month = month
-            self.environment.month = month
-            self._run_winter_mortality()
+        if self.step_kernel == "seasonal":
+            self._run_season_kernel()
+        else:
+            self._run_monthly_cycle()
 
         # Record annual state
-        state = self._record_state(annual=True)
+        self._record_state()
 
         self.year += 1
-        return state
+        return self.results.yearly_states[-1]
 
     def run(self, verbose: bool = False) -> IntegratedResults:
         """
@@ -637,10 +1071,12 @@ class IntegratedSimulation:
 
             if verbose and self.year % 100 == 0:
                 state = self.results.yearly_states[-1]
-                print(f"  Year {self.year}: Pop={state.total_population}, "
-                      f"Dom={state.strategy_dominance:.2f}, "
-                      f"σ_eff={state.effective_sigma:.3f}, "
-                      f"Monument={state.monument_level:.0f}")
+                print(f"  Year {self.year}: " + format_progress(state, (
+                    ('Pop', 'total_population', 'd'),
+                    ('Dom', 'strategy_dominance', '.2f'),
+                    ('σ_eff', 'effective_sigma', '.3f'),
+                    ('Monument', 'monument_level', '.0f'),
+                )))
 
         # Compute summary
         self.results.compute_summary(burn_in=self.params.burn_in)
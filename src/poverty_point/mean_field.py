@@ -0,0 +1,464 @@
+"""
+Mean-field approximation of the core simulation.
+
+MeanFieldModel replaces the 50 bands of PovertyPointSimulation with the
+expected values of a few population-level quantities and iterates them as
+yearly difference equations from the same SimulationParameters:
+
+- aggregator fraction x (the sigmoid choice on W_agg - W_ind, with
+  expected n from last year and a closure for the memory adjustment)
+- aggregation size n = n_bands * x
+- mean band size and resources, and the monument they build
+
+σ and ε may be arrays; every quantity broadcasts over them, so a whole
+dominance(σ, ε) map is one run of a few hundred array steps.
+
+The band memory effect is closed with the running mean and variance of
+realized aggregator fitness: a band's last five years beat its long-term
+mean with a probability computed from how many of those years it
+aggregated (binomial in the long-run aggregator fraction).
+
+With noise_correction, expectations over n are taken over the binomial
+spread of attendance (Gauss-Hermite quadrature) instead of at its mean,
+the shortfall magnitude noise is integrated out, and band size carries a
+variance so the min/max size clamp acts on a distribution rather than on
+the mean. This follows the ABM more closely where W_agg(n) is strongly
+curved (crowding above n_optimal).
+
+Not modelled: exotic acquisition, obligation help during shortfalls and
+the spread of travel costs (the mean distance to the site is used).
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+from .agents import MEMORY_ADJUSTMENT, MEMORY_WINDOW, aggregation_probability
+from .parameters import (
+    SimulationParameters, default_parameters, cooperation_benefit_array,
+    W_aggregator_array, W_independent_array
+)
+
+
+ArrayLike = Union[float, np.ndarray]
+
+# Resource cost per km of Band.calculate_travel_cost
+TRAVEL_COST_PER_KM = 0.0005
+
+# Binomial coefficients for the four memory-window years before the last
+_WINDOW_BINOMIAL = np.array([1.0, 4.0, 6.0, 4.0, 1.0])
+
+
+def _quadrature(n_nodes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Standard-normal Gauss-Hermite nodes and weights (weights sum to 1)."""
+    nodes, weights = np.polynomial.hermite_e.hermegauss(n_nodes)
+    return nodes, weights / weights.sum()
+
+
+def _normal_cdf(z: np.ndarray) -> np.ndarray:
+    """Logistic approximation of the standard normal CDF (error < 0.01)."""
+    return 1.0 / (1.0 + np.exp(-1.702 * np.clip(z, -30.0, 30.0)))
+
+
+def shortfall_regime(sigma: ArrayLike,
+                     noise_correction: bool = False,
+                     n_nodes: int = 9) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Long-run shortfall exposure of PovertyPointSimulation._generate_shortfall.
+
+    A shortfall starts with probability 1 / (20(1 - σ) + 5) per calm year,
+    lasts D = max(1, int(1 + 2.5 m)) years at magnitude m, and is
+    followed by one calm year, so a cycle is mean_interval + D years.
+
+    Args:
+        sigma: Environmental uncertainty
+        noise_correction: Integrate over the N(0, 0.1) magnitude noise
+            instead of using the mean magnitude
+        n_nodes: Quadrature nodes for the magnitude noise
+
+    Returns:
+        (fraction of years in shortfall, expected shortfall magnitude per
+        year, i.e. fraction × magnitude while in shortfall)
+    """
+    sigma = np.asarray(sigma, dtype=float)
+    mean_interval = 20 * (1 - sigma) + 5
+
+    if noise_correction:
+        nodes, weights = _quadrature(n_nodes)
+        noise = (0.1 * nodes).reshape((-1,) + (1,) * sigma.ndim)
+        weights = weights.reshape(noise.shape)
+    else:
+        noise = np.zeros((1,) + (1,) * sigma.ndim)
+        weights = np.ones_like(noise)
+
+    magnitude = np.clip(0.3 + 0.5 * sigma + noise, 0.2, 0.9)
+    duration = np.maximum(1, np.floor(1 + magnitude * 2.5))
+    mean_duration = (weights * duration).sum(axis=0)
+    mean_exposure = (weights * duration * magnitude).sum(axis=0)
+
+    cycle = mean_interval + mean_duration
+    return mean_duration / cycle, mean_exposure / cycle
+
+
+@dataclass
+class MeanFieldResults:
+    """
+    Trajectories of a mean-field run.
+
+    Each trajectory has shape (duration,) + the broadcast shape of σ and ε.
+    Summary properties follow SimulationResults (post-burn-in means).
+    """
+    sigma: np.ndarray
+    epsilon: np.ndarray
+    burn_in: int
+
+    aggregator_fraction: np.ndarray
+    aggregation_size: np.ndarray
+    monument_level: np.ndarray
+    mean_band_size: np.ndarray
+    mean_resources: np.ndarray
+    total_population: np.ndarray
+
+    @property
+    def strategy_dominance(self) -> np.ndarray:
+        """(n_agg - n_ind) / n_bands per year."""
+        return 2 * self.aggregator_fraction - 1
+
+    @property
+    def final_strategy_dominance(self) -> np.ndarray:
+        """Mean dominance after burn-in."""
+        return self.strategy_dominance[self.burn_in:].mean(axis=0)
+
+    @property
+    def mean_aggregation_size(self) -> np.ndarray:
+        """Mean number of bands at aggregation after burn-in."""
+        return self.aggregation_size[self.burn_in:].mean(axis=0)
+
+    @property
+    def final_monument_level(self) -> np.ndarray:
+        """Monument level at the end of the run."""
+        return self.monument_level[-1]
+
+    @property
+    def mean_population(self) -> np.ndarray:
+        """Mean total population after burn-in."""
+        return self.total_population[self.burn_in:].mean(axis=0)
+
+
+class MeanFieldModel:
+    """
+    Deterministic population-level counterpart of PovertyPointSimulation.
+
+    One step follows the ABM's annual cycle: dispersal foraging (by last
+    year's strategy), strategy decisions, the aggregation season
+    (travel, monument investment, independent foraging), shortfall
+    mortality and reproduction. The number of bands is fixed, as in the
+    ABM, where bands never dissolve.
+    """
+
+    def __init__(self,
+                 params: Optional[SimulationParameters] = None,
+                 sigma: Optional[ArrayLike] = None,
+                 epsilon: Optional[ArrayLike] = None,
+                 noise_correction: bool = False,
+                 n_nodes: int = 9):
+        """
+        Initialize the model at the ABM's starting state.
+
+        Args:
+            params: Simulation parameters (uses defaults if None)
+            sigma: Environmental uncertainty, scalar or array (default
+                params.sigma)
+            epsilon: Ecotone advantage, scalar or array broadcastable
+                against sigma (default params.epsilon)
+            noise_correction: Take expectations over finite-population
+                noise (see module docstring)
+            n_nodes: Gauss-Hermite nodes for the noise expectations
+        """
+        self.params = params or default_parameters()
+        sigma = self.params.sigma if sigma is None else sigma
+        epsilon = self.params.epsilon if epsilon is None else epsilon
+        self.sigma, self.epsilon = np.broadcast_arrays(
+            np.asarray(sigma, dtype=float), np.asarray(epsilon, dtype=float)
+        )
+        self.noise_correction = noise_correction
+        self.nodes, self.weights = _quadrature(n_nodes)
+        shape = self.sigma.shape
+
+        pop = self.params.population
+        self.n_bands = pop.n_bands
+        region = self.params.environment.region_size
+        # Mean distance from a uniform point in the region to its centre
+        mean_distance = region * (np.sqrt(2) + np.log(1 + np.sqrt(2))) / 6
+        self.travel_cost = mean_distance * TRAVEL_COST_PER_KM
+
+        self.shortfall_fraction, self.shortfall_exposure = shortfall_regime(
+            self.sigma, noise_correction, n_nodes
+        )
+        self.W_ind = W_independent_array(self.sigma, self.params)
+        # W_agg(n) = W_agg at f(n) = 1, times f(n) (f >= 1, so the clamp
+        # at zero commutes); only f(n) is evaluated per step
+        self.fitness_scale = W_aggregator_array(self.sigma, self.epsilon, 1.0, self.params)
+
+        # State at the start of year 0 (create_bands / create_aggregation_site)
+        self.year = 0
+        self.aggregator_fraction = np.full(shape, 0.4)
+        self.band_size = np.full(shape, float(pop.initial_band_size))
+        self.band_size_var = np.full(shape, 10.0 if noise_correction else 0.0)
+        self.resources = np.full(shape, 0.5)
+        self.monument_level = np.zeros(shape)
+
+        # Running sums of realized aggregator fitness and attendance for
+        # the memory closure
+        self._fitness_sum = np.zeros(shape)
+        self._fitness_sq_sum = np.zeros(shape)
+        self._fraction_sum = np.zeros(shape)
+
+    def _attendance(self, fraction: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Attendance values and weights for expectations over n.
+
+        Returns:
+            (n, weights) with a leading quadrature axis (length 1 without
+            noise correction)
+        """
+        mean = self.n_bands * fraction
+        if not self.noise_correction:
+            return mean[None], np.ones((1,) + mean.shape)
+        sd = np.sqrt(self.n_bands * fraction * (1 - fraction))
+        expand = (-1,) + (1,) * mean.ndim
+        n = np.clip(mean + sd * self.nodes.reshape(expand), 0, self.n_bands)
+        return n, np.broadcast_to(self.weights.reshape(expand), n.shape)
+
+    def _W_aggregator(self, n: np.ndarray) -> np.ndarray:
+        """W_aggregator at aggregation sizes n (leading axes broadcast)."""
+        return self.fitness_scale * cooperation_benefit_array(n, self.params.cooperation)
+
+    def _window_beats_long_term(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Probability that a band's recent fitness beats its long-term mean.
+
+        Recent fitness is higher when the band aggregated more (less)
+        often than average over the memory window while W_agg is above
+        (below) W_ind, smoothed by the fluctuation of realized W_agg.
+
+        Returns:
+            (probability given it aggregated last year, probability given
+            it stayed independent)
+        """
+        mean_fitness = self._fitness_sum / self.year
+        fitness_var = np.maximum(self._fitness_sq_sum / self.year - mean_fitness ** 2, 1e-12)
+        long_fraction = self._fraction_sum / self.year
+        advantage = mean_fitness - self.W_ind
+
+        # Aggregation years among the four window years before the last
+        expand = (-1,) + (1,) * long_fraction.ndim
+        k = np.arange(5).reshape(expand)
+        p_k = (_WINDOW_BINOMIAL.reshape(expand) *
+               long_fraction ** k * (1 - long_fraction) ** (4 - k))
+
+        # Recent-minus-long-term fitness for 0..5 aggregation years in the window
+        years = np.arange(MEMORY_WINDOW + 1).reshape(expand)
+        gap = (years / MEMORY_WINDOW - long_fraction) * advantage
+        spread = np.sqrt(fitness_var * years) / MEMORY_WINDOW
+        z = np.where(years > 0, gap / np.maximum(spread, 1e-12), np.sign(gap) * 30.0)
+        beats = _normal_cdf(z)
+
+        return (p_k * beats[1:]).sum(axis=0), (p_k * beats[:-1]).sum(axis=0)
+
+    def _expected_choice(self, fitness_diff: np.ndarray,
+                         weights: np.ndarray) -> np.ndarray:
+        """
+        Expected aggregator fraction including the memory adjustment.
+
+        A band that aggregated last year (probability x) gets
+        +MEMORY_ADJUSTMENT if its recent fitness beats its long-term mean,
+        else -MEMORY_ADJUSTMENT; for a band that stayed independent the
+        signs are reversed.
+
+        Args:
+            fitness_diff: E[W_agg] - E[W_ind] per quadrature node
+            weights: Quadrature weights matching fitness_diff
+        """
+        if self.year < MEMORY_WINDOW:
+            return (weights * aggregation_probability(fitness_diff)).sum(axis=0)
+
+        up = (weights * aggregation_probability(fitness_diff + MEMORY_ADJUSTMENT)).sum(axis=0)
+        down = (weights * aggregation_probability(fitness_diff - MEMORY_ADJUSTMENT)).sum(axis=0)
+        better_agg, better_ind = self._window_beats_long_term()
+        x = self.aggregator_fraction
+        return (x * (better_agg * up + (1 - better_agg) * down) +
+                (1 - x) * (better_ind * down + (1 - better_ind) * up))
+
+    def _clamp_size(self, mean: np.ndarray, var: np.ndarray
+                    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Mean and variance of band size after the min/max size clamp."""
+        pop = self.params.population
+        if not self.noise_correction:
+            return np.clip(mean, pop.min_band_size, pop.max_band_size), var
+        expand = (-1,) + (1,) * mean.ndim
+        sizes = np.clip(mean + np.sqrt(var) * self.nodes.reshape(expand),
+                        pop.min_band_size, pop.max_band_size)
+        weights = self.weights.reshape(expand)
+        clamped_mean = (weights * sizes).sum(axis=0)
+        return clamped_mean, (weights * (sizes - clamped_mean) ** 2).sum(axis=0)
+
+    def step(self) -> None:
+        """Advance one year."""
+        params = self.params
+        costs, pop = params.costs, params.population
+        sigma, epsilon = self.sigma, self.epsilon
+        harvest = 0.5 * (1 - self.shortfall_exposure)
+
+        # 1. Dispersal foraging by last year's strategy
+        last_fraction = self.aggregator_fraction
+        consumption = 0.02 * self.band_size
+        r_agg = np.clip(self.resources + harvest * (1 - costs.C_opportunity) - consumption, 0, 1)
+        r_ind = np.clip(self.resources + harvest - consumption, 0, 1)
+        resources = last_fraction * r_agg + (1 - last_fraction) * r_ind
+
+        # 2. Decisions on last year's attendance (at least 5 expected)
+        if self.year == 0:
+            # Nobody attended yet
+            expected_n, weights = np.full((1,) + sigma.shape, 5.0), np.ones((1,) + sigma.shape)
+        else:
+            expected_n, weights = self._attendance(last_fraction)
+            expected_n = np.maximum(5, expected_n)
+        fitness_diff = self._W_aggregator(expected_n) - self.W_ind
+        fraction = self._expected_choice(fitness_diff, weights)
+
+        # 3. Aggregation season
+        r_agg = resources - np.minimum(self.travel_cost, 0.5 * resources)
+        r_ind = np.minimum(1.0, resources + 0.1 * (1 - self.shortfall_exposure))
+        investment = np.where(r_agg >= 0.3, self.band_size * costs.C_signal * r_agg, 0.0)
+        self.monument_level = self.monument_level + self.n_bands * fraction * investment
+
+        # 4. Shortfall mortality. Shortfalls hit every band in the same
+        # years, so long-run size follows the geometric mean of survival
+        # over shortfall and normal years, (1 - rate) ** shortfall_fraction
+        vulnerability = params.vulnerability
+        f = self.shortfall_fraction
+        survival = (fraction * (1 - vulnerability.alpha_agg * sigma * (1 - epsilon)) ** f +
+                    (1 - fraction) * (1 - vulnerability.beta_ind * sigma) ** f)
+        mortality = 1 - survival
+
+        # 5. Reproduction at the realized aggregation size
+        n, weights = self._attendance(fraction)
+        W_agg_n = self._W_aggregator(n)
+        W_agg = (weights * W_agg_n).sum(axis=0)
+        births = pop.birth_rate * (fraction * W_agg * (0.5 + r_agg) +
+                                   (1 - fraction) * self.W_ind * (0.5 + r_ind))
+        growth = survival * (1 + births - pop.death_rate)
+
+        size = self.band_size * growth
+        size_var = self.band_size_var * growth ** 2
+        if self.noise_correction:
+            # Binomial variance of one year's births and deaths
+            size_var = size_var + self.band_size * (births + pop.death_rate + mortality)
+        self.band_size, self.band_size_var = self._clamp_size(size, size_var)
+        self.resources = fraction * r_agg + (1 - fraction) * r_ind
+
+        # Memory statistics of realized fitness
+        self._fitness_sum += W_agg
+        self._fitness_sq_sum += (weights * W_agg_n ** 2).sum(axis=0)
+        self._fraction_sum += fraction
+
+        self.aggregator_fraction = fraction
+        self.year += 1
+
+    def run(self, duration: Optional[int] = None) -> MeanFieldResults:
+        """
+        Iterate the model.
+
+        Args:
+            duration: Years to run (default params.duration)
+
+        Returns:
+            MeanFieldResults with one row per year
+        """
+        duration = self.params.duration if duration is None else duration
+        shape = (duration,) + self.sigma.shape
+        fraction, monument = np.empty(shape), np.empty(shape)
+        size, resources = np.empty(shape), np.empty(shape)
+
+        for t in range(duration):
+            self.step()
+            fraction[t] = self.aggregator_fraction
+            monument[t] = self.monument_level
+            size[t] = self.band_size
+            resources[t] = self.resources
+
+        return MeanFieldResults(
+            sigma=self.sigma, epsilon=self.epsilon,
+            burn_in=min(self.params.burn_in, duration - 1),
+            aggregator_fraction=fraction,
+            aggregation_size=self.n_bands * fraction,
+            monument_level=monument,
+            mean_band_size=size,
+            mean_resources=resources,
+            total_population=self.n_bands * size,
+        )
+
+
+def dominance_map(sigma_values: np.ndarray,
+                  epsilon_values: np.ndarray,
+                  params: Optional[SimulationParameters] = None,
+                  noise_correction: bool = False,
+                  duration: Optional[int] = None) -> np.ndarray:
+    """
+    Post-burn-in strategy dominance over a (ε, σ) grid.
+
+    Args:
+        sigma_values: σ grid (1-D)
+        epsilon_values: ε grid (1-D)
+        params: Simulation parameters (uses defaults if None)
+        noise_correction: Use the noise-corrected model
+        duration: Years to run (default params.duration)
+
+    Returns:
+        Array of shape (len(epsilon_values), len(sigma_values))
+    """
+    sigma_values = np.asarray(sigma_values, dtype=float)
+    epsilon_values = np.asarray(epsilon_values, dtype=float)
+    model = MeanFieldModel(params, sigma=sigma_values[None, :],
+                           epsilon=epsilon_values[:, None],
+                           noise_correction=noise_correction)
+    return model.run(duration).final_strategy_dominance
+
+
+def dominance_threshold(epsilon_values: np.ndarray,
+                        params: Optional[SimulationParameters] = None,
+                        sigma_values: Optional[np.ndarray] = None,
+                        noise_correction: bool = False,
+                        duration: Optional[int] = None) -> np.ndarray:
+    """
+    Mean-field σ* per ε: where post-burn-in dominance first crosses zero.
+
+    Uses the same rule as the empirical thresholds of the phase-space
+    analysis (first σ step with d1 < 0 <= d2, linearly interpolated), so
+    it can be compared directly with ABM thresholds and with
+    critical_threshold at n = n_optimal.
+
+    Args:
+        epsilon_values: ε values
+        params: Simulation parameters (uses defaults if None)
+        sigma_values: σ grid searched (default 0.1 to 0.95 in steps of 0.005)
+        noise_correction: Use the noise-corrected model
+        duration: Years to run (default params.duration)
+
+    Returns:
+        σ* per ε (NaN where dominance never crosses zero)
+    """
+    if sigma_values is None:
+        sigma_values = np.linspace(0.1, 0.95, 171)
+    sigma_values = np.asarray(sigma_values, dtype=float)
+    dominance = dominance_map(sigma_values, epsilon_values, params,
+                              noise_correction, duration)
+
+    crosses = (dominance[:, :-1] < 0) & (dominance[:, 1:] >= 0)
+    first = np.argmax(crosses, axis=1)
+    rows = np.arange(len(dominance))
+    d1, d2 = dominance[rows, first], dominance[rows, first + 1]
+    s1, s2 = sigma_values[first], sigma_values[first + 1]
+    sigma_star = s1 - d1 * (s2 - s1) / (d2 - d1)
+    return np.where(crosses.any(axis=1), sigma_star, np.nan)
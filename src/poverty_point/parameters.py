@@ -8,7 +8,7 @@ These values produce a critical threshold σ* ≈ 0.53 at ε=0.35, n=25.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Optional, Tuple
 import numpy as np
 
 
@@ -141,6 +141,28 @@ class SimulationParameters:
     burn_in: int = 100            # Years before recording
     seed: int = 42                # Random seed
 
+    # Per-band history kept: "none", "window" (last history_window
+    # years) or "full". Decisions only need the running memory state.
+    history_retention: str = "full"
+    history_window: int = 5
+
+    # State fields recorded each year (None records every field). The
+    # summary statistics need the fields they are computed from.
+    record_fields: Optional[Tuple[str, ...]] = None
+
+    # Keep only running post-burn-in statistics of the summary fields
+    # instead of per-year state (see timeseries.StreamingSummary)
+    summary_only: bool = False
+
+    # Integrated simulation only: record a light MonthlyState every month
+    # into preallocated columns (monthly_fields=None records every field)
+    monthly_trace: bool = False
+    monthly_fields: Optional[Tuple[str, ...]] = None
+
+    # Cross-check the incremental population counters against a full scan
+    # of the bands every year (debugging aid, O(bands) per year)
+    check_counters: bool = False
+
     # Phase space parameters (set per run)
     sigma: float = 0.5            # Environmental uncertainty
     epsilon: float = 0.35         # Ecotone advantage at aggregation site
@@ -276,6 +298,99 @@ def critical_threshold(epsilon: float, n: float,
     return max(0.0, min(1.0, sigma_star))
 
 
+# Array versions of the theory functions. Arguments broadcast against each
+# other (e.g. sigma[None, :], epsilon[:, None], n[:, None, None]) and the
+# results match the scalar functions elementwise, branches and clamps
+# included, so whole phase-space surfaces are one call.
+
+def cooperation_benefit_array(n: np.ndarray,
+                              params: CooperationParameters) -> np.ndarray:
+    """
+    Cooperation benefit multiplier for an array of aggregation sizes.
+
+    Args:
+        n: Number of bands aggregating (any shape)
+        params: Cooperation parameters
+
+    Returns:
+        Array of cooperation_benefit(n) values (>= 1.0)
+    """
+    n = np.asarray(n, dtype=float)
+    benefit = 1.0 + params.b_coop * np.log(np.where(n > 1, n, 1.0))
+    crowding = np.where(n > params.n_optimal,
+                        params.c_crowd * (n - params.n_optimal) ** 2, 0.0)
+    return np.where(n <= 1, 1.0, np.maximum(1.0, benefit - crowding))
+
+
+def W_aggregator_array(sigma: np.ndarray, epsilon: np.ndarray, n: np.ndarray,
+                       params: SimulationParameters) -> np.ndarray:
+    """
+    Aggregator fitness over broadcast arrays of σ, ε and n.
+
+    Args:
+        sigma: Environmental uncertainty
+        epsilon: Ecotone advantage
+        n: Number of bands aggregating
+        params: Full parameter set
+
+    Returns:
+        Array of W_aggregator values with the broadcast shape
+    """
+    sigma_eff = np.asarray(sigma, dtype=float) * (1.0 - np.asarray(epsilon, dtype=float))
+    survival = 1.0 - params.vulnerability.alpha_agg * sigma_eff
+    f_n = cooperation_benefit_array(n, params.cooperation)
+    recip = 1.0 + params.cooperation.B_recip
+
+    W = (1.0 - params.costs.C_total) * survival * f_n * recip
+    return np.maximum(0.0, W)
+
+
+def W_independent_array(sigma: np.ndarray,
+                        params: SimulationParameters) -> np.ndarray:
+    """
+    Independent fitness over an array of σ.
+
+    Args:
+        sigma: Environmental uncertainty
+        params: Full parameter set
+
+    Returns:
+        Array of W_independent values
+    """
+    survival = 1.0 - params.vulnerability.beta_ind * np.asarray(sigma, dtype=float)
+    return np.maximum(0.0, params.cooperation.R_ind * survival)
+
+
+def critical_threshold_array(epsilon: np.ndarray, n: np.ndarray,
+                             params: SimulationParameters) -> np.ndarray:
+    """
+    Critical σ* over broadcast arrays of ε and n.
+
+    Entries where the denominator or numerator is <= 0 are 0 (aggregation
+    always wins), as in critical_threshold.
+
+    Args:
+        epsilon: Ecotone advantage
+        n: Expected aggregation size
+        params: Full parameter set
+
+    Returns:
+        Array of σ* values in [0, 1]
+    """
+    f_n = cooperation_benefit_array(n, params.cooperation)
+    recip = 1.0 + params.cooperation.B_recip
+    R_ind = params.cooperation.R_ind
+
+    A = (1.0 - params.costs.C_total) * f_n * recip
+    alpha_eff = params.vulnerability.alpha_agg * (1.0 - np.asarray(epsilon, dtype=float))
+    denom = R_ind * params.vulnerability.beta_ind - A * alpha_eff
+    numerator = R_ind - A
+
+    valid = (denom > 0) & (numerator > 0)
+    sigma_star = np.where(valid, numerator / np.where(valid, denom, 1.0), 0.0)
+    return np.clip(sigma_star, 0.0, 1.0)
+
+
 # Convenience function to create default parameters
 def default_parameters(sigma: float = 0.5, epsilon: float = 0.35,
                        seed: int = 42) -> SimulationParameters:
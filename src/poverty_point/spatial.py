@@ -0,0 +1,121 @@
+"""
+Spatial index for radius queries over fixed point sets.
+
+GridIndex buckets points (e.g. resource patches) into a uniform grid of
+square cells once, so a radius query only looks at the cells within reach
+instead of every point. Queries are made for many locations at once
+(all band homes, all candidate sites) as one vectorized call.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+class GridIndex:
+    """
+    Uniform-grid (cell list) index over fixed 2-D points.
+
+    Points are sorted by cell, and each cell keeps the start of its slice
+    in that order. A query location gathers the slices of the cells
+    within the query radius and keeps the points inside it.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, cell_size: float):
+        """
+        Build the index.
+
+        Args:
+            x: Point x coordinates
+            y: Point y coordinates
+            cell_size: Cell edge length (same units as coordinates)
+        """
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.cell_size = float(cell_size)
+
+        n = len(self.x)
+        self.origin = (float(self.x.min()), float(self.y.min())) if n else (0.0, 0.0)
+
+        cx, cy = self._cells(self.x, self.y)
+        self.shape = (int(cx.max()) + 1, int(cy.max()) + 1) if n else (0, 0)
+        key = cx * self.shape[1] + cy
+
+        # Point ids grouped by cell, and where each cell's group starts
+        self.order = np.argsort(key, kind='stable')
+        counts = np.bincount(key, minlength=self.shape[0] * self.shape[1])
+        self.cell_start = np.concatenate([[0], np.cumsum(counts)])
+
+    @classmethod
+    def for_density(cls, x: np.ndarray, y: np.ndarray,
+                    region_size: float) -> "GridIndex":
+        """
+        Build an index with about one point per cell on average.
+
+        Args:
+            x: Point x coordinates
+            y: Point y coordinates
+            region_size: Extent of the region the points cover
+
+        Returns:
+            GridIndex with cell_size = region_size / ceil(sqrt(n_points))
+        """
+        cells_per_side = max(1, int(np.ceil(np.sqrt(len(x)))))
+        return cls(x, y, cell_size=region_size / cells_per_side)
+
+    def _cells(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Integer cell coordinates of locations."""
+        cx = np.floor((x - self.origin[0]) / self.cell_size).astype(np.int64)
+        cy = np.floor((y - self.origin[1]) / self.cell_size).astype(np.int64)
+        return cx, cy
+
+    def query_radius(self, locations: np.ndarray, radius: float
+                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find all points within a radius of each location.
+
+        Args:
+            locations: (m, 2) array of query (x, y) coordinates
+            radius: Query radius (inclusive)
+
+        Returns:
+            (location_idx, point_idx, distance) arrays, one entry per
+            (location, point) pair with distance <= radius, ordered by
+            location and then point id
+        """
+        locations = np.asarray(locations, dtype=float).reshape(-1, 2)
+        m = len(locations)
+        if m == 0 or len(self.x) == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty.copy(), np.zeros(0)
+
+        qx, qy = locations[:, 0], locations[:, 1]
+        reach = int(np.ceil(radius / self.cell_size))
+        offsets = np.arange(-reach, reach + 1)
+        nx, ny = self.shape
+
+        # Cells around each location, shape (m, cells per location)
+        lcx, lcy = self._cells(qx, qy)
+        cx = (lcx[:, None, None] + offsets[None, :, None]).repeat(len(offsets), axis=2)
+        cy = (lcy[:, None, None] + offsets[None, None, :]).repeat(len(offsets), axis=1)
+        cx, cy = cx.reshape(m, -1), cy.reshape(m, -1)
+        valid = (cx >= 0) & (cx < nx) & (cy >= 0) & (cy < ny)
+        key = np.where(valid, cx * ny + cy, 0)
+        start = np.where(valid, self.cell_start[key], 0).ravel()
+        count = np.where(valid, self.cell_start[key + 1] - self.cell_start[key], 0).ravel()
+
+        # Expand each cell's slice into candidate (location, point) pairs
+        total = int(count.sum())
+        slot_offset = np.repeat(np.cumsum(count) - count, count)
+        position = np.repeat(start, count) + np.arange(total) - slot_offset
+        location_idx = np.repeat(np.repeat(np.arange(m), key.shape[1]), count)
+        point_idx = self.order[position]
+
+        distance = np.hypot(self.x[point_idx] - qx[location_idx],
+                            self.y[point_idx] - qy[location_idx])
+        inside = distance <= radius
+        location_idx = location_idx[inside]
+        point_idx = point_idx[inside]
+        distance = distance[inside]
+
+        ordered = np.lexsort((point_idx, location_idx))
+        return location_idx[ordered], point_idx[ordered], distance[ordered]
@@ -0,0 +1,192 @@
+"""
+Disk cache for theory grids.
+
+The figure scripts evaluate the same σ*(ε, n) curves and W_agg / W_ind
+surfaces for a fixed parameter set every time they are regenerated.
+TheoryCache stores each grid as an .npz file named by a hash of the model
+parameters (costs, vulnerability, cooperation) and the grid coordinates,
+so a grid is computed once and any parameter change misses the cache
+automatically.
+
+Parameter fields may be arrays (e.g. C_signal = costs[:, None] for a cost
+sweep); they broadcast against the grid coordinates like any other
+argument of the array theory functions.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from .parameters import (
+    SimulationParameters, W_aggregator_array, W_independent_array,
+    critical_threshold_array
+)
+
+
+# Bump when the theory functions change, to invalidate existing files
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'poverty_point' / 'theory'
+
+
+def _jsonable(value: Any) -> Any:
+    """JSON form of array-valued parameter fields."""
+    if isinstance(value, (np.ndarray, np.generic)):
+        return np.asarray(value).tolist()
+    raise TypeError(f"Cannot hash parameter value of type {type(value).__name__}")
+
+
+def parameter_key(params: SimulationParameters) -> str:
+    """
+    Stable hash of the parameters the theory functions depend on.
+
+    Args:
+        params: Parameter set (only costs, vulnerability and cooperation
+            enter the key)
+
+    Returns:
+        Hex digest that changes whenever one of those fields changes
+    """
+    fields = {
+        'version': CACHE_VERSION,
+        'costs': dataclasses.asdict(params.costs),
+        'vulnerability': dataclasses.asdict(params.vulnerability),
+        'cooperation': dataclasses.asdict(params.cooperation),
+    }
+    text = json.dumps(fields, sort_keys=True, default=_jsonable)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _grid_key(kind: str, params: SimulationParameters, *coords: Any) -> str:
+    """Hash of a grid kind, its parameters and its coordinate arrays."""
+    digest = hashlib.sha256(f"{kind}:{parameter_key(params)}".encode())
+    for coord in coords:
+        coord = np.ascontiguousarray(coord, dtype=float)
+        digest.update(str(coord.shape).encode())
+        digest.update(coord.tobytes())
+    return f"{kind}-{digest.hexdigest()[:32]}"
+
+
+class TheoryCache:
+    """
+    σ* and fitness grids memoized in memory and on disk.
+
+    Arguments broadcast as in the array theory functions, so
+    critical_threshold(eps[:, None], n[None, :], params) returns a
+    (len(eps), len(n)) surface.
+
+    Returned arrays are shared with later lookups of the same grid and
+    are read-only; copy one before modifying it.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        """
+        Create a cache.
+
+        Args:
+            cache_dir: Directory for the .npz files (default
+                ~/.cache/poverty_point/theory); created on first write
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        self._memory: Dict[str, Dict[str, np.ndarray]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _load_or_compute(self, key: str, compute) -> Dict[str, np.ndarray]:
+        """Arrays stored under key, computing and saving them on a miss."""
+        if key in self._memory:
+            self.hits += 1
+            return self._memory[key]
+
+        path = self.cache_dir / f"{key}.npz"
+        if path.exists():
+            with np.load(path) as stored:
+                arrays = {name: stored[name] for name in stored.files}
+            self.hits += 1
+        else:
+            arrays = compute()
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so a concurrent reader never sees half a file
+            tmp = path.with_suffix(f".{os.getpid()}.tmp.npz")
+            np.savez(tmp, **arrays)
+            os.replace(tmp, path)
+            self.misses += 1
+
+        # Later lookups return these same arrays
+        for array in arrays.values():
+            array.flags.writeable = False
+        self._memory[key] = arrays
+        return arrays
+
+    def critical_threshold(self, epsilon: Any, n: Any,
+                           params: SimulationParameters) -> np.ndarray:
+        """
+        Cached critical_threshold_array(epsilon, n, params).
+
+        Args:
+            epsilon: Ecotone advantage values
+            n: Aggregation sizes
+            params: Full parameter set
+
+        Returns:
+            Array of σ* values with the broadcast shape
+        """
+        key = _grid_key('sigma_star', params, epsilon, n)
+        return self._load_or_compute(key, lambda: {
+            'sigma_star': critical_threshold_array(epsilon, n, params)
+        })['sigma_star']
+
+    def fitness_grids(self, sigma: Any, epsilon: Any, n: Any,
+                      params: SimulationParameters
+                      ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cached aggregator and independent fitness surfaces.
+
+        Args:
+            sigma: Environmental uncertainty values
+            epsilon: Ecotone advantage values
+            n: Aggregation sizes
+            params: Full parameter set
+
+        Returns:
+            (W_agg, W_ind), both with the broadcast shape of all arguments
+        """
+        def compute() -> Dict[str, np.ndarray]:
+            W_agg = W_aggregator_array(sigma, epsilon, n, params)
+            W_ind = W_independent_array(sigma, params)
+            shape = np.broadcast_shapes(W_agg.shape, W_ind.shape)
+            return {'W_agg': np.broadcast_to(W_agg, shape).copy(),
+                    'W_ind': np.broadcast_to(W_ind, shape).copy()}
+
+        arrays = self._load_or_compute(_grid_key('fitness', params, sigma, epsilon, n),
+                                       compute)
+        return arrays['W_agg'], arrays['W_ind']
+
+    def fitness_difference(self, sigma: Any, epsilon: Any, n: Any,
+                           params: SimulationParameters) -> np.ndarray:
+        """
+        Cached W_agg - W_ind surface.
+
+        Args:
+            sigma: Environmental uncertainty values
+            epsilon: Ecotone advantage values
+            n: Aggregation sizes
+            params: Full parameter set
+
+        Returns:
+            Fitness difference with the broadcast shape of all arguments
+        """
+        W_agg, W_ind = self.fitness_grids(sigma, epsilon, n, params)
+        return W_agg - W_ind
+
+    def clear(self) -> None:
+        """Drop the in-memory copies and delete the cached files."""
+        self._memory.clear()
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob('*.npz'):
+                path.unlink()
@@ -0,0 +1,438 @@
+"""
+Columnar time series for simulation state snapshots.
+
+A StateSeries stores one preallocated NumPy column per field of a state
+dataclass (YearlyState, IntegratedState). Recording a year writes one row
+in place, and post-processing works on whole columns. The series still
+behaves as a read-only sequence of state objects, so code such as
+results.yearly_states[-1].monument_level keeps working.
+
+StreamingSummary is the summary-only alternative for sweeps: it keeps
+online accumulators (mean, variance, min, max, last value) for a few
+fields from burn-in onward and never stores per-year state.
+
+RollingWindow keeps mean and standard deviation over the last few
+observations (e.g. the productivity history behind effective σ) in O(1)
+per update and fixed memory.
+"""
+
+import dataclasses
+from dataclasses import dataclass
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union, get_type_hints
+)
+
+import numpy as np
+
+
+# Column dtype per annotated field type; anything else is stored as object
+_COLUMN_DTYPES = {int: np.int64, float: np.float64, bool: np.bool_}
+
+# Fields the results summaries are computed from
+SUMMARY_FIELDS = ('strategy_dominance', 'aggregation_size', 'total_population',
+                  'monument_level', 'total_exotics', 'effective_sigma')
+
+
+@dataclass
+class RunningStats:
+    """Online mean/variance (Welford) with min, max and last value."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0                  # Sum of squared deviations
+    min: float = np.inf
+    max: float = -np.inf
+    last: float = np.nan
+
+    def update(self, value: float) -> None:
+        """Add one observation."""
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.last = value
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the observations."""
+        return self.m2 / self.count if self.count > 0 else 0.0
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the observations."""
+        return float(np.sqrt(self.variance))
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "RunningStats":
+        """
+        Statistics of a whole column at once.
+
+        Args:
+            values: Non-empty 1-D array
+
+        Returns:
+            RunningStats equal to updating with each value in turn
+        """
+        values = np.asarray(values, dtype=float)
+        mean = float(values.mean())
+        return cls(count=len(values), mean=mean,
+                   m2=float(((values - mean) ** 2).sum()),
+                   min=float(values.min()), max=float(values.max()),
+                   last=float(values[-1]))
+
+
+class RollingWindow:
+    """
+    Mean and standard deviation of the last `window` observations.
+
+    Observations go into a fixed-size ring, and running sums of values and
+    squares are updated as values enter and leave it, so each update and
+    query is O(1). An observation may be an array (e.g. one value per
+    replicate); statistics are then elementwise. The sums are recomputed
+    from the ring each time it wraps, so rounding error does not build up
+    over long runs.
+    """
+
+    def __init__(self, window: int, shape: Tuple[int, ...] = ()):
+        """
+        Create an empty window.
+
+        Args:
+            window: Number of most recent observations kept
+            shape: Shape of each observation (() for scalars)
+
+        Raises:
+            ValueError: If window < 1
+        """
+        if window < 1:
+            raise ValueError(f"Window length must be at least 1, got {window}")
+        self.window = window
+        self.count = 0                  # Observations pushed so far
+        self._ring = np.zeros((window,) + tuple(shape))
+        self._sum = np.zeros(shape)
+        self._sum_sq = np.zeros(shape)
+        self._next = 0
+
+    @property
+    def n(self) -> int:
+        """Number of observations currently in the window."""
+        return min(self.count, self.window)
+
+    def push(self, value: Union[float, np.ndarray]) -> None:
+        """
+        Add an observation, dropping the oldest once the window is full.
+
+        Args:
+            value: Scalar or array of the window's shape
+        """
+        value = np.asarray(value, dtype=float)
+        if self.count >= self.window:
+            oldest = self._ring[self._next]
+            self._sum -= oldest
+            self._sum_sq -= oldest * oldest
+
+        self._ring[self._next] = value
+        self._sum += value
+        self._sum_sq += value * value
+        self.count += 1
+        self._next = (self._next + 1) % self.window
+
+        if self._next == 0:
+            self._sum = self._ring.sum(axis=0)
+            self._sum_sq = (self._ring * self._ring).sum(axis=0)
+
+    def mean(self) -> Union[float, np.ndarray]:
+        """Mean of the observations in the window (0 if empty)."""
+        return self._sum / max(self.n, 1)
+
+    def std(self) -> Union[float, np.ndarray]:
+        """Population standard deviation of the observations in the window."""
+        n = max(self.n, 1)
+        mean = self._sum / n
+        return np.sqrt(np.maximum(self._sum_sq / n - mean * mean, 0.0))
+
+
+class StateSeries:
+    """
+    Preallocated columns for a sequence of state snapshots.
+
+    Only the selected fields are stored ('year' always is). Rows read back
+    through the sequence interface carry None for fields not recorded.
+    Columns grow by doubling if more rows are recorded than the initial
+    capacity.
+    """
+
+    def __init__(self,
+                 state_type: Type,
+                 capacity: int = 0,
+                 fields: Optional[Iterable[str]] = None):
+        """
+        Create an empty series.
+
+        Args:
+            state_type: State dataclass whose fields become columns
+            capacity: Rows to preallocate (e.g. params.duration)
+            fields: Field names to record (None records every field)
+
+        Raises:
+            ValueError: If a requested field is not a field of state_type
+        """
+        names = [f.name for f in dataclasses.fields(state_type)]
+        if fields is not None:
+            fields = set(fields)
+            unknown = fields.difference(names)
+            if unknown:
+                raise ValueError(f"Unknown {state_type.__name__} fields: "
+                                 f"{sorted(unknown)}")
+            names = [name for name in names if name in fields or name == 'year']
+
+        hints = get_type_hints(state_type)
+        self.state_type = state_type
+        self.fields = tuple(names)
+        self._columns = {
+            name: np.empty(capacity, dtype=_COLUMN_DTYPES.get(hints[name], object))
+            for name in self.fields
+        }
+        self._n = 0
+
+    @property
+    def capacity(self) -> int:
+        """Rows currently allocated."""
+        return len(self._columns['year'])
+
+    def _grow(self) -> None:
+        """Double the allocated rows."""
+        capacity = max(1, 2 * self.capacity)
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._n] = column[:self._n]
+            self._columns[name] = grown
+
+    def record(self, **values: Any) -> None:
+        """
+        Write one row from keyword values.
+
+        Values for fields that are not recorded are ignored, so callers can
+        always pass the full state.
+
+        Args:
+            **values: Value for each recorded field
+        """
+        if self._n == self.capacity:
+            self._grow()
+        for name, column in self._columns.items():
+            column[self._n] = values[name]
+        self._n += 1
+
+    def append(self, state: Any) -> None:
+        """
+        Write one row from a state object.
+
+        Args:
+            state: Instance of state_type
+        """
+        self.record(**{name: getattr(state, name) for name in self.fields})
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Recorded values of one field.
+
+        Args:
+            name: Field name
+
+        Returns:
+            View of the column up to the last recorded row
+
+        Raises:
+            KeyError: If the field is not recorded
+        """
+        if name not in self._columns:
+            raise KeyError(f"Field '{name}' is not recorded in this series")
+        return self._columns[name][:self._n]
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """All recorded columns, keyed by field name."""
+        return {name: self.column(name) for name in self.fields}
+
+    def _row(self, i: int) -> Any:
+        """Build the state object for row i."""
+        values = {f.name: None for f in dataclasses.fields(self.state_type)}
+        for name, column in self._columns.items():
+            value = column[i]
+            values[name] = value.item() if isinstance(value, np.generic) else value
+        return self.state_type(**values)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        if isinstance(key, slice):
+            return [self._row(i) for i in range(*key.indices(self._n))]
+        i = key + self._n if key < 0 else key
+        if not 0 <= i < self._n:
+            raise IndexError("StateSeries index out of range")
+        return self._row(i)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(self._n):
+            yield self._row(i)
+
+    def to_list(self) -> List[Any]:
+        """All rows as state objects."""
+        return list(self)
+
+    def summarize(self, burn_in: int) -> Dict[str, RunningStats]:
+        """
+        Statistics of the recorded summary fields after burn-in.
+
+        Args:
+            burn_in: First year included
+
+        Returns:
+            RunningStats per recorded SUMMARY_FIELDS entry (empty if no
+            year after burn-in has been recorded)
+        """
+        post = self.column('year') >= burn_in
+        if not post.any():
+            return {}
+        return {
+            name: RunningStats.from_values(self.column(name)[post])
+            for name in SUMMARY_FIELDS if name in self._columns
+        }
+
+
+class StreamingSummary:
+    """
+    Summary-only recorder with the same record/append interface.
+
+    Years before burn_in are skipped; later years update one RunningStats
+    per tracked field. Only the most recent values are kept; series[-1]
+    builds a state object from them on request (for progress output),
+    and earlier rows cannot be read back.
+    """
+
+    def __init__(self,
+                 state_type: Type,
+                 burn_in: int,
+                 fields: Optional[Iterable[str]] = None):
+        """
+        Create an empty summary.
+
+        Args:
+            state_type: State dataclass being recorded
+            burn_in: First year included in the statistics
+            fields: Fields to track (None tracks the SUMMARY_FIELDS that
+                state_type has)
+
+        Raises:
+            ValueError: If a requested field is not a field of state_type
+        """
+        names = [f.name for f in dataclasses.fields(state_type)]
+        if fields is None:
+            fields = [name for name in SUMMARY_FIELDS if name in names]
+        else:
+            fields = list(fields)
+            unknown = set(fields).difference(names)
+            if unknown:
+                raise ValueError(f"Unknown {state_type.__name__} fields: "
+                                 f"{sorted(unknown)}")
+
+        self.state_type = state_type
+        self.burn_in = burn_in
+        self.fields = tuple(fields)
+        self.stats = {name: RunningStats() for name in self.fields}
+        self._latest: Optional[Dict[str, Any]] = None
+        self._n = 0
+
+    def record(self, **values: Any) -> None:
+        """
+        Update the statistics with one year of values.
+
+        Args:
+            **values: Value for every state field
+        """
+        self._latest = values
+        self._n += 1
+        if values['year'] < self.burn_in:
+            return
+        for name, stats in self.stats.items():
+            stats.update(values[name])
+
+    def append(self, state: Any) -> None:
+        """
+        Update the statistics with one state object.
+
+        Args:
+            state: Instance of state_type
+        """
+        self.record(**dataclasses.asdict(state))
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, key: int) -> Any:
+        if key not in (-1, self._n - 1) or self._latest is None:
+            raise IndexError("StreamingSummary keeps only the latest state")
+        return self.state_type(**self._latest)
+
+    def summarize(self, burn_in: int) -> Dict[str, RunningStats]:
+        """
+        Statistics accumulated since burn-in.
+
+        Args:
+            burn_in: First year included; must be the burn-in given at
+                construction, since earlier years were never accumulated
+                and later ones cannot be taken out
+
+        Returns:
+            RunningStats per tracked field (empty if no year after burn-in
+            has been recorded)
+
+        Raises:
+            ValueError: If burn_in differs from the construction burn-in
+        """
+        if burn_in != self.burn_in:
+            raise ValueError(f"StreamingSummary accumulated from year {self.burn_in}; "
+                             f"cannot summarize from year {burn_in}")
+        if not self.stats or next(iter(self.stats.values())).count == 0:
+            return {}
+        return dict(self.stats)
+
+
+def format_progress(state: Any, items: Iterable[Tuple[str, str, str]]) -> str:
+    """
+    Progress line from the recorded fields of a state.
+
+    Args:
+        state: State object (fields not recorded are None)
+        items: (label, field name, format spec) per entry
+
+    Returns:
+        "label=value" entries joined by ", ", skipping fields not recorded
+    """
+    return ", ".join(f"{label}={getattr(state, name):{spec}}"
+                     for label, name, spec in items
+                     if getattr(state, name) is not None)
+
+
+def make_state_series(state_type: Type,
+                      params: Any) -> Union[StateSeries, StreamingSummary]:
+    """
+    Create the yearly recorder a simulation's parameters ask for.
+
+    Args:
+        state_type: State dataclass being recorded
+        params: SimulationParameters (duration, burn_in, record_fields,
+            summary_only)
+
+    Returns:
+        StreamingSummary if params.summary_only, else a StateSeries
+        preallocated for params.duration years
+    """
+    if params.summary_only:
+        return StreamingSummary(state_type, burn_in=params.burn_in,
+                                fields=params.record_fields)
+    return StateSeries(state_type, capacity=params.duration,
+                       fields=params.record_fields)
@@ -0,0 +1,346 @@
+"""
+Struct-of-arrays simulation engine for the Poverty Point aggregation model.
+
+Implements the same annual cycle as core_simulation.PovertyPointSimulation,
+but holds band state in contiguous NumPy arrays and runs each phase as a
+single vectorized pass over all bands. The engine shares the step()/run()
+interface and returns the same SimulationResults, so it can be swapped in
+for phase-space sweeps.
+
+Random draws are made in bulk per phase rather than band by band, so a run
+is not bit-identical to the agent engine for the same seed; the dynamics
+are the same in distribution. Initial conditions are identical, because
+bands are created with agents.create_bands and then packed into arrays.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import List, Optional
+
+from .parameters import SimulationParameters, W_aggregator, W_independent
+from .agents import (
+    Band, Strategy, MEMORY_WINDOW, aggregation_probability, memory_adjustment_array,
+    apply_shortfall_mortality, apply_reproduction
+)
+from .core_simulation import PovertyPointSimulation
+
+
+@dataclass
+class BandArrays:
+    """
+    Band population stored as parallel arrays (one entry per band).
+
+    Mirrors the state of agents.Band. Fitness memory is kept as a running
+    sum plus a ring of the last MEMORY_WINDOW values, which is all that
+    Band.decide_strategy needs from the full history.
+    """
+    band_id: np.ndarray            # int64
+    home_x: np.ndarray             # float64
+    home_y: np.ndarray             # float64
+    size: np.ndarray               # int64
+    resources: np.ndarray          # float64
+    prestige: np.ndarray           # float64
+    monument_contributions: np.ndarray  # float64
+    exotic_goods: np.ndarray       # int64
+    is_aggregator: np.ndarray      # bool, current strategy
+    attended: np.ndarray           # bool, attended aggregation last season
+
+    # Fitness memory
+    last_fitness: np.ndarray       # float64
+    fitness_sum: np.ndarray        # float64
+    fitness_recent: np.ndarray     # float64, (n, MEMORY_WINDOW) ring
+    n_fitness: int = 0             # Years of fitness recorded (same for all)
+
+    @property
+    def n_bands(self) -> int:
+        """Number of bands (per replicate, for stacked arrays)."""
+        return self.band_id.shape[-1]
+
+    @classmethod
+    def from_bands(cls, bands: List[Band]) -> "BandArrays":
+        """
+        Pack a list of Band agents into arrays.
+
+        Fitness memory is copied as well, so bands that have already
+        recorded fitness decide exactly as they would as agents. All bands
+        must have recorded the same number of years.
+
+        Args:
+            bands: Band objects (e.g. from agents.create_bands)
+
+        Returns:
+            BandArrays with the same state
+        """
+        n = len(bands)
+        n_fitness = bands[0].n_fitness_years if bands else 0
+
+        # Ring slot of each remembered value: the k-th most recent of the
+        # n_fitness values recorded so far sits at (n_fitness - k) % window
+        fitness_recent = np.zeros((n, MEMORY_WINDOW), dtype=float)
+        for i, band in enumerate(bands):
+            recent = list(band.recent_fitness)
+            slots = (n_fitness - len(recent) + np.arange(len(recent))) % MEMORY_WINDOW
+            fitness_recent[i, slots] = recent
+
+        return cls(
+            band_id=np.array([b.band_id for b in bands], dtype=np.int64),
+            home_x=np.array([b.home_location[0] for b in bands], dtype=float),
+            home_y=np.array([b.home_location[1] for b in bands], dtype=float),
+            size=np.array([b.size for b in bands], dtype=np.int64),
+            resources=np.array([b.resources for b in bands], dtype=float),
+            prestige=np.array([b.prestige for b in bands], dtype=float),
+            monument_contributions=np.array(
+                [b.monument_contributions for b in bands], dtype=float
+            ),
+            exotic_goods=np.array([b.exotic_goods for b in bands], dtype=np.int64),
+            is_aggregator=np.array(
+                [b.strategy == Strategy.AGGREGATOR for b in bands], dtype=bool
+            ),
+            attended=np.array([b.last_aggregated for b in bands], dtype=bool),
+            last_fitness=np.array(
+                [0.0 if b.last_fitness is None else b.last_fitness for b in bands],
+                dtype=float
+            ),
+            fitness_sum=np.array([b.fitness_sum for b in bands], dtype=float),
+            fitness_recent=fitness_recent,
+            n_fitness=n_fitness,
+        )
+
+    @classmethod
+    def stack(cls, replicates: List["BandArrays"]) -> "BandArrays":
+        """
+        Stack per-replicate band arrays along a new leading axis.
+
+        Args:
+            replicates: BandArrays with equal band counts
+
+        Returns:
+            BandArrays whose fields have shape (R, n_bands, ...)
+        """
+        fields = {
+            name: np.stack([getattr(r, name) for r in replicates])
+            for name in cls.__dataclass_fields__ if name != 'n_fitness'
+        }
+        return cls(n_fitness=replicates[0].n_fitness, **fields)
+
+    def record_fitness(self, fitness: np.ndarray) -> None:
+        """Append this year's fitness to every band's memory."""
+        self.last_fitness[...] = fitness
+        self.fitness_sum += fitness
+        self.fitness_recent[..., self.n_fitness % MEMORY_WINDOW] = fitness
+        self.n_fitness += 1
+
+
+class VectorizedSimulation(PovertyPointSimulation):
+    """
+    Vectorized variant of PovertyPointSimulation.
+
+    Band state lives in a BandArrays instance (self.band_state) and every
+    phase of the annual cycle is one array operation over all bands.
+    Shortfall generation, obligation forming, step() and run() are
+    inherited unchanged.
+    """
+
+    def __init__(self, params: Optional[SimulationParameters] = None):
+        """
+        Initialize simulation.
+
+        Args:
+            params: Simulation parameters (uses defaults if None)
+        """
+        super().__init__(params)
+
+        self.band_state = BandArrays.from_bands(self.bands)
+        self.bands = []  # Band state is held in self.band_state
+
+        self._site_x, self._site_y = self.aggregation_site.location
+
+    def _run_dispersal_season(self) -> None:
+        """Run dispersal season foraging for all bands at once."""
+        bs = self.band_state
+
+        base_harvest = 0.4 + 0.2 * self.rng.random(bs.n_bands)
+        if self.in_shortfall:
+            base_harvest *= (1 - self.shortfall_magnitude)
+
+        harvest = np.where(
+            bs.is_aggregator,
+            base_harvest * (1 - self.params.costs.C_opportunity),
+            base_harvest
+        )
+
+        consumption = bs.size * 0.02
+        bs.resources = np.clip(bs.resources + harvest - consumption, 0.0, 1.0)
+
+    def _run_strategy_decisions(self) -> None:
+        """
+        All bands decide their strategy for this year.
+
+        Same soft-max rule and memory effect as Band.decide_strategy.
+        """
+        bs = self.band_state
+
+        expected_n = max(5, self.aggregation_site.n_attending)
+        E_W_agg = W_aggregator(self.params.sigma, self.params.epsilon,
+                               expected_n, self.params)
+        E_W_ind = W_independent(self.params.sigma, self.params)
+
+        # Memory effect: reinforce last year's choice if recent fitness
+        # beats the long-term mean, otherwise push toward switching
+        fitness_diff = (E_W_agg - E_W_ind) + memory_adjustment_array(
+            bs.n_fitness, bs.fitness_recent.mean(axis=1), bs.fitness_sum, bs.attended
+        )
+
+        p_aggregate = aggregation_probability(fitness_diff)
+
+        bs.is_aggregator = self.rng.random(bs.n_bands) < p_aggregate
+
+    def _run_aggregation_season(self) -> None:
+        """
+        Run aggregation season for all bands at once.
+
+        Aggregators pay travel, invest in monuments, attempt exotic
+        acquisition and may form an obligation with another attendee.
+        Independents continue foraging.
+        """
+        bs = self.band_state
+        site = self.aggregation_site
+        site.reset_annual_state()
+
+        agg = np.flatnonzero(bs.is_aggregator)
+        ind = np.flatnonzero(~bs.is_aggregator)
+        n_agg = len(agg)
+
+        # Travel to aggregation site
+        distance = np.hypot(self._site_x - bs.home_x[agg],
+                            self._site_y - bs.home_y[agg])
+        travel_cost = distance * 0.0005
+        bs.resources[agg] -= np.minimum(travel_cost, bs.resources[agg] * 0.5)
+
+        # Register attendance
+        site.add_attending_bands(bs.band_id[agg], bs.size[agg], bs.exotic_goods[agg])
+        bs.attended = bs.is_aggregator.copy()
+
+        # Monument investment (requires resources >= 0.3)
+        resources = bs.resources[agg]
+        variation = 0.8 + 0.4 * self.rng.random(n_agg)
+        investment = np.where(
+            resources >= 0.3,
+            bs.size[agg] * self.params.costs.C_signal * resources * variation,
+            0.0
+        )
+        bs.monument_contributions[agg] += investment
+        bs.prestige[agg] += investment * 0.1
+
+        # Exotic acquisition
+        acquisition_cost = 0.1
+        prestige = bs.prestige[agg]
+        p_acquire = 0.3 * (1 + prestige / (1 + prestige))
+        acquired = ((bs.resources[agg] >= acquisition_cost + 0.2) &
+                    (self.rng.random(n_agg) < p_acquire))
+        winners = agg[acquired]
+        bs.exotic_goods[winners] += 1
+        bs.resources[winners] -= acquisition_cost
+        bs.prestige[winners] += 0.15
+
+        # Obligations with a uniformly chosen other attendee
+        self._form_obligations()
+
+        # Independents continue foraging
+        extra_harvest = 0.1 * (1 - self.shortfall_magnitude if self.in_shortfall else 1)
+        bs.resources[ind] = np.minimum(1.0, bs.resources[ind] + extra_harvest)
+
+        site.record_construction(float(investment.sum()))
+
+    def _apply_shortfall_mortality(self) -> None:
+        """
+        Apply shortfall mortality to all bands at once.
+
+        Aggregators with obligations call on one random partner for help.
+        """
+        if not self.in_shortfall:
+            return
+
+        bs = self.band_state
+        sigma = self.params.sigma
+        vulnerability = self.params.vulnerability
+
+        mortality_rate = np.where(
+            bs.is_aggregator,
+            vulnerability.alpha_agg * sigma * (1 - self.params.epsilon),
+            vulnerability.beta_ind * sigma
+        )
+        bs.size = apply_shortfall_mortality(bs.size, mortality_rate, self.rng)
+
+        self._call_obligations(need=0.2)
+
+    def _call_obligations(self, need: float) -> None:
+        """Aggregators with obligations each call on one random partner."""
+        bs = self.band_state
+
+        callers = np.flatnonzero(bs.is_aggregator)
+        callers = callers[self.obligations.out_degree(callers) > 0]
+        if len(callers) == 0:
+            return
+
+        bs.resources[callers] += self.obligations.call(
+            callers, need=need, u=self.rng.random(len(callers))
+        )
+
+    def _apply_reproduction(self) -> None:
+        """Apply reproduction, baseline mortality and size limits in bulk."""
+        bs = self.band_state
+        pop = self.params.population
+
+        W_agg = W_aggregator(self.params.sigma, self.params.epsilon,
+                             self.aggregation_site.n_attending, self.params)
+        W_ind = W_independent(self.params.sigma, self.params)
+        fitness = np.where(bs.attended, W_agg, W_ind)
+        bs.record_fitness(fitness)
+
+        bs.size = apply_reproduction(
+            bs.size, fitness, bs.resources,
+            birth_rate=pop.birth_rate, death_rate=pop.death_rate,
+            min_size=pop.min_band_size, max_size=pop.max_band_size,
+            rng=self.rng
+        )
+
+    def _record_state(self) -> None:
+        """Record current state from the band arrays."""
+        bs = self.band_state
+        site = self.aggregation_site
+
+        n_total = bs.n_bands
+        n_agg = int(bs.is_aggregator.sum())
+        n_ind = n_total - n_agg
+        dominance = (n_agg - n_ind) / n_total if n_total > 0 else 0.0
+
+        has_fitness = bs.n_fitness > 0
+        self.results.yearly_states.record(
+            year=self.year,
+            total_population=int(bs.size.sum()),
+            n_bands=n_total,
+            mean_band_size=float(bs.size.mean()),
+            n_aggregators=n_agg,
+            n_independents=n_ind,
+            strategy_dominance=dominance,
+            aggregation_size=site.n_attending,
+            aggregation_population=site.current_population,
+            monument_level=site.monument_level,
+            annual_construction=(site.monument_history[-1] -
+                                 site.monument_history[-2]
+                                 if len(site.monument_history) > 1
+                                 else site.monument_level),
+            total_exotics=int(bs.exotic_goods.sum()),
+            sigma_effective=self.params.sigma * (1 - self.params.epsilon),
+            in_shortfall=self.in_shortfall,
+            shortfall_magnitude=self.shortfall_magnitude,
+            mean_fitness_aggregators=(
+                float(bs.last_fitness[bs.is_aggregator].mean())
+                if has_fitness and n_agg > 0 else 0.0
+            ),
+            mean_fitness_independents=(
+                float(bs.last_fitness[~bs.is_aggregator].mean())
+                if has_fitness and n_ind > 0 else 0.0
+            )
+        )